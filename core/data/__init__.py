@@ -1 +1,2 @@
-from internal.data_obj import DataObj
+from .internal.data_obj import DataObj
+from .internal.codegen import install, make_stub, copy_item
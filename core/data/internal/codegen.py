@@ -0,0 +1,231 @@
+"""
+DataObj의 copy, to_dict, from_dict를 클래스마다 코드로 생성한다.
+
+필드 목록과 타입은 클래스마다 고정이므로,
+__dataclass_fields__를 매번 순회하는 대신 필드를 풀어 쓴 함수를 한 번만 컴파일한다.
+
+Point(x: int, y: int)
+->
+def copy(self):
+    return cls(x=self.x, y=self.y)
+"""
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from types import NoneType, UnionType
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+
+# 복사할 필요 없는 타입
+IMMUTABLE_TYPES = (int, float, complex, bool, str, bytes, NoneType)
+
+# 생성된 함수 표시
+GENERATED = "__generated__"
+# 아직 컴파일 전인 함수 표시
+STUB = "__stub__"
+
+METHODS = ("copy", "to_dict", "from_dict")
+
+
+def copy_item(item):
+    if hasattr(item, "copy"):
+        return item.copy()
+    return item
+
+
+def make_to_dict_item(base: type) -> Callable[[Any], Any]:
+    def to_dict_item(item):
+        if isinstance(item, base):
+            return item.to_dict()
+        return item
+    return to_dict_item
+
+
+def type_hints(cls: type) -> dict[str, Any]:
+    try:
+        return get_type_hints(cls)
+    except Exception:
+        # 해석할 수 없는 annotation은 일반 경로로 처리
+        return {}
+
+
+def union_args(hint) -> tuple:
+    if get_origin(hint) in (Union, UnionType):
+        return get_args(hint)
+    return (hint,)
+
+
+def is_immutable(hint) -> bool:
+    for arg in union_args(hint):
+        if arg is None:
+            continue
+        if not isinstance(arg, type):
+            return False
+        if not (issubclass(arg, IMMUTABLE_TYPES) or issubclass(arg, Enum)):
+            return False
+    return True
+
+
+def nested_type(hint, base: type) -> type | None:
+    """
+    hint가 base 서브클래스 하나(또는 그것과 None의 union)면 그 클래스
+    """
+    args = [arg for arg in union_args(hint) if arg not in (None, NoneType)]
+    if len(args) != 1:
+        return None
+
+    arg = args[0]
+    if isinstance(arg, type) and issubclass(arg, base):
+        return arg
+    return None
+
+
+def compile_func(cls: type, name: str, lines: list[str], namespace: dict) -> Callable:
+    exec("\n".join(lines), namespace)
+    func = namespace[name]
+    func.__qualname__ = f"{cls.__qualname__}.{name}"
+    setattr(func, GENERATED, True)
+    return func
+
+
+def make_copy(cls: type) -> Callable:
+    hints = type_hints(cls)
+
+    args = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        if is_immutable(hints.get(f.name, f.type)):
+            args.append(f"{f.name}=self.{f.name}")
+        else:
+            args.append(f"{f.name}=_copy(self.{f.name})")
+
+    return compile_func(cls, "copy", [
+        "def copy(self):",
+        f"    return cls({', '.join(args)})"
+    ], {"cls": cls, "_copy": copy_item})
+
+
+def make_to_dict(cls: type, base: type) -> Callable:
+    hints = type_hints(cls)
+
+    items = []
+    for f in fields(cls):
+        if is_immutable(hints.get(f.name, f.type)):
+            items.append(f"{f.name!r}: self.{f.name}")
+        else:
+            items.append(f"{f.name!r}: _to_dict(self.{f.name})")
+
+    return compile_func(cls, "to_dict", [
+        "def to_dict(self):",
+        f"    return {{{', '.join(items)}}}"
+    ], {"_to_dict": make_to_dict_item(base)})
+
+
+def make_from_dict(cls: type, base: type) -> Callable:
+    """
+    to_dict의 역. 중첩 DataObj 필드는 값이 dict일 때만 해당 클래스의 from_dict로 만든다.
+    data에 없는 필드는 기본값을 쓴다.
+    """
+    hints = type_hints(cls)
+    namespace: dict[str, Any] = {"cls": cls}
+
+    lines = [
+        "def from_dict(klass, data):",
+        "    kwargs = {}"
+    ]
+    for idx, f in enumerate(fields(cls)):
+        if not f.init:
+            continue
+
+        lines.append(f"    if {f.name!r} in data:")
+        nested = nested_type(hints.get(f.name, f.type), base)
+        if nested is None:
+            lines.append(f"        kwargs[{f.name!r}] = data[{f.name!r}]")
+            continue
+
+        type_name = f"_type{idx}"
+        namespace[type_name] = nested
+        lines += [
+            f"        value = data[{f.name!r}]",
+            f"        kwargs[{f.name!r}] = {type_name}.from_dict(value) if isinstance(value, dict) else value"
+        ]
+    lines.append("    return cls(**kwargs)")
+
+    return compile_func(cls, "from_dict", lines, namespace)
+
+
+def replaceable(func: Callable) -> Callable:
+    """
+    서브클래스에서 생성된 함수로 교체해도 되는 메소드 표시
+    """
+    setattr(func, GENERATED, True)
+    return func
+
+
+def is_replaceable(cls: type, name: str) -> bool:
+    """
+    cls가 직접 정의하지 않았고, 물려받은 것도 생성된(또는 replaceable) 함수일 때만 교체한다.
+    직접 구현한 copy(Tile.copy 등)와 그걸 물려받은 클래스는 그대로 둔다.
+    """
+    if name in cls.__dict__:
+        return False
+
+    for klass in cls.__mro__[1:]:
+        if name in klass.__dict__:
+            attr = klass.__dict__[name]
+            func = getattr(attr, "__func__", attr)
+            return getattr(func, GENERATED, False)
+    return False
+
+
+def install(cls: type, base: type):
+    """
+    cls에 copy, to_dict, from_dict를 설치한다.
+    @dataclass가 __init_subclass__ 이후에 적용될 수 있으므로 처음 호출될 때 컴파일해 교체한다.
+    """
+    cls.__codegen_base__ = base
+
+    for name in METHODS:
+        if is_replaceable(cls, name):
+            set_method(cls, name, make_stub(name))
+
+
+def make_stub(name: str) -> Callable:
+    # dataclass(slots=True)는 클래스를 새로 만들므로 호출 시점의 클래스로 컴파일
+    if name == "from_dict":
+        def stub(klass, data: dict):
+            return compile_for(klass, name)(klass, data)
+    else:
+        def stub(self):
+            return compile_for(self.__class__, name)(self)
+
+    setattr(stub, STUB, True)
+    return replaceable(stub)
+
+
+def set_method(cls: type, name: str, func: Callable):
+    if name == "from_dict":
+        func = classmethod(func)
+    setattr(cls, name, func)
+
+
+def compile_for(cls: type, name: str) -> Callable:
+    # 컴파일 전에 꺼내 둔 bound method로 다시 불린 경우
+    attr = cls.__dict__.get(name)
+    func = getattr(attr, "__func__", attr)
+    if getattr(func, GENERATED, False) and not getattr(func, STUB, False):
+        return func
+
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+
+    base = cls.__codegen_base__
+    match name:
+        case "copy":
+            func = make_copy(cls)
+        case "to_dict":
+            func = make_to_dict(cls, base)
+        case "from_dict":
+            func = make_from_dict(cls, base)
+
+    set_method(cls, name, func)
+    return func
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, Field
 from typing import Any, Dict, ClassVar
 from typing_extensions import dataclass_transform
+from .codegen import install, make_stub, copy_item
 
 
 @dataclass_transform()
@@ -24,6 +25,9 @@ class DataObj:
         if cls is DataObj:
             return
 
+        # 부모 클래스의 필드로 생성된 함수를 물려받지 않도록 클래스마다 설치
+        install(cls, DataObj)
+
         # 원하면 쉽게 opt-out
         if not cls.__auto_dataclass__:
             return
@@ -45,39 +49,14 @@ class DataObj:
     def get_attr(self, key):
         return getattr(self, key)  # dataclass(slots=True)시 __dict__ 없음
 
-    def copy(self):
-        return self.__class__(
-            **{
-                key: copy(self.get_attr(key))
-                for key in self.my_fields()
-            }
-        )
-
-    def to_dict(self):
-        def __item_parsing(item):
-            if isinstance(item, DataObj):
-                return item.to_dict()
-            return item
-
-        return {
-            key: __item_parsing(self.get_attr(key))
-            for key in self.my_fields()
-        }
-
-    @classmethod
-    def from_dict(cls, dict: dict):
-        assert "Not Impl"
-        # TODO 구현
-        # 주의 점 :
-        # Type Union ex) int|None
-        # 중첩 DataObj
-        return cls()
-
-
-def copy(item):
-    if hasattr(item, "copy"):
-        return item.copy()
-    return item
+    # 처음 호출될 때 필드를 풀어 쓴 함수를 클래스별로 컴파일해 교체한다.
+    # 중첩 DataObj 필드는 값이 dict일 때만 from_dict로 만든다. (codegen.make_from_dict)
+    copy = make_stub("copy")
+    to_dict = make_stub("to_dict")
+    from_dict = classmethod(make_stub("from_dict"))
+
+
+copy = copy_item
 
 
 if __name__ == "__main__":
@@ -1 +1,2 @@
-from .internal.eventbroker import EventBroker
+from .internal.eventbroker import EventBroker, PublishResult, ReceiverStat
+from .internal.exceptions import NoMatchingReceiverException
@@ -1,24 +1,122 @@
 from typing import Callable, Type
-from core.event.frame import Event, EventSet
+from dataclasses import dataclass, field
+from time import perf_counter
+import asyncio
+
+from core.event.frame import Event
+from .exceptions import NoMatchingReceiverException
+
+
+@dataclass
+class ReceiverStat:
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+@dataclass
+class Subscriber:
+    func: Callable
+    # 클수록 먼저 실행
+    priority: int = 0
+    stat: ReceiverStat = field(default_factory=ReceiverStat)
+
+
+@dataclass
+class PublishResult:
+    # 실행 중 예외가 난 receiver와 그 예외
+    failed: list[tuple[Callable, Exception]] = field(default_factory=list)
 
 
 class EventBroker:
-    receiver_dict: dict[str, Callable] = {}
+    """
+    event 클래스마다 여러 receiver를 둔다.
+    - 같은 priority의 receiver들은 동시에 실행하고, priority가 높은 묶음부터 차례로 실행한다.
+    - 한 receiver의 예외는 다른 receiver에 영향을 주지 않고 PublishResult.failed로 모인다.
+    - receiver마다 호출 횟수, 실패 횟수, 실행 시간을 ReceiverStat에 남긴다.
+    """
+    receiver_dict: dict[Type[Event], list[Subscriber]] = {}
+    # event 클래스 -> priority 순 receiver 묶음. receiver가 추가/제거될 때만 다시 만든다.
+    dispatch_table: dict[Type[Event], tuple[tuple[Subscriber, ...], ...]] = {}
 
     @classmethod
-    def add_receiver(cls, event: Type[Event]):
+    def add_receiver(cls, event: Type[Event], priority: int = 0):
         def wrapper(func: Callable):
-            cls.receiver_dict[event.name] = func
+            cls.receiver_dict.setdefault(event, []).append(Subscriber(func, priority))
+            cls._compile(event)
             return func
         return wrapper
 
     @classmethod
-    async def publish(cls, event: Event):
-        event_type = event.__class__
-        receiver = cls.receiver_dict[event_type.name]
-        await receiver(event)
+    def remove_receiver(cls, event: Type[Event], func: Callable) -> bool:
+        subscribers = cls.receiver_dict.get(event, [])
+        for subscriber in subscribers:
+            if subscriber.func is func:
+                subscribers.remove(subscriber)
+                break
+        else:
+            return False
+
+        if len(subscribers) == 0:
+            del cls.receiver_dict[event]
+        cls._compile(event)
+        return True
+
+    @classmethod
+    def get_stat(cls, event: Type[Event], func: Callable) -> ReceiverStat | None:
+        for subscriber in cls.receiver_dict.get(event, []):
+            if subscriber.func is func:
+                return subscriber.stat
+        return None
+
+    @classmethod
+    def _compile(cls, event: Type[Event]):
+        subscribers = cls.receiver_dict.get(event)
+        if subscribers is None:
+            cls.dispatch_table.pop(event, None)
+            return
+
+        groups: dict[int, list[Subscriber]] = {}
+        for subscriber in subscribers:
+            groups.setdefault(subscriber.priority, []).append(subscriber)
+
+        cls.dispatch_table[event] = tuple(
+            tuple(groups[priority]) for priority in sorted(groups, reverse=True)
+        )
+
+    @classmethod
+    async def publish(cls, event: Event) -> PublishResult:
+        groups = cls.dispatch_table.get(event.__class__)
+        if groups is None:
+            raise NoMatchingReceiverException(event.__class__.name)
+
+        result = PublishResult()
+        for group in groups:
+            if len(group) == 1:
+                await cls._run(group[0], event, result)
+            else:
+                await asyncio.gather(*[cls._run(subscriber, event, result) for subscriber in group])
+
+        return result
+
+    @staticmethod
+    async def _run(subscriber: Subscriber, event: Event, result: PublishResult):
+        stat = subscriber.stat
+        start = perf_counter()
+        try:
+            await subscriber.func(event)
+        except Exception as e:
+            stat.errors += 1
+            result.failed.append((subscriber.func, e))
+        finally:
+            elapsed = perf_counter() - start
+            stat.calls += 1
+            stat.total_seconds += elapsed
+            if elapsed > stat.max_seconds:
+                stat.max_seconds = elapsed
 
     @classmethod
-    async def set_external(cls, event_set):
+    def set_external(cls, event_set):
         # TODO: Typing 및 구현
         return event_set
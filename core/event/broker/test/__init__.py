@@ -0,0 +1,5 @@
+from .test_eventbroker import EventBroker_TestCase
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
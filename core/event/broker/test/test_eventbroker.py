@@ -0,0 +1,109 @@
+"""
+EventBroker 모듈 테스트
+
+테스트 범위:
+- 여러 receiver 등록과 제거, dispatch table
+- 같은 priority는 동시에, 높은 priority부터 실행
+- receiver별 예외 격리
+- receiver별 실행 통계
+"""
+
+from core.event.frame import Event, EventSet
+from core.event.broker import EventBroker, NoMatchingReceiverException
+import asyncio
+import unittest
+
+
+class ExampleEventSet(EventSet):
+    EVENT_1 = Event[str]
+    EVENT_2 = Event[str]
+
+
+class EventBroker_TestCase(unittest.IsolatedAsyncioTestCase):
+    """EventBroker 모듈 테스트"""
+
+    def setUp(self):
+        self.calls: list[str] = []
+
+    def tearDown(self):
+        for event in (ExampleEventSet.EVENT_1, ExampleEventSet.EVENT_2):
+            EventBroker.receiver_dict.pop(event, None)
+            EventBroker.dispatch_table.pop(event, None)
+
+    def make_receiver(self, name: str, wait: float = 0):
+        async def receiver(event: Event):
+            self.calls.append(f"{name}:start")
+            await asyncio.sleep(wait)
+            self.calls.append(f"{name}:end")
+        return receiver
+
+    async def test_multiple_receiver(self):
+        """한 event에 등록된 receiver 모두 실행"""
+        a = EventBroker.add_receiver(ExampleEventSet.EVENT_1)(self.make_receiver("a"))
+        b = EventBroker.add_receiver(ExampleEventSet.EVENT_1)(self.make_receiver("b"))
+
+        self.assertEqual(len(EventBroker.dispatch_table[ExampleEventSet.EVENT_1]), 1)
+
+        await EventBroker.publish(ExampleEventSet.EVENT_1("hi"))
+
+        self.assertCountEqual(self.calls, ["a:start", "a:end", "b:start", "b:end"])
+        self.assertEqual(EventBroker.get_stat(ExampleEventSet.EVENT_1, a).calls, 1)
+        self.assertEqual(EventBroker.get_stat(ExampleEventSet.EVENT_1, b).calls, 1)
+
+    async def test_concurrent(self):
+        """같은 priority는 동시에 실행"""
+        EventBroker.add_receiver(ExampleEventSet.EVENT_1)(self.make_receiver("a", 0.01))
+        EventBroker.add_receiver(ExampleEventSet.EVENT_1)(self.make_receiver("b", 0.01))
+
+        await EventBroker.publish(ExampleEventSet.EVENT_1("hi"))
+
+        self.assertEqual(self.calls[:2], ["a:start", "b:start"])
+
+    async def test_priority(self):
+        """높은 priority 묶음이 끝난 뒤 다음 묶음 실행"""
+        EventBroker.add_receiver(ExampleEventSet.EVENT_1)(self.make_receiver("low", 0))
+        EventBroker.add_receiver(ExampleEventSet.EVENT_1, priority=1)(self.make_receiver("high", 0.01))
+
+        await EventBroker.publish(ExampleEventSet.EVENT_1("hi"))
+
+        self.assertEqual(self.calls, ["high:start", "high:end", "low:start", "low:end"])
+
+    async def test_error_isolation(self):
+        """한 receiver의 예외가 다른 receiver를 막지 않음"""
+        error = ValueError("boom")
+
+        async def broken(event: Event):
+            raise error
+
+        EventBroker.add_receiver(ExampleEventSet.EVENT_1)(broken)
+        EventBroker.add_receiver(ExampleEventSet.EVENT_1)(self.make_receiver("a"))
+
+        result = await EventBroker.publish(ExampleEventSet.EVENT_1("hi"))
+
+        self.assertEqual(result.failed, [(broken, error)])
+        self.assertEqual(self.calls, ["a:start", "a:end"])
+        self.assertEqual(EventBroker.get_stat(ExampleEventSet.EVENT_1, broken).errors, 1)
+
+    async def test_dispatch_by_class(self):
+        """event 클래스별로 dispatch"""
+        EventBroker.add_receiver(ExampleEventSet.EVENT_1)(self.make_receiver("a"))
+        EventBroker.add_receiver(ExampleEventSet.EVENT_2)(self.make_receiver("b"))
+
+        await EventBroker.publish(ExampleEventSet.EVENT_2("hi"))
+
+        self.assertEqual(self.calls, ["b:start", "b:end"])
+
+    async def test_remove_receiver(self):
+        """제거한 receiver는 실행되지 않고, 남은 receiver가 없으면 table에서 빠짐"""
+        a = EventBroker.add_receiver(ExampleEventSet.EVENT_1)(self.make_receiver("a"))
+
+        self.assertTrue(EventBroker.remove_receiver(ExampleEventSet.EVENT_1, a))
+        self.assertFalse(EventBroker.remove_receiver(ExampleEventSet.EVENT_1, a))
+        self.assertNotIn(ExampleEventSet.EVENT_1, EventBroker.dispatch_table)
+
+        with self.assertRaises(NoMatchingReceiverException):
+            await EventBroker.publish(ExampleEventSet.EVENT_1("hi"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,2 +1,2 @@
-from .internal.base_data import DataObj, copy
+from .internal.base_data import DataObj, copy, attrs
 from .internal.domain_obj import DomainObj
\ No newline at end of file
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, Field
 from typing import Union
+from functools import cache
+from core.data import install, make_stub, copy_item
 
 
 # TODO: validate_check(DataObj -> dataclasss)
@@ -11,27 +13,40 @@ class DataObj:
     # hinting을 위해 명시
     __dataclass_fields__: dict[str, Field]
 
-    def copy(self):
-        return self.__class__(
-            **{
-                key: copy(self.__dict__[key])
-                for key in self.__dataclass_fields__
-            }
-        )
-
-    def to_dict(self):
-        def __item_parsing(item):
-            if issubclass(type(item), DataObj):
-                return item.to_dict()
-            return item
-
-        return {
-            key: __item_parsing(self.__dict__[key])
-            for key in self.__dataclass_fields__
-        }
-
-
-def copy(item):
-    if hasattr(item, "copy"):
-        return item.copy()
-    return item
+    # 서브클래스가 @dataclass(slots=True)로 __dict__ 없이 만들어질 수 있도록
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 부모 클래스의 필드로 생성된 함수를 물려받지 않도록 클래스마다 설치
+        install(cls, DataObj)
+
+    # 처음 호출될 때 필드를 풀어 쓴 함수를 클래스별로 컴파일해 교체한다.
+    copy = make_stub("copy")
+    to_dict = make_stub("to_dict")
+    from_dict = classmethod(make_stub("from_dict"))
+
+
+copy = copy_item
+
+
+def attrs(item) -> dict:
+    """
+    인스턴스 속성들. slots 클래스는 __dict__가 없으므로 __slots__도 본다.
+    """
+    result = dict(getattr(item, "__dict__", {}))
+    for key in slot_names(item.__class__):
+        if hasattr(item, key):
+            result[key] = getattr(item, key)
+    return result
+
+
+@cache
+def slot_names(cls: type) -> tuple[str, ...]:
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names += [name for name in slots if name not in ("__dict__", "__weakref__")]
+    return tuple(names)
@@ -24,6 +24,8 @@ class SubMap(Generic[Unpack[Ts]]):
 
 @dataclass
 class DomainObj(DataObj, Generic[Unpack[Ts]]):
+    __slots__ = ("sub",)
+
     def __post_init__(self):
         self.sub = SubMap[Unpack[Ts]]()
         super().__init__()
@@ -1,4 +1,4 @@
-from data.base import DataObj, copy
+from data.base import DataObj, copy, attrs
 from dataclasses import dataclass
 from tests.utils import cases
 from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
@@ -11,6 +11,30 @@ class ExampleObj(DataObj):
 class Example2Obj(DataObj):
     field:ExampleObj
 
+@dataclass
+class Example3Obj(Example2Obj):
+    items: list[int]
+    optional: ExampleObj | None = None
+
+@dataclass
+class CustomCopyObj(DataObj):
+    field: int
+
+    def copy(self):
+        return CustomCopyObj(field=0)
+
+@dataclass
+class CustomCopyChildObj(CustomCopyObj):
+    pass
+
+@dataclass(slots=True)
+class SlotsObj(DataObj):
+    field: int
+
+@dataclass
+class BoundCopyObj(DataObj):
+    field: int
+
 # 이에 대한 처리를 해주면 좋음(자세한건 DataObj 주석 참고)
 class WrongObj(DataObj):
     pass
@@ -68,4 +92,65 @@ class DataObj_TestCase(TestCase):
         self.assertDictEqual(
             obj.to_dict(),
             dict
-        )
\ No newline at end of file
+        )
+
+    def test_copy_recursive(self):
+        original = Example3Obj(field=ExampleObj(field=1), items=[1, 2])
+        clone = original.copy()
+
+        self.assertEqual(original, clone)
+        self.assertIsNot(original.field, clone.field)
+        self.assertIsNot(original.items, clone.items)
+
+    def test_subclass_fields(self):
+        # 부모 클래스용으로 생성된 함수를 쓰지 않아야 함
+        Example2Obj(field=ExampleObj(field=1)).copy()
+
+        obj = Example3Obj(field=ExampleObj(field=1), items=[1], optional=ExampleObj(field=2))
+
+        self.assertIsInstance(obj.copy(), Example3Obj)
+        self.assertDictEqual(obj.to_dict(), {
+            "field": {"field": 1},
+            "items": [1],
+            "optional": {"field": 2}
+        })
+
+    def test_custom_copy(self):
+        self.assertEqual(CustomCopyObj(field=1).copy(), CustomCopyObj(field=0))
+        self.assertEqual(CustomCopyChildObj(field=1).copy(), CustomCopyObj(field=0))
+
+    def test_from_dict(self):
+        dict = {
+            "field": {"field": 1},
+            "items": [1, 2],
+            "optional": None
+        }
+
+        obj = Example3Obj.from_dict(dict)
+
+        self.assertEqual(obj, Example3Obj(field=ExampleObj(field=1), items=[1, 2]))
+        self.assertEqual(Example3Obj.from_dict(obj.to_dict()), obj)
+
+    def test_from_dict_default(self):
+        obj = Example3Obj.from_dict({"field": {"field": 1}, "items": []})
+
+        self.assertIsNone(obj.optional)
+
+    def test_not_dataclass(self):
+        self.assertRaises(TypeError, WrongObj().copy)
+
+    def test_bound_before_compile(self):
+        obj = BoundCopyObj(field=1)
+        # 컴파일 전에 꺼낸 bound method
+        bound = obj.copy
+
+        self.assertEqual(bound(), obj)
+        self.assertEqual(bound(), obj)
+        self.assertFalse(getattr(BoundCopyObj.copy, "__stub__", False))
+
+    def test_slots(self):
+        obj = SlotsObj(field=1)
+
+        self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertEqual(obj.copy(), obj)
+        self.assertDictEqual(attrs(obj), {"field": 1})
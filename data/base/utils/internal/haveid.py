@@ -7,6 +7,8 @@ ID_TYPE = TypeVar("ID_TYPE")
 
 
 class HaveId(Generic[ID_TYPE], ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> ID_TYPE:
@@ -1,7 +1,11 @@
-from .internal.point import Point, PointRange, is_overlap
+from .internal.point import Point, PointRange, is_overlap, merge_ranges, subtract_range
+from .internal.key import encode_key, decode_key
 from .internal.tile import Tile
 from .internal.tiles import Tiles
 from .internal.exceptions import (
     InvalidDataLengthException,
-    InvalidTileException
+    InvalidTileException,
+    RleDecodeException,
+    KeyRangeException
 )
+from .internal.rle import rle_encode, rle_decode, RleDecoder
@@ -13,3 +13,20 @@ class InvalidDataLengthException(Exception):
 
     def __str__(self):
         return f"invalid data length. expected: {self.expected}, actual: {self.actual}"
+
+
+class RleDecodeException(Exception):
+    def __init__(self, msg: str):
+        self.msg = msg
+
+    def __str__(self):
+        return f"invalid rle data: {self.msg}"
+
+
+class KeyRangeException(Exception):
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+    def __str__(self):
+        return f"coordinate out of key range [-2^30, 2^30): ({self.x}, {self.y})"
@@ -0,0 +1,60 @@
+"""
+좌표 (x, y)를 하나의 정수 key로 묶는다.
+각 좌표에 KEY_BIAS를 더해 음수를 없앤 뒤 두 좌표의 비트를 번갈아 끼워 넣는다(Morton order).
+x가 짝수 비트, y가 홀수 비트를 차지하며, 가까운 좌표는 가까운 key를 갖는다.
+
+좌표는 [-2^30, 2^30) 범위여야 하고, key는 [0, 2^62) 범위라 SQLite INTEGER에 그대로 들어간다.
+
+(1, 2) -> bias 후 x = ...001, y = ...010 -> ...1001
+"""
+from .exceptions import KeyRangeException
+
+KEY_BITS = 31
+KEY_BIAS = 1 << (KEY_BITS - 1)
+
+
+def _spread(v: int) -> int:
+    # abcd -> 0a0b0c0d
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+    v = (v | (v << 8)) & 0x00FF00FF00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v << 2)) & 0x3333333333333333
+    v = (v | (v << 1)) & 0x5555555555555555
+    return v
+
+
+def _compact(v: int) -> int:
+    # 0a0b0c0d -> abcd
+    v &= 0x5555555555555555
+    v = (v | (v >> 1)) & 0x3333333333333333
+    v = (v | (v >> 2)) & 0x0F0F0F0F0F0F0F0F
+    v = (v | (v >> 4)) & 0x00FF00FF00FF00FF
+    v = (v | (v >> 8)) & 0x0000FFFF0000FFFF
+    v = (v | (v >> 16)) & 0x00000000FFFFFFFF
+    return v
+
+
+# 11비트 단위 spread 결과. x용, y용(한 칸 왼쪽)
+CHUNK_BITS = 11
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+SPREAD_X = [_spread(v) for v in range(1 << CHUNK_BITS)]
+SPREAD_Y = [v << 1 for v in SPREAD_X]
+
+
+def encode_key(x: int, y: int) -> int:
+    # _spread를 매번 계산하는 것보다 table 조회가 빠르다
+    x += KEY_BIAS
+    y += KEY_BIAS
+    # 음수이거나 KEY_BITS를 넘으면 0이 아님
+    if (x | y) >> KEY_BITS:
+        raise KeyRangeException(x - KEY_BIAS, y - KEY_BIAS)
+
+    return (
+        SPREAD_X[x & CHUNK_MASK] | SPREAD_Y[y & CHUNK_MASK]
+        | (SPREAD_X[(x >> 11) & CHUNK_MASK] | SPREAD_Y[(y >> 11) & CHUNK_MASK]) << 22
+        | (SPREAD_X[x >> 22] | SPREAD_Y[y >> 22]) << 44
+    )
+
+
+def decode_key(key: int) -> tuple[int, int]:
+    return _compact(key) - KEY_BIAS, _compact(key >> 1) - KEY_BIAS
@@ -1,15 +1,17 @@
 from __future__ import annotations
 from data.base import DataObj
 from dataclasses import dataclass
+from .key import encode_key, decode_key
 
 
-@dataclass
+@dataclass(slots=True)
 class Point(DataObj):
     x: int
     y: int
 
     def __hash__(self) -> int:
-        return (self.x, self.y).__hash__()
+        # tuple을 만들지 않는 hash
+        return self.x * 1_000_003 ^ self.y
 
     def marshal_bytes(self) -> bytes:
         x_b = self.x.to_bytes(length=8, signed=True)
@@ -22,8 +24,15 @@ class Point(DataObj):
         y = int.from_bytes(bytes=b[8:], signed=True)
         return Point(x, y)
 
+    def to_key(self) -> int:
+        return encode_key(self.x, self.y)
 
-@dataclass
+    @staticmethod
+    def from_key(key: int):
+        return Point(*decode_key(key))
+
+
+@dataclass(slots=True)
 class PointRange(DataObj):
 
     top_left: Point
@@ -71,3 +80,84 @@ def is_overlap(first: PointRange, second: PointRange) -> bool:
     res |= second.is_in(first.bottom_right)
 
     return res
+
+
+def merge_ranges(ranges: list[PointRange], max_waste: float = 0.0) -> list[PointRange]:
+    """
+    겹치거나 맞닿은 영역들을 합쳐 더 적은 수의 영역으로 만든다.
+    두 영역을 감싸는 영역의 넓이가 실제로 덮는 넓이의 (1 + max_waste)배 이하일 때만 합친다.
+    max_waste가 0이면 새로 덮이는 타일이 없을 때만 합친다.
+    """
+    def area(r: PointRange) -> int:
+        return r.width * r.height
+
+    def intersection_area(a: PointRange, b: PointRange) -> int:
+        width = min(a.bottom_right.x, b.bottom_right.x) - max(a.top_left.x, b.top_left.x) + 1
+        height = min(a.top_left.y, b.top_left.y) - max(a.bottom_right.y, b.bottom_right.y) + 1
+        if width <= 0 or height <= 0:
+            return 0
+        return width * height
+
+    def union(a: PointRange, b: PointRange) -> PointRange:
+        return PointRange(
+            Point(min(a.top_left.x, b.top_left.x), max(a.top_left.y, b.top_left.y)),
+            Point(max(a.bottom_right.x, b.bottom_right.x), min(a.bottom_right.y, b.bottom_right.y))
+        )
+
+    result: list[PointRange] = []
+    for range in ranges:
+        # 합쳐진 영역이 다시 다른 영역과 합쳐질 수 있으므로 더 이상 합쳐지지 않을 때까지 반복
+        merged = True
+        while merged:
+            merged = False
+            for idx, other in enumerate(result):
+                u = union(range, other)
+                covered = area(range) + area(other) - intersection_area(range, other)
+                if area(u) <= covered * (1 + max_waste):
+                    range = u
+                    del result[idx]
+                    merged = True
+                    break
+
+        result.append(range)
+
+    return result
+
+
+def subtract_range(range: PointRange, other: PointRange) -> list[PointRange]:
+    """
+    range에서 other와 겹치는 부분을 뺀 나머지를 최대 4개의 겹치지 않는 영역으로 반환한다.
+    위, 아래 줄은 range의 전체 너비, 왼쪽, 오른쪽 줄은 겹치는 행들만 포함한다.
+    """
+    left = max(range.top_left.x, other.top_left.x)
+    right = min(range.bottom_right.x, other.bottom_right.x)
+    top = min(range.top_left.y, other.top_left.y)
+    bottom = max(range.bottom_right.y, other.bottom_right.y)
+
+    if left > right or bottom > top:
+        # 겹치지 않음
+        return [range]
+
+    result: list[PointRange] = []
+    if range.top_left.y > top:
+        result.append(PointRange(
+            range.top_left,
+            Point(range.bottom_right.x, top + 1)
+        ))
+    if range.bottom_right.y < bottom:
+        result.append(PointRange(
+            Point(range.top_left.x, bottom - 1),
+            range.bottom_right
+        ))
+    if range.top_left.x < left:
+        result.append(PointRange(
+            Point(range.top_left.x, top),
+            Point(left - 1, bottom)
+        ))
+    if range.bottom_right.x > right:
+        result.append(PointRange(
+            Point(right + 1, top),
+            Point(range.bottom_right.x, bottom)
+        ))
+
+    return result
@@ -0,0 +1,68 @@
+"""
+타일 bytes run-length encoding.
+[varint(반복 횟수) + byte(값)]의 반복이며, 앞에서부터 끊어 읽을 수 있다.
+
+00 00 00 00 81 81 -> 04 00 02 81
+"""
+from .exceptions import RleDecodeException
+import re
+
+RUN_PATTERN = re.compile(rb"(.)\1*", re.DOTALL)
+
+
+def rle_encode(data: bytes | bytearray) -> bytes:
+    buf = bytearray()
+    for match in RUN_PATTERN.finditer(data):
+        start, end = match.span()
+        count = end - start
+
+        while count > 0x7f:
+            buf.append((count & 0x7f) | 0x80)
+            count >>= 7
+        buf.append(count)
+        buf.append(data[start])
+
+    return bytes(buf)
+
+
+def rle_decode(data: bytes | bytearray) -> bytearray:
+    decoder = RleDecoder()
+    result = decoder.feed(data)
+    decoder.close()
+    return result
+
+
+class RleDecoder:
+    """
+    조각난 입력을 이어서 디코딩한다.
+    feed마다 지금까지 완성된 run들을 반환한다.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.shift = 0
+        # 반복 횟수를 다 읽고 값을 기다리는 중
+        self.wait_value = False
+
+    def feed(self, chunk: bytes | bytearray) -> bytearray:
+        result = bytearray()
+
+        for b in chunk:
+            if self.wait_value:
+                result += bytes((b,)) * self.count
+                self.count = 0
+                self.shift = 0
+                self.wait_value = False
+                continue
+
+            self.count |= (b & 0x7f) << self.shift
+            if b & 0x80:
+                self.shift += 7
+            else:
+                self.wait_value = True
+
+        return result
+
+    def close(self):
+        if self.wait_value or self.shift > 0:
+            raise RleDecodeException("unexpected end of data")
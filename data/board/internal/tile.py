@@ -5,7 +5,7 @@ from data.cursor import Color
 from .exceptions import InvalidTileException
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile(DataObj):
     is_open: bool
     is_mine: bool
@@ -70,19 +70,19 @@ class Tile(DataObj):
 
         if (t.number is not None) and (t.number >= 8 or t.number < 0):
             # 숫자는 음수이거나 8 이상일 수 없음
-            raise InvalidTileException(t.__dict__)
+            raise InvalidTileException(t.to_dict())
         if t.is_mine and (t.number is not None):
             # 지뢰 타일은 숫자를 가지고있지 않음
-            raise InvalidTileException(t.__dict__)
+            raise InvalidTileException(t.to_dict())
         if is_open and is_flag:
             # 열려있는 타일은 깃발이 꽂혀있을 수 없음
-            raise InvalidTileException(t.__dict__)
+            raise InvalidTileException(t.to_dict())
         if is_flag and (color is None):
             # 색깔 없이 깃발이 꽂혀있을 수 없음
-            raise InvalidTileException(t.__dict__)
+            raise InvalidTileException(t.to_dict())
         if (not is_flag) and (color is not None):
             # 깃발이 없는 채로 색깔이 존재할 수 없음
-            raise InvalidTileException(t.__dict__)
+            raise InvalidTileException(t.to_dict())
 
         return t
 
@@ -105,7 +105,7 @@ class Tile(DataObj):
 
         if t.is_open and t.is_flag:
             # 열려있는 타일은 깃발이 꽂혀있을 수 없음
-            raise InvalidTileException(t.__dict__)
+            raise InvalidTileException(t.to_dict())
 
         return t
 
@@ -11,6 +11,25 @@ from .tile import Tile
 -> 123456789
 """
 
+OPEN_BIT = 0b10000000
+MINE_BIT = 0b01000000
+FLAG_BIT = 0b00100000
+HIDE_MASK = 0b10111000
+
+
+def make_table(f) -> bytes:
+    """
+    bytes.translate용 256 크기 변환표
+    """
+    return bytes(f(b) for b in range(256))
+
+
+# 닫힌 타일만 mine, number 제거
+HIDE_TABLE = make_table(lambda b: b if b & OPEN_BIT else b & HIDE_MASK)
+OPEN_TABLE = make_table(lambda b: 1 if b & OPEN_BIT else 0)
+FLAG_TABLE = make_table(lambda b: 1 if b & FLAG_BIT else 0)
+MINE_TABLE = make_table(lambda b: 1 if b & MINE_BIT else 0)
+
 
 @dataclass
 class Tiles(DataObj):
@@ -35,21 +54,11 @@ class Tiles(DataObj):
         return tile
 
     def at_tiles(self, point_range: PointRange):
-        assert 0 <= point_range.top_left.x <= point_range.bottom_right.x <= self.width
-        assert 0 <= point_range.bottom_right.y <= point_range.top_left.y <= self.width
-
-        data = bytearray()
         width = point_range.width
         height = point_range.height
 
-        for y in range(height):
-            y = self.height - (point_range.top_left.y - y) - 1
-            y *= self.width
-            x_start = y+point_range.bottom_left.x
-            x_end = y+point_range.bottom_right.x
-            law = self.data[x_start:x_end+1]
-
-            data += law
+        data = bytearray(width * height)
+        self.at_tiles_into(point_range, data, width, Point(0, 0))
 
         return Tiles(
             data=data,
@@ -57,6 +66,37 @@ class Tiles(DataObj):
             height=height
         )
 
+    def at_tiles_into(
+        self,
+        point_range: PointRange,
+        buffer: bytearray | memoryview,
+        buffer_width: int,
+        offset: Point
+    ):
+        """
+        point_range의 타일들을 buffer에 직접 복사한다.
+        buffer는 한 줄이 buffer_width인 Tiles.data와 같은 배치이며,
+        offset은 buffer 안에서 복사를 시작할 (열, 위에서부터의 행)이다.
+        """
+        assert 0 <= point_range.top_left.x <= point_range.bottom_right.x < self.width
+        assert 0 <= point_range.bottom_right.y <= point_range.top_left.y < self.height
+
+        width = point_range.width
+        height = point_range.height
+
+        assert 0 <= offset.x and offset.x + width <= buffer_width
+        assert 0 <= offset.y and (offset.y + height) * buffer_width <= len(buffer)
+
+        src_start = (self.height - point_range.top_left.y - 1) * self.width + point_range.top_left.x
+        dst_start = offset.y * buffer_width + offset.x
+
+        # 중간 bytearray 없이 행 단위로 바로 복사
+        with memoryview(self.data) as src, memoryview(buffer) as dst:
+            for _ in range(height):
+                dst[dst_start:dst_start + width] = src[src_start:src_start + width]
+                src_start += self.width
+                dst_start += buffer_width
+
     def update_at(self, point: Point, tile: Tile):
         x, y = point.x, self.height - point.y - 1
         idx = x + (y * self.width)
@@ -65,6 +105,44 @@ class Tiles(DataObj):
     def to_str(self):
         return self.data.hex()
 
+    def count_open(self) -> int:
+        return self.data.translate(OPEN_TABLE).count(1)
+
+    def count_flag(self) -> int:
+        return self.data.translate(FLAG_TABLE).count(1)
+
+    def count_mine(self) -> int:
+        return self.data.translate(MINE_TABLE).count(1)
+
+    def neighbor_mines(self) -> bytearray:
+        """
+        각 타일 주변 8칸의 지뢰 개수(0~8)를 Tiles.data와 같은 배치로 반환한다.
+        한 행을 정수 하나로 보고 byte 단위로 더한다.
+        칸당 합이 9를 넘지 않으므로 byte 간 올림이 생기지 않는다.
+        """
+        width, height = self.width, self.height
+        row_bits = width * 8
+        full = (1 << row_bits) - 1
+
+        mines = self.data.translate(MINE_TABLE)
+        rows = [
+            int.from_bytes(mines[y * width:(y + 1) * width], "big")
+            for y in range(height)
+        ]
+        # 자기 자신과 좌우 칸의 합
+        h_sums = [row + (row >> 8) + ((row << 8) & full) for row in rows]
+
+        result = bytearray()
+        for y in range(height):
+            total = h_sums[y] - rows[y]
+            if y > 0:
+                total += h_sums[y - 1]
+            if y < height - 1:
+                total += h_sums[y + 1]
+            result += total.to_bytes(width, "big")
+
+        return result
+
     def hide_info(self):
         # 불변 객체 반환으로 변경 필요
         """
@@ -73,12 +151,4 @@ class Tiles(DataObj):
 
         주의: Tiles 데이터가 변형된다.
         """
-        opened = 0b10000000
-        mask = 0b10111000
-        for idx in range(len(self.data)):
-            b = self.data[idx]
-            if b & opened:
-                continue
-
-            b &= mask
-            self.data[idx] = b
+        self.data[:] = self.data.translate(HIDE_TABLE)
@@ -1,9 +1,10 @@
 import unittest
 
-from .section_test import *
 from .tile_test import *
 from .tiles_test import *
 from .point_test import *
+from .rle_test import *
+from .key_test import *
 
 if __name__ == "__main__":
     unittest.main()
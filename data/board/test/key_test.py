@@ -0,0 +1,51 @@
+from data.board import Point, encode_key, decode_key, KeyRangeException
+
+import unittest
+
+# [-2^30, 2^30)
+MIN = -(1 << 30)
+MAX = (1 << 30) - 1
+
+
+class KeyTestCase(unittest.TestCase):
+    def test_roundtrip(self):
+        for x, y in [(0, 0), (1, 2), (-1, -1), (-100, 37), (MIN, MAX), (MAX, MIN)]:
+            self.assertEqual(decode_key(encode_key(x, y)), (x, y))
+
+    def test_interleave(self):
+        origin = encode_key(0, 0)
+
+        # x는 짝수 비트, y는 홀수 비트
+        self.assertEqual(encode_key(1, 0) - origin, 0b01)
+        self.assertEqual(encode_key(0, 1) - origin, 0b10)
+        self.assertEqual(encode_key(1, 1) - origin, 0b11)
+
+    def test_range(self):
+        self.assertEqual(encode_key(MIN, MIN), 0)
+        self.assertEqual(encode_key(MAX, MAX), (1 << 62) - 1)
+
+    def test_out_of_range(self):
+        for x, y in [(MIN - 1, 0), (0, MIN - 1), (MAX + 1, 0), (0, MAX + 1), (1 << 40, -(1 << 40))]:
+            with self.assertRaises(KeyRangeException):
+                encode_key(x, y)
+
+    def test_unique(self):
+        keys = {encode_key(x, y) for x in range(-8, 8) for y in range(-8, 8)}
+
+        self.assertEqual(len(keys), 16 * 16)
+
+    def test_locality(self):
+        # 2x2 정렬된 블록은 연속된 key
+        keys = sorted(encode_key(x, y) for x in (-2, -1) for y in (4, 5))
+
+        self.assertEqual(keys, list(range(keys[0], keys[0] + 4)))
+
+    def test_point(self):
+        p = Point(-3, 7)
+
+        self.assertEqual(p.to_key(), encode_key(-3, 7))
+        self.assertEqual(Point.from_key(p.to_key()), p)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from data.board import Point, PointRange
+from data.board import Point, PointRange, merge_ranges, subtract_range
 
 
 class PointTestCase(unittest.TestCase):
@@ -33,3 +33,125 @@ class PointRange_TestCase(unittest.TestCase):
         self.assertTrue(r.is_in(Point(1, -1)))
         self.assertTrue(r.is_in(Point(0, 0)))
         self.assertFalse(r.is_in(Point(2, 2)))
+
+
+class PointLayout_TestCase(unittest.TestCase):
+    def test_slots(self):
+        self.assertFalse(hasattr(Point(0, 0), "__dict__"))
+        self.assertFalse(hasattr(PointRange(Point(0, 0), Point(0, 0)), "__dict__"))
+
+    def test_hash(self):
+        points = {Point(x, y) for x in range(-3, 4) for y in range(-3, 4)}
+
+        self.assertEqual(len(points), 49)
+        self.assertIn(Point(-3, 2), points)
+        self.assertEqual(hash(Point(5, -1)), hash(Point(5, -1)))
+
+
+class MergeRanges_TestCase(unittest.TestCase):
+    def test_adjacent_points(self):
+        ranges = [PointRange(Point(x, 0), Point(x, 0)) for x in range(3)]
+
+        merged = merge_ranges(ranges)
+
+        self.assertEqual(merged, [PointRange(Point(0, 0), Point(2, 0))])
+
+    def test_block(self):
+        ranges = [
+            PointRange(Point(x, y), Point(x, y))
+            for x in range(3) for y in range(3)
+        ]
+
+        merged = merge_ranges(ranges)
+
+        self.assertEqual(merged, [PointRange(Point(0, 2), Point(2, 0))])
+
+    def test_contained(self):
+        outer = PointRange(Point(0, 5), Point(5, 0))
+        inner = PointRange(Point(1, 2), Point(2, 1))
+
+        merged = merge_ranges([inner, outer])
+
+        self.assertEqual(merged, [outer])
+
+    def test_not_merge_diagonal(self):
+        a = PointRange(Point(0, 0), Point(0, 0))
+        b = PointRange(Point(1, 1), Point(1, 1))
+
+        merged = merge_ranges([a, b])
+
+        self.assertEqual(merged, [a, b])
+
+    def test_max_waste(self):
+        a = PointRange(Point(0, 0), Point(0, 0))
+        b = PointRange(Point(1, 1), Point(1, 1))
+
+        merged = merge_ranges([a, b], max_waste=1.0)
+
+        self.assertEqual(merged, [PointRange(Point(0, 1), Point(1, 0))])
+
+    def test_far(self):
+        a = PointRange(Point(0, 0), Point(1, 0))
+        b = PointRange(Point(10, 10), Point(11, 10))
+
+        merged = merge_ranges([a, b])
+
+        self.assertEqual(merged, [a, b])
+
+
+class SubtractRange_TestCase(unittest.TestCase):
+    def area(self, ranges: list[PointRange]) -> set[Point]:
+        return {
+            Point(x, y)
+            for r in ranges
+            for x in range(r.top_left.x, r.bottom_right.x + 1)
+            for y in range(r.bottom_right.y, r.top_left.y + 1)
+        }
+
+    def test_move_right(self):
+        old = PointRange(Point(0, 4), Point(4, 0))
+        new = PointRange(Point(1, 4), Point(5, 0))
+
+        ranges = subtract_range(new, old)
+
+        self.assertEqual(ranges, [PointRange(Point(5, 4), Point(5, 0))])
+
+    def test_move_down(self):
+        old = PointRange(Point(0, 4), Point(4, 0))
+        new = PointRange(Point(0, 3), Point(4, -1))
+
+        ranges = subtract_range(new, old)
+
+        self.assertEqual(ranges, [PointRange(Point(0, -1), Point(4, -1))])
+
+    def test_move_diagonal(self):
+        old = PointRange(Point(0, 4), Point(4, 0))
+        new = PointRange(Point(-1, 5), Point(3, 1))
+
+        ranges = subtract_range(new, old)
+
+        self.assertEqual(len(ranges), 2)
+        self.assertEqual(self.area(ranges), self.area([new]) - self.area([old]))
+        self.assertEqual(sum(r.width * r.height for r in ranges), 9)
+
+    def test_grow(self):
+        old = PointRange(Point(1, 3), Point(3, 1))
+        new = PointRange(Point(0, 4), Point(4, 0))
+
+        ranges = subtract_range(new, old)
+
+        self.assertEqual(len(ranges), 4)
+        self.assertEqual(self.area(ranges), self.area([new]) - self.area([old]))
+        self.assertEqual(sum(r.width * r.height for r in ranges), 16)
+
+    def test_contained(self):
+        old = PointRange(Point(0, 4), Point(4, 0))
+        new = PointRange(Point(1, 3), Point(3, 1))
+
+        self.assertEqual(subtract_range(new, old), [])
+
+    def test_far(self):
+        old = PointRange(Point(0, 4), Point(4, 0))
+        new = PointRange(Point(10, 4), Point(14, 0))
+
+        self.assertEqual(subtract_range(new, old), [new])
@@ -0,0 +1,56 @@
+from data.board import rle_encode, rle_decode, RleDecoder, RleDecodeException
+
+import unittest
+
+
+class RleTestCase(unittest.TestCase):
+    def test_encode(self):
+        data = bytes([0, 0, 0, 0, 0x81, 0x81])
+
+        encoded = rle_encode(data)
+
+        self.assertEqual(encoded, bytes([4, 0, 2, 0x81]))
+
+    def test_roundtrip(self):
+        data = bytes([0x20] * 3 + [0x81, 0x82, 0x82] + [0] * 1000 + [0x0a])
+
+        self.assertEqual(rle_decode(rle_encode(data)), data)
+
+    def test_long_run(self):
+        data = bytes(300)
+
+        encoded = rle_encode(data)
+
+        # 300 = varint(ac 02)
+        self.assertEqual(encoded, bytes([0xac, 0x02, 0]))
+        self.assertEqual(rle_decode(encoded), data)
+
+    def test_empty(self):
+        self.assertEqual(rle_encode(b""), b"")
+        self.assertEqual(rle_decode(b""), bytearray())
+
+    def test_feed_bytewise(self):
+        data = bytes([1] * 200 + [2] + [3] * 5)
+        encoded = rle_encode(data)
+
+        decoder = RleDecoder()
+        result = bytearray()
+        for b in encoded:
+            result += decoder.feed(bytes([b]))
+        decoder.close()
+
+        self.assertEqual(result, data)
+
+    def test_truncated(self):
+        encoded = rle_encode(bytes(300))
+
+        decoder = RleDecoder()
+        decoder.feed(encoded[:1])
+        self.assertRaises(RleDecodeException, decoder.close)
+
+        self.assertRaises(RleDecodeException, rle_decode, encoded[:2])
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
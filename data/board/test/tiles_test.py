@@ -53,6 +53,96 @@ class TilesTestCase(unittest.TestCase):
 
         self.assertEqual(flag_tile.copy(hide_info=True).data, data[0])
 
+    def test_hide_info_all_bytes(self):
+        tiles = Tiles(bytearray(range(256)), 16, 16)
+
+        tiles.hide_info()
+
+        for b in range(256):
+            expected = b if b & 0b10000000 else b & 0b10111000
+            self.assertEqual(tiles.data[b], expected)
+
+    def test_count(self):
+        open_tile = Tile.create(
+            is_open=True,
+            is_mine=False,
+            is_flag=False,
+            color=None,
+            number=3
+        )
+        flag_tile = Tile.create(
+            is_open=False,
+            is_mine=True,
+            is_flag=True,
+            color=Color.RED,
+            number=None
+        )
+        mine_tile = Tile.create(
+            is_open=False,
+            is_mine=True,
+            is_flag=False,
+            color=None,
+            number=None
+        )
+
+        tiles = Tiles(bytearray([
+            open_tile.data, flag_tile.data,
+            mine_tile.data, open_tile.data
+        ]), 2, 2)
+
+        self.assertEqual(tiles.count_open(), 2)
+        self.assertEqual(tiles.count_flag(), 1)
+        self.assertEqual(tiles.count_mine(), 2)
+
+    def test_neighbor_mines(self):
+        """
+m..m
+....
+.mm.
+mmmm
+->
+0110
+2332
+3443
+2442
+        """
+        m = Tile.create(
+            is_open=False,
+            is_mine=True,
+            is_flag=False,
+            color=None,
+            number=None
+        ).data
+        e = 0
+
+        tiles = Tiles(bytearray([
+            m, e, e, m,
+            e, e, e, e,
+            e, m, m, e,
+            m, m, m, m
+        ]), 4, 4)
+
+        res = tiles.neighbor_mines()
+
+        self.assertEqual(res, bytearray([
+            0, 1, 1, 0,
+            2, 3, 3, 2,
+            3, 4, 4, 3,
+            2, 4, 4, 2
+        ]))
+
+    def test_neighbor_mines_full(self):
+        mine = 0b01000000
+        tiles = Tiles(bytearray([mine] * 9), 3, 3)
+
+        res = tiles.neighbor_mines()
+
+        self.assertEqual(res, bytearray([
+            3, 5, 3,
+            5, 8, 5,
+            3, 5, 3
+        ]))
+
     def test_at_tile(self):
         """
 rrr
@@ -107,6 +197,46 @@ at_tiles(p(1, 1), p(2,2))
 
         self.assertEqual(res.data, bytearray([2, 2, 2, 2]))
 
+    def test_at_tiles_into(self):
+        """
+1111
+1221
+1221
+1111
+---
+at_tiles_into(p(1, 2), p(2, 1)) -> buffer(3x3), offset(1, 1)
+->
+000
+022
+022
+        """
+        tiles = Tiles(bytearray([1, 1, 1, 1, 1, 2, 2, 1, 1, 2, 2, 1, 1, 1, 1, 1]), 4, 4)
+        buffer = bytearray(9)
+
+        tiles.at_tiles_into(
+            point_range=PointRange(
+                top_left=Point(1, 2),
+                bottom_right=Point(2, 1)
+            ),
+            buffer=buffer,
+            buffer_width=3,
+            offset=Point(1, 1)
+        )
+
+        self.assertEqual(buffer, bytearray([0, 0, 0, 0, 2, 2, 0, 2, 2]))
+
+    def test_at_tiles_into_out_of_buffer(self):
+        tiles = Tiles(bytearray([1, 1, 1, 1]), 2, 2)
+        buffer = bytearray(4)
+
+        with self.assertRaises(AssertionError):
+            tiles.at_tiles_into(
+                point_range=PointRange(Point(0, 1), Point(1, 0)),
+                buffer=buffer,
+                buffer_width=2,
+                offset=Point(1, 0)
+            )
+
     def test_update_at(self):
         """
 1111
@@ -1 +1,6 @@
-from handler.conn.internal.conn import Conn
+def __getattr__(name: str):
+    # handler.conn이 data.conn.event를 import 하므로, 순환 import를 피해 쓸 때 가져온다
+    if name == "Conn":
+        from handler.conn.internal.conn import Conn
+        return Conn
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,5 @@
 from data.conn.event import (
-    to_message, from_message, Event, ValidationException, event,
+    to_message, from_message, ClientEvent, ValidationException,
     InvalidEventFormat
 )
 from data.base import DataObj
@@ -8,9 +8,9 @@ from tests.utils import cases
 from unittest import TestCase
 
 
-@event
+# ClientEvent를 상속하면 from_message에서 찾을 수 있게 등록됨
 @dataclass
-class ExampleEvent(Event):
+class ExampleEvent(ClientEvent.Base):
     event_name = "example"
 
     @dataclass
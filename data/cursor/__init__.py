@@ -1,2 +1,2 @@
-from .internal.cursor import Cursor
 from .internal.color import Color
+from .internal.cursor import Cursor
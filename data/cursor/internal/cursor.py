@@ -9,7 +9,7 @@ from typing import TypeVarTuple, Unpack
 
 Ts = TypeVarTuple("Ts") 
 
-@dataclass
+@dataclass(slots=True)
 class Cursor(DomainObj[Unpack[Ts]], HaveId[str]):
     conn_id: str
     position: Point
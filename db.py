@@ -1,20 +1,118 @@
 from aiosqlite import connect, Connection
 from utils.config import Config
 
+import asyncio
+from collections import deque
+from functools import wraps
+
+POOL_SIZE = 4
+CACHED_STATEMENTS = 256  # connection별 prepared statement cache 크기
+BUSY_TIMEOUT_MS = 5000
+
+
+class DBPool:
+    """
+    한번 연 connection을 재사용하는 pool.
+    connection마다 worker thread가 하나씩 있으므로 매 호출마다 열고 닫지 않는다.
+    server lifespan에서 open/close 하며, 열리기 전에 쓰이면 필요할 때 연다.
+    """
+    size: int = POOL_SIZE
+    opened: list[Connection] = []
+    idle: list[Connection] = []
+    waiters: deque[asyncio.Future] = deque()
+    # 여는 중인 connection 수. get_db를 기다리기 전에 자리를 잡아 size를 넘지 않게 한다.
+    opening: int = 0
+
+    @classmethod
+    async def open(cls):
+        while cls._has_room():
+            cls.release(await cls._open_one())
+
+    @classmethod
+    async def acquire(cls) -> Connection:
+        if len(cls.idle) > 0:
+            return cls.idle.pop()
+
+        if cls._has_room():
+            return await cls._open_one()
+
+        waiter = asyncio.get_running_loop().create_future()
+        cls.waiters.append(waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # release가 이미 넘겨준 connection은 다음 대기자에게
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                cls.release(waiter.result())
+            raise
+
+    @classmethod
+    def release(cls, db: Connection):
+        if db not in cls.opened:
+            # close 이후 반환된 connection
+            return
+
+        while len(cls.waiters) > 0:
+            waiter = cls.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(db)
+                return
+
+        cls.idle.append(db)
+
+    @classmethod
+    def _has_room(cls) -> bool:
+        return len(cls.opened) + cls.opening < cls.size
+
+    @classmethod
+    async def _open_one(cls) -> Connection:
+        cls.opening += 1
+        try:
+            db = await get_db()
+        finally:
+            cls.opening -= 1
+
+        cls.opened.append(db)
+        return db
+
+    @classmethod
+    async def close(cls):
+        opened = cls.opened
+        cls.opened, cls.idle = [], []
+
+        while len(cls.waiters) > 0:
+            waiter = cls.waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(ConnectionError("db pool closed"))
+
+        for db in opened:
+            await db.close()
+
 
 def use_db(func):
+    @wraps(func)
     async def wrapper(*args, **kwargs):
+        db = await DBPool.acquire()
         try:
-            db = await get_db()
             return await func(db, *args, **kwargs)
         finally:
-            await db.close()
+            DBPool.release(db)
 
     return wrapper
 
 
 async def get_db() -> Connection:
-    return await connect(
+    db = connect(
         database=Config.DATABASE_PATH,
-        isolation_level=None  # AUTOCOMMIT
+        isolation_level=None,  # AUTOCOMMIT
+        cached_statements=CACHED_STATEMENTS
     )
+    # 닫히지 않은 connection이 프로세스 종료를 막지 않도록
+    db.daemon = True
+    db = await db
+
+    await db.execute("PRAGMA journal_mode=WAL")
+    await db.execute("PRAGMA synchronous=NORMAL")
+    await db.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+
+    return db
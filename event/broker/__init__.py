@@ -1,4 +1,4 @@
 from .internal.event_broker import EventBroker, Receiver
-from .internal.event_recorder import EventRecorder
+from .internal.event_recorder import EventRecorder, RecorderMetrics
 from .internal.exceptions import NoMatchingReceiverException
 from .internal.utils import publish_data_event
@@ -45,11 +45,14 @@ class Receiver(Generic[EVENT_TYPE]):
 
 class EventBroker:
     event_dict: dict[str, list[str]] = {}
+    # event -> 호출할 함수들. receiver가 추가/제거될 때만 다시 만든다.
+    dispatch_table: dict[str, tuple[Callable, ...]] = {}
 
     @staticmethod
     def add_receiver(event: str):
         if event not in EventBroker.event_dict:
             EventBroker.event_dict[event] = []
+            EventBroker._compile(event)
 
         def wrapper(func: Callable | Receiver):
             if type(func) == Receiver:
@@ -59,6 +62,7 @@ class EventBroker:
                 receiver = Receiver(func, event)
 
             EventBroker.event_dict[event].append(receiver.id)
+            EventBroker._compile(event)
 
             return receiver
         return wrapper
@@ -74,18 +78,31 @@ class EventBroker:
 
             if len(EventBroker.event_dict[event]) == 0:
                 del EventBroker.event_dict[event]
+            EventBroker._compile(event)
+
+    @staticmethod
+    def _compile(event: str):
+        if event not in EventBroker.event_dict:
+            EventBroker.dispatch_table.pop(event, None)
+            return
+
+        EventBroker.dispatch_table[event] = tuple(
+            Receiver.get_receiver(id).func for id in EventBroker.event_dict[event]
+        )
 
     @staticmethod
     async def publish(message: Message):
-        if message.event not in EventBroker.event_dict:
-            print(EventBroker.event_dict)
+        funcs = EventBroker.dispatch_table.get(message.event)
+        if funcs is None:
             raise NoMatchingReceiverException(message.event)
 
-        coroutines = [EventRecorder.record(timestamp=datetime.now(), msg=message)]
-
-        receiver_ids = EventBroker.event_dict[message.event]
-        for id in receiver_ids:
-            receiver = Receiver.get_receiver(id)
-            coroutines.append(receiver(message))
+        # 디스크 기록은 기다리지 않음
+        EventRecorder.record(timestamp=datetime.now(), msg=message)
 
-        await asyncio.gather(*coroutines)
+        match len(funcs):
+            case 0:
+                return
+            case 1:
+                await funcs[0](message)
+            case _:
+                await asyncio.gather(*[func(message) for func in funcs])
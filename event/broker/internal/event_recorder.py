@@ -1,14 +1,25 @@
 from event.message import Message
+from data.base import attrs
 from db import use_db
 
 from aiosqlite import Connection
 
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, replace
 from datetime import datetime
 import asyncio
 import json
+import logging
 
 TABLE_NAME = "events"
 
+QUEUE_SIZE = 10000
+BATCH_SIZE = 256
+FLUSH_INTERVAL_SECONDS = 0.5
+
+logger = logging.getLogger(__name__)
+
 
 @use_db
 async def init_table(db: Connection):
@@ -23,22 +34,147 @@ async def init_table(db: Connection):
 asyncio.run(init_table())
 
 
-class EventRecorder:
-    @use_db
-    @staticmethod
-    async def record(db: Connection, timestamp: datetime, msg: Message):
-        header = json.dumps(obj=msg.header, sort_keys=True)
-        payload = json.dumps(obj=msg.payload, default=lambda o: o.__dict__, sort_keys=True)
-
-        await db.execute(
+@use_db
+async def write_records(db: Connection, rows: list[dict]):
+    await db.execute("BEGIN")
+    try:
+        await db.executemany(
             f"""
                 INSERT INTO {TABLE_NAME} (event, timestamp, header, payload)
                 VALUES (:event, :timestamp, :header, :payload)
             """,
-            {
-                "event": msg.event,
-                "timestamp": timestamp.timestamp(),
-                "header": header,
-                "payload": payload
-            }
+            rows
         )
+    except asyncio.CancelledError:
+        # 취소는 ROLLBACK이 실패해도 그대로 전달
+        with suppress(Exception):
+            await db.execute("ROLLBACK")
+        raise
+    except BaseException:
+        await db.execute("ROLLBACK")
+        raise
+
+    # COMMIT 도중 취소되어도 COMMIT은 db thread에서 끝까지 진행되므로 ROLLBACK 하지 않음
+    await db.execute("COMMIT")
+
+
+@dataclass
+class RecorderMetrics:
+    recorded: int = 0  # 큐에 들어간 이벤트 수
+    written: int = 0  # 디스크에 쓰인 이벤트 수
+    dropped: int = 0  # 큐가 가득 차 버려진 이벤트 수
+    failed: int = 0  # 쓰기 실패로 버려진 이벤트 수
+    high_water: int = 0  # 큐 최대 적재량
+
+
+class EventRecorder:
+    """
+    write-behind 방식의 이벤트 기록기.
+    record는 큐에 넣기만 하고, 백그라운드 writer가 BATCH_SIZE 또는 FLUSH_INTERVAL_SECONDS마다
+    한 트랜잭션으로 모아서 기록한다.
+    metrics는 get_metrics로 읽고, stop할 때 로그로 남긴다.
+    """
+    queue: deque[dict] = deque()
+    metrics: RecorderMetrics = RecorderMetrics()
+
+    _writer: asyncio.Task | None = None
+    _wakeup: asyncio.Event | None = None
+
+    @classmethod
+    def record(cls, timestamp: datetime, msg: Message):
+        if len(cls.queue) >= QUEUE_SIZE:
+            cls.metrics.dropped += 1
+            return
+
+        header = json.dumps(obj=msg.header, sort_keys=True)
+        payload = json.dumps(obj=msg.payload, default=attrs, sort_keys=True)
+
+        cls.queue.append({
+            "event": msg.event,
+            "timestamp": timestamp.timestamp(),
+            "header": header,
+            "payload": payload
+        })
+
+        cls.metrics.recorded += 1
+        cls.metrics.high_water = max(cls.metrics.high_water, len(cls.queue))
+
+        cls._ensure_writer()
+        if len(cls.queue) == 1 or len(cls.queue) >= BATCH_SIZE:
+            cls._wakeup.set()
+
+    @classmethod
+    def pending(cls) -> int:
+        return len(cls.queue)
+
+    @classmethod
+    def get_metrics(cls) -> RecorderMetrics:
+        return replace(cls.metrics)
+
+    @classmethod
+    async def flush(cls):
+        while len(cls.queue) > 0:
+            count = min(BATCH_SIZE, len(cls.queue))
+            rows = [cls.queue.popleft() for _ in range(count)]
+
+            # 취소되어도 트랜잭션은 끝까지 진행시켜, 같은 이벤트를 두 번 쓰거나 잃지 않게 함
+            write = asyncio.ensure_future(write_records(rows))
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                # 쓰기가 끝난 뒤에 취소를 전달
+                await asyncio.wait([write])
+                raise
+            except Exception:
+                logger.exception("failed to write %d events", count)
+            finally:
+                if write.done() and not write.cancelled() and write.exception() is None:
+                    cls.metrics.written += count
+                else:
+                    cls.metrics.failed += count
+
+    @classmethod
+    async def stop(cls):
+        """
+        writer를 멈추고 남은 이벤트를 모두 기록
+        """
+        writer, cls._writer = cls._writer, None
+        if writer is not None and not writer.done():
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+
+        await cls.flush()
+        logger.info("event recorder stopped: %s", cls.get_metrics())
+
+    @classmethod
+    def _ensure_writer(cls):
+        loop = asyncio.get_running_loop()
+
+        writer = cls._writer
+        if writer is not None and not writer.done() and writer.get_loop() is loop:
+            return
+
+        cls._wakeup = asyncio.Event()
+        cls._writer = loop.create_task(cls._run_writer(cls._wakeup))
+
+        if len(cls.queue) > 0:
+            cls._wakeup.set()
+
+    @classmethod
+    async def _run_writer(cls, wakeup: asyncio.Event):
+        while True:
+            # 첫 이벤트가 들어오거나 BATCH_SIZE에 도달하면 깨어남
+            await wakeup.wait()
+            wakeup.clear()
+
+            if len(cls.queue) < BATCH_SIZE:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), FLUSH_INTERVAL_SECONDS)
+                except TimeoutError:
+                    pass
+                wakeup.clear()
+
+            await cls.flush()
@@ -1,5 +1,5 @@
 from .event_broker_test import EventBrokerTestCase
-# from .event_recorder_test import EventRecorderTestCase
+from .event_recorder_test import EventRecorderTestCase, WriteRecords_TestCase
 
 import unittest
 
@@ -38,6 +38,39 @@ class EventBrokerTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn(self.handler.receive_a.id, Receiver.receiver_dict)
         self.assertNotIn("example_a", EventBroker.event_dict)
 
+    def test_dispatch_table(self):
+        self.assertEqual(EventBroker.dispatch_table["example_a"], (self.handler.receive_a.func,))
+        self.assertEqual(EventBroker.dispatch_table["example_c"], (self.handler.receive_b.func,))
+
+        EventBroker.remove_receiver(self.handler.receive_a)
+
+        self.assertNotIn("example_a", EventBroker.dispatch_table)
+
+    def test_dispatch_table_multiple_receiver(self):
+        other = EventBroker.add_receiver("example_a")(AsyncMock())
+
+        self.assertEqual(
+            EventBroker.dispatch_table["example_a"],
+            (self.handler.receive_a.func, other.func)
+        )
+
+        EventBroker.remove_receiver(other)
+
+        self.assertEqual(EventBroker.dispatch_table["example_a"], (self.handler.receive_a.func,))
+
+    @patch("event.broker.EventRecorder.record")
+    async def test_publish_multiple_receiver(self, mock: AsyncMock):
+        other = EventBroker.add_receiver("example_a")(AsyncMock())
+        message = Message(event="example_a", payload=None)
+
+        try:
+            await EventBroker.publish(message=message)
+        finally:
+            EventBroker.remove_receiver(other)
+
+        self.handler.receive_a.func.assert_called_once_with(message)
+        other.func.assert_called_once_with(message)
+
     @patch("event.broker.EventRecorder.record")
     async def test_publish(self, mock: AsyncMock):
         message = Message(event="example_a", payload=None)
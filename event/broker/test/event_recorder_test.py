@@ -1,33 +1,167 @@
-# from datetime import datetime
-# from .utils import clear_records
-# from data.payload import EventCollection, ErrorPayload
-# from event.message import Message
-# import unittest
+from datetime import datetime
+from .utils import clear_records
+from event.message import Message
+import unittest
+import asyncio
+from unittest.mock import patch, AsyncMock, MagicMock
 
-# from event.broker import EventRecorder
+from event.broker import EventRecorder, RecorderMetrics
+from event.broker.internal.event_recorder import write_records
 
+from db import get_db, DBPool
 
-# class EventRecorderTestCase(unittest.IsolatedAsyncioTestCase):
-#     async def asyncSetUp(self):
-#         await clear_records()
 
-#     async def asyncTearDown(self):
-#         await clear_records()
+async def count_records():
+    db = await get_db()
+    cur = await db.execute("SELECT COUNT(*) FROM events")
+    row = await cur.fetchone()
+    await db.close()
+    return row[0]
 
-#     async def test_record(self):
-#         message = Message(
-#             event=EventCollection.ERROR,
-#             header={
-#                 "ayo": "pizza here",
-#                 "thisisint": 1
-#             },
-#             payload=ErrorPayload(msg="heelo world")
-#         )
 
-#         timestamp = datetime.now()
+class EventRecorderTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await EventRecorder.stop()
+        await clear_records()
+        EventRecorder.metrics = RecorderMetrics()
 
-#         await EventRecorder.record(timestamp, message)
+    async def asyncTearDown(self):
+        await EventRecorder.stop()
+        await clear_records()
 
+    def message(self):
+        return Message(
+            event="example",
+            header={
+                "ayo": "pizza here",
+                "thisisint": 1
+            },
+            payload=None
+        )
 
-# if __name__ == "__main__":
-#     unittest.main()
+    @patch("event.broker.internal.event_recorder.write_records")
+    async def test_record_not_wait(self, write: AsyncMock):
+        EventRecorder.record(datetime.now(), self.message())
+
+        # record는 큐에 넣기만 함
+        write.assert_not_called()
+        self.assertEqual(EventRecorder.pending(), 1)
+
+        await EventRecorder.flush()
+
+        write.assert_called_once()
+        self.assertEqual(EventRecorder.pending(), 0)
+        self.assertEqual(EventRecorder.metrics.written, 1)
+
+    @patch("event.broker.internal.event_recorder.BATCH_SIZE", 2)
+    @patch("event.broker.internal.event_recorder.write_records")
+    async def test_flush_batch(self, write: AsyncMock):
+        for _ in range(5):
+            EventRecorder.record(datetime.now(), self.message())
+
+        await EventRecorder.flush()
+
+        self.assertEqual([len(c.args[0]) for c in write.mock_calls], [2, 2, 1])
+
+    @patch("event.broker.internal.event_recorder.QUEUE_SIZE", 2)
+    @patch("event.broker.internal.event_recorder.write_records")
+    async def test_record_dropped(self, write: AsyncMock):
+        for _ in range(3):
+            EventRecorder.record(datetime.now(), self.message())
+
+        self.assertEqual(EventRecorder.pending(), 2)
+        self.assertEqual(EventRecorder.metrics.dropped, 1)
+        self.assertEqual(EventRecorder.metrics.high_water, 2)
+
+    @patch("event.broker.internal.event_recorder.write_records")
+    async def test_flush_failed(self, write: AsyncMock):
+        write.side_effect = Exception()
+
+        EventRecorder.record(datetime.now(), self.message())
+        await EventRecorder.flush()
+
+        self.assertEqual(EventRecorder.pending(), 0)
+        self.assertEqual(EventRecorder.metrics.failed, 1)
+
+    async def test_flush_cancelled(self):
+        async def slow_write(rows):
+            await asyncio.sleep(0.05)
+
+        EventRecorder.record(datetime.now(), self.message())
+
+        with patch("event.broker.internal.event_recorder.write_records", side_effect=slow_write):
+            flush = asyncio.create_task(EventRecorder.flush())
+            await asyncio.sleep(0.01)
+            flush.cancel()
+
+            # 쓰기가 끝난 뒤에 취소가 전달됨
+            with self.assertRaises(asyncio.CancelledError):
+                await flush
+
+        self.assertEqual(EventRecorder.pending(), 0)
+        self.assertEqual(EventRecorder.metrics.written, 1)
+        self.assertEqual(EventRecorder.metrics.failed, 0)
+
+    def test_get_metrics(self):
+        EventRecorder.metrics.written = 3
+
+        metrics = EventRecorder.get_metrics()
+        metrics.written = 0
+
+        self.assertEqual(EventRecorder.get_metrics(), RecorderMetrics(written=3))
+
+    @patch("event.broker.internal.event_recorder.FLUSH_INTERVAL_SECONDS", 0.01)
+    async def test_writer_flush_interval(self):
+        EventRecorder.record(datetime.now(), self.message())
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(EventRecorder.pending(), 0)
+        self.assertEqual(await count_records(), 1)
+
+    async def test_stop_write(self):
+        for _ in range(3):
+            EventRecorder.record(datetime.now(), self.message())
+
+        await EventRecorder.stop()
+
+        self.assertEqual(await count_records(), 3)
+
+
+class WriteRecords_TestCase(unittest.IsolatedAsyncioTestCase):
+    def create_db(self, fail: str, error: BaseException) -> MagicMock:
+        async def execute(query: str, *args):
+            if query == fail:
+                raise error
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=execute)
+        db.executemany = AsyncMock()
+        return db
+
+    def queries(self, db: MagicMock) -> list[str]:
+        return [c.args[0] for c in db.execute.await_args_list]
+
+    async def test_commit_cancelled(self):
+        db = self.create_db("COMMIT", asyncio.CancelledError())
+
+        with patch.object(DBPool, "acquire", AsyncMock(return_value=db)), patch.object(DBPool, "release"):
+            with self.assertRaises(asyncio.CancelledError):
+                await write_records([])
+
+        # COMMIT은 이미 진행 중이므로 ROLLBACK 하지 않음
+        self.assertEqual(self.queries(db), ["BEGIN", "COMMIT"])
+
+    async def test_insert_cancelled_rollback_failed(self):
+        db = self.create_db("ROLLBACK", Exception("no transaction is active"))
+        db.executemany.side_effect = asyncio.CancelledError()
+
+        with patch.object(DBPool, "acquire", AsyncMock(return_value=db)), patch.object(DBPool, "release"):
+            with self.assertRaises(asyncio.CancelledError):
+                await write_records([])
+
+        self.assertEqual(self.queries(db), ["BEGIN", "ROLLBACK"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 from typing import Generic, TypeVar
 from event.payload import Payload, Empty, ExternalEventPayload
 from .exceptions import InvalidEventTypeException
+from data.base import attrs
 
 import json
 from dataclasses import dataclass
@@ -36,8 +37,8 @@ class Message(Generic[EVENT_TYPE]):
         def __parse(obj):
             return {
                 key: item
-                for key in obj.__dict__
-                if (item := obj.__dict__[key]) is not Empty
+                for key, item in attrs(obj).items()
+                if item is not Empty
             }
 
         return json.dumps(
@@ -1,5 +1,4 @@
 from event.message import Message, InvalidEventTypeException
-from data.payload import DataPayload
 from event.payload import Payload
 from .message_testdata import FETCH_TILES_EXAMPLE, INVALID_EVENT_EXAMPLE, TILES_EXAMPLE
 from data.board import Point
@@ -1,2 +1,3 @@
 from .internal.board import BoardHandler, BoardEvent
 from .internal.section import Section, Config
+from .internal.generator import generate_section, tile_at
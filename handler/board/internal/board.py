@@ -1,8 +1,11 @@
 from data.board import PointRange, Tiles, Point, Tile
 from data.conn.event import ServerEvent
-from event.payload import EventEnum, Event
-from event.broker import publish_data_event
+from event.payload import EventEnum, Event, IdPayload
+from event.message import Message
+from event.broker import EventBroker
 from .section import Section, Config
+from .cascade import open_cascade
+from handler.board.storage import SectionCache, ReadOnlyStoreException
 
 from handler.storage.interface import KeyValueInterface
 from handler.storage.dict import DictSpace
@@ -32,40 +35,6 @@ def abs_to_sec(abs_point: Point):
     )
 
 
-def h_merge_tiles(left_tiles: Tiles, right_tiles: Tiles):
-    assert left_tiles.height == right_tiles.height
-
-    data = bytearray()
-    for i in range(left_tiles.height):
-        left_index = left_tiles.width * i
-        left_index_end = left_index + left_tiles.width
-        left_data = left_tiles.data[left_index:left_index_end]
-
-        right_index = right_tiles.width * i
-        right_index_end = right_index + right_tiles.width
-        right_data = right_tiles.data[right_index:right_index_end]
-
-        data += (left_data + right_data)
-
-    return Tiles(
-        data=data,
-        width=left_tiles.width+right_tiles.width,
-        height=left_tiles.height
-    )
-
-
-def v_merge_tiles(top_tile: Tiles, bottom_tile: Tiles):
-    assert top_tile.width == bottom_tile.width
-
-    data = top_tile.data + bottom_tile.data
-
-    return Tiles(
-        data=data,
-        width=top_tile.width,
-        height=top_tile.height+bottom_tile.height
-    )
-
-
 class BoardEvent(EventEnum):
     EXPLOSION = "EXPLOSION"
     UPDATE = "Board.UPDATE"
@@ -79,7 +48,17 @@ class BoardHandler:
     - open_tiles(Point)
     - togle_flag(Point)
     """
-    section_dict: dict[Point, Section] = {}
+    @classmethod
+    def _is_reader(cls) -> bool:
+        store = SectionCache.shared_store
+        return store is not None and not store.writable
+
+    @classmethod
+    async def _get_section(cls, sec_p: Point) -> Section:
+        section = await SectionCache.get(sec_p)
+        if section is None:
+            raise KeyError(sec_p)
+        return section
 
     @classmethod
     async def fetch(cls, point_range: PointRange):
@@ -95,11 +74,14 @@ class BoardHandler:
         section_left = section_top_left.x
         section_right = section_bottom_right.x
 
-        result = Tiles(bytearray(), out_width, 0)
+        # 결과 버퍼는 한 번만 할당하고 각 section의 행을 그 자리에 복사
+        result = Tiles(bytearray(out_width * out_height), out_width, out_height)
 
         # top -> bottom 탐색
+        out_y = 0
         for y in range(section_top, section_bottom - 1, -1):
-            h_tiles: Tiles | None = None
+            out_x = 0
+            row_height = 0
 
             # left -> right 탐색
             for x in range(section_left, section_right + 1):
@@ -109,52 +91,79 @@ class BoardHandler:
                     abs_to_rel(point_range.top_left, sec_point),
                     abs_to_rel(point_range.bottom_right, sec_point)
                 )
-                sec = BoardHandler.section_dict[Point(x, y)]
 
-                out_tiles = sec.tiles.at_tiles(out_point_range)
-                if h_tiles is None:
-                    h_tiles = out_tiles
+                def copy(sec: Section):
+                    sec.tiles.at_tiles_into(
+                        out_point_range, result.data, out_width, Point(out_x, out_y)
+                    )
+
+                if cls._is_reader():
+                    # reader는 공유 store의 slot에서 바로 복사. writer가 쓰는 중이면 다 쓴 뒤에 복사함
+                    if not SectionCache.shared_store.read(sec_point, copy):
+                        raise KeyError(sec_point)
                 else:
-                    h_tiles = h_merge_tiles(h_tiles, out_tiles)
+                    copy(await cls._get_section(sec_point))
+
+                out_x += out_point_range.width
+                row_height = out_point_range.height
 
-            assert h_tiles
-            result = v_merge_tiles(result, h_tiles)
+            assert out_x == out_width
+            out_y += row_height
 
-        assert result.width == out_width
-        assert result.height == out_height
+        assert out_y == out_height
 
         return result
 
     @classmethod
     async def togle_flag(cls, point: Point):
+        if cls._is_reader():
+            raise ReadOnlyStoreException()
+
         sec_p = abs_to_sec(point)
         rel_p = abs_to_rel(point, sec_p)
 
-        section = BoardHandler.section_dict[sec_p]
+        section = await cls._get_section(sec_p)
         tile = section.tiles.at_tile(rel_p)
 
         tile.is_flag = not tile.is_flag
 
         section.tiles.update_at(rel_p, tile)
+        SectionCache.mark_dirty(sec_p)
 
-        await publish_data_event(BoardEvent.UPDATE, data=tile, id=point)
+        await cls._publish_update(PointRange(point, point))
 
     @classmethod
-    async def open_tiles(cls, point: Point):
+    async def open_tiles(cls, point: Point) -> list[PointRange]:
+        """
+        타일을 열고, 빈 타일이면 주변 타일까지 연쇄로 연다.
+        변경된 영역들을 반환한다.
+        """
+        if cls._is_reader():
+            raise ReadOnlyStoreException()
+
         sec_p = abs_to_sec(point)
         rel_p = abs_to_rel(point, sec_p)
 
-        section = BoardHandler.section_dict[sec_p]
-        tile = section.tiles.at_tile(rel_p)
+        section = await cls._get_section(sec_p)
 
-        tile.is_open = True
+        ranges = await open_cascade(section, rel_p)
 
-        section.tiles.update_at(rel_p, tile)
+        for range in ranges:
+            await cls._publish_update(range)
 
-        await publish_data_event(BoardEvent.UPDATE, data=tile, id=point)
+        return ranges
 
     @classmethod
     async def fetch_point(cls, point: Point) -> Tile:
         tiles = await cls.fetch(PointRange(point, point))
-        tile = tiles.at_tile(point)
+        tile = tiles.at_tile(Point(0, 0))
         return tile
+
+    @classmethod
+    async def _publish_update(cls, range: PointRange):
+        # 타일은 NotifyBoardChangedReceiver가 tick마다 합친 영역으로 한 번만 fetch 함
+        message = Message(
+            event=BoardEvent.UPDATE,
+            payload=IdPayload(id=range)
+        )
+        await EventBroker.publish(message)
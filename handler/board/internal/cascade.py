@@ -0,0 +1,150 @@
+from data.board import Point, PointRange
+from handler.board.storage import SectionCache
+from .section import Section
+
+from collections import deque
+
+OPEN_BIT = 0b10000000
+MINE_BIT = 0b01000000
+FLAG_BIT = 0b00100000
+NUM_MASK = 0b00000111
+
+# 열린 타일, 깃발, 지뢰는 연쇄로 열지 않음
+STOP_MASK = OPEN_BIT | FLAG_BIT | MINE_BIT
+
+# (행, 열) 변화량. 행은 위에서부터 증가
+DELTAS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 1),
+    (1, -1), (1, 0), (1, 1)
+)
+
+SectionKey = tuple[int, int]
+
+
+async def open_cascade(section: Section, rel_p: Point) -> list[PointRange]:
+    """
+    section 안의 rel_p 타일을 열고, 빈 타일(숫자 0)이면 주변 타일을 연쇄로 연다.
+    section의 원본 byte 버퍼 위에서 (section x, section y, 평탄화된 index)로 BFS 하며,
+    경계를 넘는 이웃 section은 SectionCache로 가져온다.
+    없는 section은 건너뛴다.
+
+    열린 타일들이 포함된 section별 최소 사각형(절대 좌표)을 반환한다.
+    아무 타일도 열리지 않았으면 빈 리스트.
+    """
+    length = section.tiles.width
+
+    sections: dict[SectionKey, Section | None] = {(section.point.x, section.point.y): section}
+    # section별 열린 타일 범위 [최소 행, 최소 열, 최대 행, 최대 열]
+    bounds: dict[SectionKey, list[int]] = {}
+
+    def touch(key: SectionKey, row: int, col: int):
+        bound = bounds.get(key)
+        if bound is None:
+            bounds[key] = [row, col, row, col]
+            return
+
+        if row < bound[0]:
+            bound[0] = row
+        elif row > bound[2]:
+            bound[2] = row
+        if col < bound[1]:
+            bound[1] = col
+        elif col > bound[3]:
+            bound[3] = col
+
+    async def load(key: SectionKey) -> Section | None:
+        if key not in sections:
+            sections[key] = await SectionCache.get(Point(*key))
+        return sections[key]
+
+    start_key = (section.point.x, section.point.y)
+    start_row = length - rel_p.y - 1
+    start_idx = start_row * length + rel_p.x
+
+    data = section.tiles.data
+    b = data[start_idx]
+    if b & (OPEN_BIT | FLAG_BIT):
+        return []
+
+    data[start_idx] = b | OPEN_BIT
+    touch(start_key, start_row, rel_p.x)
+
+    queue: deque[tuple[int, int, int]] = deque()
+    if not (b & (MINE_BIT | NUM_MASK)):
+        queue.append((*start_key, start_idx))
+
+    # section 내부에서 쓰는 평탄화된 이웃 offset
+    offsets = tuple(dr * length + dc for dr, dc in DELTAS)
+
+    while queue:
+        sx, sy, idx = queue.popleft()
+        key = (sx, sy)
+        data = sections[key].tiles.data
+        row, col = divmod(idx, length)
+
+        if 0 < row < length - 1 and 0 < col < length - 1:
+            # 이웃이 모두 같은 section 안에 있음
+            for offset in offsets:
+                n = idx + offset
+                b = data[n]
+                if b & STOP_MASK:
+                    continue
+
+                data[n] = b | OPEN_BIT
+                touch(key, n // length, n % length)
+                if not (b & NUM_MASK):
+                    queue.append((sx, sy, n))
+            continue
+
+        for dr, dc in DELTAS:
+            n_row, n_col = row + dr, col + dc
+            n_sx, n_sy = sx, sy
+
+            if n_col < 0:
+                n_col += length
+                n_sx -= 1
+            elif n_col >= length:
+                n_col -= length
+                n_sx += 1
+
+            # 위쪽 행은 y가 큰 section
+            if n_row < 0:
+                n_row += length
+                n_sy += 1
+            elif n_row >= length:
+                n_row -= length
+                n_sy -= 1
+
+            n_key = (n_sx, n_sy)
+            n_section = await load(n_key)
+            if n_section is None:
+                continue
+
+            n_data = n_section.tiles.data
+            n = n_row * length + n_col
+            b = n_data[n]
+            if b & STOP_MASK:
+                continue
+
+            n_data[n] = b | OPEN_BIT
+            touch(n_key, n_row, n_col)
+            if not (b & NUM_MASK):
+                queue.append((n_sx, n_sy, n))
+
+    ranges = []
+    for (sx, sy), (min_row, min_col, max_row, max_col) in bounds.items():
+        touched = sections[(sx, sy)]
+        if (sx, sy) in SectionCache.sections:
+            SectionCache.mark_dirty(touched.point)
+        else:
+            # 연쇄 도중 cache에서 내보내진 section
+            SectionCache.set(touched)
+
+        base_x, base_y = sx * length, sy * length
+        ranges.append(PointRange(
+            top_left=Point(base_x + min_col, base_y + length - 1 - min_row),
+            bottom_right=Point(base_x + max_col, base_y + length - 1 - max_row)
+        ))
+
+    return ranges
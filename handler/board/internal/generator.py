@@ -0,0 +1,140 @@
+"""
+world seed와 section 좌표만으로 section을 만든다.
+
+section마다 blake2b(key=seed, section x, section y, block 번호)로 64byte씩 이어 붙인
+난수 byte를 타일 순서대로 쓰고, byte가 MINE_RATIO * 256보다 작으면 지뢰 후보(raw)로 본다.
+이웃 section의 raw도 같은 방식으로 계산할 수 있으므로 이웃을 읽지 않고 숫자를 구할 수 있다.
+
+숫자는 3비트(0~7)이므로 주변 8칸이 모두 raw인 타일은 지뢰로 만든다.
+이 타일의 이웃은 모두 지뢰라 숫자가 바뀌는 타일은 없다.
+- 지뢰 = raw 이거나 주변 8칸이 모두 raw
+- 숫자 = 주변 raw 개수
+"""
+from data.board import Point, Tiles
+from .section import Section, Config
+
+from functools import lru_cache
+from hashlib import blake2b
+import struct
+
+MINE_BIT = 0b01000000
+
+BLOCK_SIZE = 64
+BLOCK = struct.Struct("<qqQ")
+SEED = struct.Struct("<q")
+
+# (주변 raw 개수 + raw면 16) -> 타일 byte
+RAW_FLAG = 16
+TILE_TABLE = bytes(
+    MINE_BIT if v >= RAW_FLAG or v == 8 else v
+    for v in range(256)
+)
+
+
+@lru_cache
+def raw_table(threshold: int) -> bytes:
+    return bytes(MINE_BIT if b < threshold else 0 for b in range(256))
+
+
+def threshold() -> int:
+    return round(Config.MINE_RATIO * 256)
+
+
+def random_bytes(sec_x: int, sec_y: int, start: int, end: int) -> bytes:
+    """
+    section 난수 byte 중 [start, end) 구간
+    """
+    key = SEED.pack(Config.SEED)
+
+    first = start // BLOCK_SIZE
+    last = (end - 1) // BLOCK_SIZE
+
+    buf = bytearray()
+    for block in range(first, last + 1):
+        buf += blake2b(BLOCK.pack(sec_x, sec_y, block), digest_size=BLOCK_SIZE, key=key).digest()
+
+    offset = first * BLOCK_SIZE
+    return bytes(buf[start - offset:end - offset])
+
+
+def raw_mines(sec_x: int, sec_y: int, start: int = 0, end: int | None = None) -> bytes:
+    """
+    section raw 지뢰(MINE_BIT 또는 0)를 Tiles.data 배치로 반환
+    """
+    if end is None:
+        end = Config.LENGTH * Config.LENGTH
+    return random_bytes(sec_x, sec_y, start, end).translate(raw_table(threshold()))
+
+
+def raw_grid(sec_p: Point) -> bytearray:
+    """
+    section과 주변 한 칸의 raw 지뢰. 한 변이 LENGTH + 2인 Tiles.data 배치
+    """
+    length = Config.LENGTH
+    sx, sy = sec_p.x, sec_p.y
+
+    own = raw_mines(sx, sy)
+    left = raw_mines(sx - 1, sy)
+    right = raw_mines(sx + 1, sy)
+    # 위 section의 맨 아래 행, 아래 section의 맨 위 행
+    top = raw_mines(sx, sy + 1, (length - 1) * length)
+    bottom = raw_mines(sx, sy - 1, 0, length)
+
+    top_left = raw_mines(sx - 1, sy + 1, length * length - 1)
+    top_right = raw_mines(sx + 1, sy + 1, (length - 1) * length, (length - 1) * length + 1)
+    bottom_left = raw_mines(sx - 1, sy - 1, length - 1, length)
+    bottom_right = raw_mines(sx + 1, sy - 1, 0, 1)
+
+    grid = bytearray(top_left + top + top_right)
+    for row in range(length):
+        start = row * length
+        grid.append(left[start + length - 1])
+        grid += own[start:start + length]
+        grid.append(right[start])
+    grid += bottom_left + bottom + bottom_right
+
+    return grid
+
+
+def generate_section(sec_p: Point) -> Section:
+    length = Config.LENGTH
+    width = length + 2
+
+    grid = raw_grid(sec_p)
+    counts = Tiles(grid, width, width).neighbor_mines()
+
+    data = bytearray()
+    for row in range(1, length + 1):
+        start = row * width + 1
+        count_row = counts[start:start + length]
+        raw_row = grid[start:start + length]
+
+        # 칸당 값이 RAW_FLAG + 8 이하라 byte 간 올림이 없음
+        total = int.from_bytes(count_row, "big") + (int.from_bytes(raw_row, "big") >> 2)
+        data += total.to_bytes(length, "big").translate(TILE_TABLE)
+
+    return Section(sec_p, Tiles(data, length, length))
+
+
+def is_raw_mine(x: int, y: int) -> bool:
+    length = Config.LENGTH
+    sec_x, rel_x = divmod(x, length)
+    sec_y, rel_y = divmod(y, length)
+
+    idx = (length - rel_y - 1) * length + rel_x
+    return raw_mines(sec_x, sec_y, idx, idx + 1)[0] == MINE_BIT
+
+
+def tile_at(p: Point) -> int:
+    """
+    절대 좌표 p 타일의 생성 직후 byte. section 전체를 만들지 않는다.
+    """
+    count = sum(
+        is_raw_mine(p.x + dx, p.y + dy)
+        for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+        if dx != 0 or dy != 0
+    )
+
+    if is_raw_mine(p.x, p.y) or count == 8:
+        return MINE_BIT
+    return count
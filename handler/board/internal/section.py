@@ -9,6 +9,9 @@ NUM_MASK = 0b00000111
 class Config:
     LENGTH = 100
     MINE_RATIO = 0.3
+    # 설정되면 저장되지 않은 section을 seed로 생성한다.
+    # 서버는 시작할 때 WORLD_SEED 환경 변수로 정한다.
+    SEED: int | None = None
 
 
 def point_abs_to_relate(abs_p: Point):
@@ -1 +1,5 @@
 from .internal.section_storage import SectionStorage
+from .internal.section_cache import SectionCache
+from .internal.shared_section_store import SharedSectionStore
+from .internal.exceptions import SectionStoreFullException, BoardFileException, ReadOnlyStoreException
+from .internal.mmap_section_storage import MmapSectionStorage
@@ -0,0 +1,15 @@
+class SectionStoreFullException(Exception):
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+
+    def __str__(self):
+        return f"shared section store is full (capacity={self.capacity})"
+
+
+class BoardFileException(Exception):
+    pass
+
+
+class ReadOnlyStoreException(Exception):
+    def __str__(self):
+        return "shared section store is attached read-only; send writes to the writer process"
@@ -0,0 +1,248 @@
+"""
+section을 고정 크기 page로 담는 파일을 mmap으로 읽고 쓴다.
+SectionStorage와 같은 get/set/set_many/get_random_sec_point를 제공하며, 모두 인자 그대로 호출한다.
+
+file    = header(ALLOCATIONGRANULARITY) + segment * n
+header  = magic(4s) + version(u32) + length(u32) + page count(u32)
+segment = page * SEGMENT_PAGES (ALLOCATIONGRANULARITY 배수로 올림)
+page    = key(i64) + flag(u8) + padding(7) + data(length²)
+
+- 새 section은 파일 끝 page에 추가하며, page를 다 쓴 뒤 header의 page count를 늘린다.
+- 파일이 커질 때는 segment 단위로 늘리고 새 segment만 따로 mmap 하므로
+  이미 내준 page view는 그대로 유효하다.
+- get은 page를 가리키는 Section을 반환한다. 이 Section의 타일을 바꾸면 page에 바로 쓰이며,
+  같은 Section을 set하면 복사 없이 변경 표시만 한다.
+- 변경된 segment만 기록해 두고 SYNC_INTERVAL_SECONDS마다 별도 thread에서 msync 한다.
+"""
+from data.board import Point, Tiles
+from handler.board.internal.section import Section, Config
+from .exceptions import BoardFileException
+
+from mmap import mmap, ALLOCATIONGRANULARITY
+import asyncio
+import os
+import random
+import struct
+
+MAGIC = b"GMPB"
+VERSION = 1
+
+HEADER = struct.Struct("<4sIII")
+PAGE_HEADER = struct.Struct("<qB7x")
+
+HEADER_SIZE = ALLOCATIONGRANULARITY
+SEGMENT_PAGES = 64
+SYNC_INTERVAL_SECONDS = 1.0
+
+
+class MmapSectionStorage:
+    def __init__(self, path: str, segment_pages: int = SEGMENT_PAGES):
+        self.path = path
+        self.length = Config.LENGTH
+        self.data_size = self.length * self.length
+        self.page_size = PAGE_HEADER.size + self.data_size
+
+        self.segment_pages = segment_pages
+        segment_size = self.page_size * segment_pages
+        self.segment_size = -(-segment_size // ALLOCATIONGRANULARITY) * ALLOCATIONGRANULARITY
+
+        # key -> page index
+        self.pages: dict[int, int] = {}
+        # key -> page data view. 같은 page에 하나만 만든다.
+        self.views: dict[int, memoryview] = {}
+        self.segments: list[mmap] = []
+
+        # msync 할 segment index와 header
+        self.dirty_segments: set[int] = set()
+        self.header_dirty = False
+        self._syncer: asyncio.Task | None = None
+        # thread에서 진행 중인 msync
+        self._syncing: asyncio.Future | None = None
+
+        self._open()
+
+    def _open(self):
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        self.file = open(self.path, "r+b" if exists else "w+b")
+
+        if not exists:
+            self.file.truncate(HEADER_SIZE)
+            self.header = mmap(self.file.fileno(), HEADER_SIZE)
+            HEADER.pack_into(self.header, 0, MAGIC, VERSION, self.length, 0)
+            self.count = 0
+            return
+
+        self.header = mmap(self.file.fileno(), HEADER_SIZE)
+        magic, version, length, count = HEADER.unpack_from(self.header, 0)
+        if magic != MAGIC or version != VERSION:
+            self._close_file()
+            raise BoardFileException(f"not a board file: {self.path}")
+        if length != self.length:
+            self._close_file()
+            raise BoardFileException(f"section length mismatch: {length} != {self.length}")
+
+        file_size = os.path.getsize(self.path)
+        for _ in range((file_size - HEADER_SIZE) // self.segment_size):
+            self._map_segment(len(self.segments))
+
+        # page 헤더로 index 복원
+        self.count = count
+        for page in range(count):
+            segment, offset = self._locate(page)
+            key, _ = PAGE_HEADER.unpack_from(segment, offset)
+            self.pages[key] = page
+
+    async def get_random_sec_point(self) -> Point | None:
+        """
+        저장된 section이 없으면 None
+        """
+        if len(self.pages) == 0:
+            return None
+
+        key = random.choice(list(self.pages))
+        return Point.from_key(key)
+
+    async def get(self, p: Point) -> Section | None:
+        key = p.to_key()
+        page = self.pages.get(key)
+        if page is None:
+            return None
+
+        segment, offset = self._locate(page)
+        _, flag = PAGE_HEADER.unpack_from(segment, offset)
+
+        return Section(
+            point=p,
+            tiles=Tiles(data=self._view(key, page), width=self.length, height=self.length),
+            flag=flag
+        )
+
+    async def set(self, section: Section):
+        self._write(section)
+        self._mark_dirty()
+
+    async def set_many(self, sections: list[Section]):
+        for section in sections:
+            self._write(section)
+        self._mark_dirty()
+
+    def sync(self):
+        """
+        변경된 segment들만 디스크에 반영(msync)
+        """
+        dirty, self.dirty_segments = self.dirty_segments, set()
+        header_dirty, self.header_dirty = self.header_dirty, False
+
+        for index in sorted(dirty):
+            self.segments[index].flush()
+        if header_dirty:
+            self.header.flush()
+
+    async def stop(self):
+        syncer, self._syncer = self._syncer, None
+        if syncer is not None and not syncer.done():
+            syncer.cancel()
+            try:
+                await syncer
+            except asyncio.CancelledError:
+                pass
+
+        # 취소되어도 thread의 msync는 끝까지 진행되므로 기다림
+        if self._syncing is not None:
+            await self._syncing
+            self._syncing = None
+
+        self.sync()
+
+    def close(self):
+        """
+        get으로 받은 Section들을 더 쓰지 않을 때 호출
+        """
+        if self._syncer is not None:
+            self._syncer.cancel()
+        self._syncer = None
+
+        self.sync()
+        for view in self.views.values():
+            view.release()
+        self.views = {}
+
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+        self._close_file()
+
+    def _close_file(self):
+        self.header.close()
+        self.file.close()
+
+    def _write(self, section: Section):
+        assert len(section.tiles.data) == self.data_size
+
+        key = section.point.to_key()
+        page = self.pages.get(key)
+        is_new = page is None
+        if is_new:
+            page = self.count
+            if page // self.segment_pages >= len(self.segments):
+                self._grow()
+
+        segment, offset = self._locate(page)
+        PAGE_HEADER.pack_into(segment, offset, key, section.flag)
+        self.dirty_segments.add(page // self.segment_pages)
+
+        view = self._view(key, page)
+        if section.tiles.data is not view:
+            # get으로 받은 Section이면 이미 page에 쓰여 있음
+            view[:] = section.tiles.data
+
+        if is_new:
+            # page를 다 쓴 뒤에 page count 반영
+            self.pages[key] = page
+            self.count = page + 1
+            HEADER.pack_into(self.header, 0, MAGIC, VERSION, self.length, self.count)
+            self.header_dirty = True
+
+    def _grow(self):
+        index = len(self.segments)
+        self.file.truncate(HEADER_SIZE + (index + 1) * self.segment_size)
+        self._map_segment(index)
+
+    def _map_segment(self, index: int):
+        self.segments.append(mmap(
+            self.file.fileno(),
+            self.segment_size,
+            offset=HEADER_SIZE + index * self.segment_size
+        ))
+
+    def _locate(self, page: int) -> tuple[mmap, int]:
+        segment, idx = divmod(page, self.segment_pages)
+        return self.segments[segment], idx * self.page_size
+
+    def _view(self, key: int, page: int) -> memoryview:
+        view = self.views.get(key)
+        if view is None:
+            segment, offset = self._locate(page)
+            start = offset + PAGE_HEADER.size
+            view = memoryview(segment)[start:start + self.data_size]
+            self.views[key] = view
+        return view
+
+    def _mark_dirty(self):
+        loop = asyncio.get_running_loop()
+        syncer = self._syncer
+        if syncer is not None and not syncer.done() and syncer.get_loop() is loop:
+            return
+
+        self._syncer = loop.create_task(self._run_syncer())
+
+    async def _run_syncer(self):
+        while True:
+            await asyncio.sleep(SYNC_INTERVAL_SECONDS)
+            if len(self.dirty_segments) == 0 and not self.header_dirty:
+                continue
+
+            # msync는 디스크를 기다리므로 event loop 밖에서
+            self._syncing = asyncio.ensure_future(asyncio.to_thread(self.sync))
+            await asyncio.shield(self._syncing)
+            self._syncing = None
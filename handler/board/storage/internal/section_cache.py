@@ -0,0 +1,229 @@
+from data.board import Point
+from handler.board.internal.section import Section, Config
+from handler.board.internal.generator import generate_section
+from .section_storage import SectionStorage
+from .shared_section_store import SharedSectionStore
+
+from collections import OrderedDict
+import asyncio
+import logging
+
+CACHE_SIZE = 1024
+FLUSH_BATCH_SIZE = 64
+FLUSH_INTERVAL_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+class SectionCache:
+    """
+    SectionStorage 앞단의 LRU section cache.
+    - 없는 section은 SectionStorage에서 읽어 캐싱한다.
+    - 변경된 section은 mark_dirty로 표시하고, 백그라운드 writer가
+      FLUSH_BATCH_SIZE 또는 FLUSH_INTERVAL_SECONDS마다 한 트랜잭션으로 저장한다.
+    - CACHE_SIZE를 넘으면 가장 오래 쓰이지 않은 section을 내보낸다.
+      dirty section은 저장이 끝날 때까지 evicted, flushing에 남아 다시 읽힐 수 있다.
+    - Config.SEED가 있으면 저장되지 않은 section은 생성해서 쓰고, 바뀌기 전까지 저장하지 않는다.
+    - storage는 SectionStorage와 같은 get/set_many를 가진 다른 backend(MmapSectionStorage 등)로 바꿀 수 있다.
+    - shared_store가 있으면 여러 프로세스가 공유하는 section store로 쓴다.
+      - writer(create): 읽어오거나 생성한 section, 바뀐 section을 store에도 쓴다.
+      - reader(attach): BoardHandler가 section을 store에서 복사 없이 읽기만 한다.
+    """
+    storage = SectionStorage
+    shared_store: SharedSectionStore | None = None
+
+    sections: OrderedDict[Point, Section] = OrderedDict()
+    dirty: set[Point] = set()
+    # 내보내졌지만 아직 저장되지 않은 section
+    evicted: dict[Point, Section] = {}
+    # 저장 중인 section. set_many가 끝나기 전에 storage에서 옛 내용을 읽지 않도록
+    flushing: dict[Point, Section] = {}
+
+    _writer: asyncio.Task | None = None
+    _wakeup: asyncio.Event | None = None
+    # writer가 저장을 예약했는지. 저장이 끝나 남은 section이 없으면 다시 False
+    _scheduled: bool = False
+
+    @classmethod
+    async def get(cls, point: Point) -> Section | None:
+        section = cls.sections.get(point)
+        if section is not None:
+            cls.sections.move_to_end(point)
+            return section
+
+        section = cls.evicted.pop(point, None)
+        if section is not None:
+            # 저장 대기 중이던 section을 다시 cache로
+            cls.dirty.add(point)
+        elif point in cls.flushing:
+            section = cls.flushing[point]
+        else:
+            section = await cls.storage.get(point)
+            if section is None:
+                if Config.SEED is None:
+                    return None
+                section = generate_section(point)
+
+            # 읽는 사이에 다른 요청이 먼저 올렸을 수 있음
+            if point in cls.sections:
+                return await cls.get(point)
+
+        cls._put(section)
+        cls._share(section)
+        return section
+
+    @classmethod
+    async def get_random_sec_point(cls) -> Point | None:
+        """
+        storage에 저장된 section 중 하나. backend와 상관없이 인자 없이 호출한다.
+        저장된 section이 없으면 Config.SEED가 있을 때는 생성할 수 있는 원점 section, 없으면 None.
+        """
+        point = await cls.storage.get_random_sec_point()
+        if point is None and Config.SEED is not None:
+            # 아직 아무 section도 바뀌지 않은 seed 월드
+            return Point(0, 0)
+        return point
+
+    @classmethod
+    def set(cls, section: Section):
+        """
+        section을 cache에 넣고 저장 대상으로 표시한다.
+        """
+        cls.evicted.pop(section.point, None)
+        cls._put(section)
+        cls.mark_dirty(section.point)
+
+    @classmethod
+    def mark_dirty(cls, point: Point):
+        assert point in cls.sections
+
+        cls.dirty.add(point)
+        cls._share(cls.sections[point])
+
+        cls._ensure_writer()
+        # 예약된 저장이 없으면 예약하고, FLUSH_BATCH_SIZE에 도달하면 바로 저장
+        if not cls._scheduled or cls.pending() >= FLUSH_BATCH_SIZE:
+            cls._scheduled = True
+            cls._wakeup.set()
+
+    @classmethod
+    def pending(cls) -> int:
+        return len(cls.dirty) + len(cls.evicted)
+
+    @classmethod
+    async def flush(cls):
+        while cls.pending() > 0:
+            batch: list[Section] = []
+
+            while len(cls.evicted) > 0 and len(batch) < FLUSH_BATCH_SIZE:
+                point = next(iter(cls.evicted))
+                batch.append(cls.evicted.pop(point))
+
+            while len(cls.dirty) > 0 and len(batch) < FLUSH_BATCH_SIZE:
+                point = cls.dirty.pop()
+                batch.append(cls.sections[point])
+
+            for section in batch:
+                cls.flushing[section.point] = section
+
+            try:
+                await cls.storage.set_many(batch)
+            except BaseException:
+                # 다음 flush에서 다시 저장
+                for section in batch:
+                    if section.point in cls.sections:
+                        cls.dirty.add(section.point)
+                    else:
+                        cls.evicted.setdefault(section.point, section)
+                raise
+            finally:
+                for section in batch:
+                    # 저장하는 사이 다른 section으로 바뀌었으면 남겨둠
+                    if cls.flushing.get(section.point) is section:
+                        del cls.flushing[section.point]
+
+    @classmethod
+    async def stop(cls):
+        """
+        writer를 멈추고 dirty section을 모두 저장
+        """
+        writer, cls._writer = cls._writer, None
+        if writer is not None and not writer.done():
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+
+        await cls.flush()
+
+    @classmethod
+    def clear(cls):
+        """
+        저장하지 않고 cache를 비운다.
+        """
+        if cls._writer is not None:
+            cls._writer.cancel()
+        cls._writer = None
+        cls._scheduled = False
+
+        cls.sections = OrderedDict()
+        cls.dirty = set()
+        cls.evicted = {}
+        cls.flushing = {}
+
+    @classmethod
+    def _put(cls, section: Section):
+        cls.sections[section.point] = section
+        cls.sections.move_to_end(section.point)
+
+        while len(cls.sections) > CACHE_SIZE:
+            point, old = cls.sections.popitem(last=False)
+            if point in cls.dirty:
+                cls.dirty.discard(point)
+                cls.evicted[point] = old
+
+    @classmethod
+    def _share(cls, section: Section):
+        if cls.shared_store is not None and cls.shared_store.writable:
+            cls.shared_store.set(section)
+
+    @classmethod
+    def _ensure_writer(cls):
+        loop = asyncio.get_running_loop()
+
+        writer = cls._writer
+        if writer is not None and not writer.done() and writer.get_loop() is loop:
+            return
+
+        cls._wakeup = asyncio.Event()
+        cls._writer = loop.create_task(cls._run_writer(cls._wakeup))
+        cls._scheduled = False
+
+    @classmethod
+    async def _run_writer(cls, wakeup: asyncio.Event):
+        while True:
+            # 저장이 예약되거나 FLUSH_BATCH_SIZE에 도달하면 깨어남
+            await wakeup.wait()
+            wakeup.clear()
+
+            if cls.pending() < FLUSH_BATCH_SIZE:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), FLUSH_INTERVAL_SECONDS)
+                except TimeoutError:
+                    pass
+                wakeup.clear()
+
+            try:
+                await cls.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("failed to flush sections")
+                # 남은 section은 FLUSH_INTERVAL_SECONDS 뒤에 다시 저장
+                await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+
+            if cls.pending() > 0:
+                wakeup.set()
+            else:
+                cls._scheduled = False
@@ -1,4 +1,5 @@
-from data.board import Point, Section
+from data.board import Point, Tiles, encode_key
+from handler.board.internal.section import Section, Config
 import asyncio
 
 from aiosqlite import Connection
@@ -7,61 +8,122 @@ from db import use_db
 TABLE_NAME = "sections"
 
 
+# key = encode_key(x, y). rowid이므로 section들이 Morton 순서로 저장된다.
+COLUMNS = """(
+    key INTEGER PRIMARY KEY,
+    x INT NOT NULL,
+    y INT NOT NULL,
+    applied_flag INT NOT NULL,
+    data BLOB NOT NULL
+)"""
+
+
 @use_db
 async def init_table(db: Connection):
-    await db.execute(f"""
-    CREATE TABLE IF NOT EXISTS {TABLE_NAME}(
-        x INT NOT NULL,
-        y INT NOT NULL,
-        applied_flag INT NOT NULL,
-        data BLOB NOT NULL
-    )""")
-
-    await db.execute(f"""
-    CREATE UNIQUE INDEX IF NOT EXISTS x_y_idx ON {TABLE_NAME}(
-        x, y
-    )""")
+    await db.execute(f"CREATE TABLE IF NOT EXISTS {TABLE_NAME}{COLUMNS}")
+
+    cur = await db.execute(f"PRAGMA table_info({TABLE_NAME})")
+    columns = [row[1] for row in await cur.fetchall()]
+    if "key" not in columns:
+        await migrate_key(db)
+
+
+async def migrate_key(db: Connection):
+    """
+    (x, y) unique index를 쓰던 이전 table을 key primary key table로 옮긴다.
+    """
+    old_name = f"{TABLE_NAME}_old"
+
+    await db.execute("BEGIN")
+    try:
+        await db.execute(f"ALTER TABLE {TABLE_NAME} RENAME TO {old_name}")
+        await db.execute(f"CREATE TABLE {TABLE_NAME}{COLUMNS}")
+
+        cur = await db.execute(f"SELECT x, y, applied_flag, data FROM {old_name}")
+        rows = [
+            {"key": encode_key(x, y), "x": x, "y": y, "applied_flag": flag, "data": data}
+            for x, y, flag, data in await cur.fetchall()
+        ]
+        await db.executemany(INSERT_QUERY, rows)
+
+        await db.execute(f"DROP TABLE {old_name}")
+        await db.execute("COMMIT")
+    except BaseException:
+        await db.execute("ROLLBACK")
+        raise
+
+
+INSERT_QUERY = f"""
+    INSERT INTO {TABLE_NAME}(key, x, y, applied_flag, data)
+    VALUES (:key, :x, :y, :applied_flag, :data)
+"""
+
+UPSERT_QUERY = INSERT_QUERY + """
+    ON CONFLICT(key) DO UPDATE SET data = :data, applied_flag = :applied_flag
+"""
 
 asyncio.run(init_table())
 
 
+def to_row(section: Section) -> dict:
+    return {
+        "key": section.point.to_key(),
+        "x": section.point.x,
+        "y": section.point.y,
+        "applied_flag": section.flag,
+        "data": bytes(section.tiles.data)
+    }
+
+
 class SectionStorage:
     @use_db
-    async def get_random_sec_point(db: Connection) -> Point:
+    async def get_random_sec_point(db: Connection) -> Point | None:
         """
-        주의: 한개 이상의 섹션이 존재해야 함
+        저장된 section이 없으면 None
+        db는 use_db가 넘기므로 다른 backend처럼 인자 없이 호출한다.
         """
-        row = None
         cur = await db.execute(f"SELECT x, y FROM {TABLE_NAME} ORDER BY RANDOM() LIMIT 1")
         row = await cur.fetchone()
+        if row is None:
+            return None
 
         return Point(x=row[0], y=row[1])
 
     @use_db
     async def get(db: Connection, p: Point) -> Section | None:
         cur = await db.execute(
-            f"SELECT applied_flag, data FROM {TABLE_NAME} WHERE x=:x AND y=:y",
-            {"x": p.x, "y": p.y}
+            f"SELECT applied_flag, data FROM {TABLE_NAME} WHERE key=:key",
+            {"key": p.to_key()}
         )
         row = await cur.fetchone()
 
         if row is None:
             return None
 
-        return Section(p=p, applied_flag=row[0], data=bytearray(row[1]))
+        return Section(
+            point=p,
+            tiles=Tiles(
+                data=bytearray(row[1]),
+                width=Config.LENGTH,
+                height=Config.LENGTH
+            ),
+            flag=row[0]
+        )
 
     @use_db
     async def set(db: Connection, section: Section):
-        await db.execute(
-            f"""
-            INSERT INTO {TABLE_NAME}(x, y, applied_flag, data)
-            VALUES (:x, :y, :applied_flag, :data)
-            ON CONFLICT(x, y) DO UPDATE SET data = :data, applied_flag = :applied_flag
-            """,
-            {
-                "x": section.p.x,
-                "y": section.p.y,
-                "applied_flag": section.applied_flag,
-                "data": section.data
-            }
-        )
+        await db.execute(UPSERT_QUERY, to_row(section))
+
+    @use_db
+    async def set_many(db: Connection, sections: list[Section]):
+        """
+        여러 section을 한 트랜잭션으로 저장
+        """
+        await db.execute("BEGIN")
+        try:
+            await db.executemany(UPSERT_QUERY, [to_row(section) for section in sections])
+            await db.execute("COMMIT")
+        except BaseException:
+            await db.execute("ROLLBACK")
+            raise
+
@@ -0,0 +1,191 @@
+"""
+여러 프로세스가 복사 없이 읽을 수 있는 공유 메모리 section store.
+Config.LENGTH² 크기의 section slab을 slot 단위로 붙여 둔다.
+
+header = capacity(u32) + length(u32) + count(u32)
+slot   = key(i64) + seq(u32) + flag(u8) + data(length²)
+
+- writer 프로세스 하나만 set으로 section을 추가/변경한다.
+  slot은 뒤에만 추가되고, count는 slot을 다 쓴 뒤에 늘린다.
+- slot을 쓰는 동안 seq는 홀수이고, 다 쓰면 짝수가 된다(seqlock).
+  reader는 read로 seq가 짝수이고 읽는 사이 바뀌지 않았을 때의 내용만 쓴다.
+- reader는 attach로 붙어 get으로 slot을 가리키는 읽기 전용 Section을 받는다.
+  모르는 key면 그 사이 늘어난 slot만 다시 훑는다.
+"""
+from data.board import Point, Tiles
+from handler.board.internal.section import Section, Config
+from .exceptions import SectionStoreFullException
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+import struct
+
+HEADER = struct.Struct("<III")
+SLOT_HEADER = struct.Struct("<qIB")
+SEQ = struct.Struct("<I")
+SEQ_OFFSET = 8
+SEQ_MASK = 0xFFFFFFFF
+
+
+class SharedSectionStore:
+    def __init__(self, shm: SharedMemory, writable: bool):
+        self.shm = shm
+        self.writable = writable
+
+        self.capacity, self.length, _ = HEADER.unpack_from(shm.buf, 0)
+        self.data_size = self.length * self.length
+        self.slot_size = SLOT_HEADER.size + self.data_size
+
+        # key -> slot index
+        self.index: dict[int, int] = {}
+        self.known = 0
+
+        # slot index -> slot data를 가리키는 view.
+        # 같은 view를 재사용하고, close에서 모두 release 해야 공유 메모리를 닫을 수 있다.
+        self.views: dict[int, memoryview] = {}
+
+    @staticmethod
+    def create(name: str | None, capacity: int) -> "SharedSectionStore":
+        """
+        writer용. 새 공유 메모리를 만든다.
+        """
+        length = Config.LENGTH
+        size = HEADER.size + capacity * (SLOT_HEADER.size + length * length)
+
+        shm = SharedMemory(name=name, create=True, size=size)
+        HEADER.pack_into(shm.buf, 0, capacity, length, 0)
+
+        return SharedSectionStore(shm, writable=True)
+
+    @staticmethod
+    def attach(name: str) -> "SharedSectionStore":
+        """
+        reader용. 다른 프로세스가 만든 공유 메모리에 붙는다.
+        """
+        return SharedSectionStore(SharedMemory(name=name), writable=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def count(self) -> int:
+        return HEADER.unpack_from(self.shm.buf, 0)[2]
+
+    def get(self, point: Point) -> Section | None:
+        """
+        slot을 그대로 가리키는 Section. reader면 tiles.data는 읽기 전용이다.
+        writer가 나중에 바꾸는 내용도 그대로 보이므로, 한 번에 일관된 내용이 필요하면 read를 쓴다.
+        """
+        slot = self._find(point.to_key())
+        if slot is None:
+            return None
+
+        return self._section(slot, point)
+
+    def read(self, point: Point, reader: Callable[[Section], None]) -> bool:
+        """
+        slot을 가리키는 Section으로 reader를 실행한다.
+        writer가 slot을 쓰는 중이면 기다리고, 실행하는 사이 slot이 바뀌었으면 다시 실행한다.
+        section이 없으면 False.
+        """
+        slot = self._find(point.to_key())
+        if slot is None:
+            return False
+
+        while True:
+            seq = self._seq(slot)
+            if seq & 1:
+                # writer가 쓰는 중
+                continue
+
+            reader(self._section(slot, point))
+
+            if self._seq(slot) == seq:
+                return True
+
+    def set(self, section: Section) -> Section:
+        """
+        section을 slot에 복사하고, slot을 가리키는 Section을 반환한다.
+        반환된 Section의 tiles를 직접 바꾸면 seq가 바뀌지 않으므로, 바꾼 내용은 set으로 다시 쓴다.
+        """
+        assert self.writable
+        assert len(section.tiles.data) == self.data_size
+
+        key = section.point.to_key()
+        slot = self.index.get(key)
+        if slot is None:
+            slot = self.known
+            if slot >= self.capacity:
+                raise SectionStoreFullException(self.capacity)
+
+        offset = self._offset(slot)
+        seq = self._seq(slot)
+
+        # 홀수인 동안 reader는 이 slot을 읽지 않음
+        SLOT_HEADER.pack_into(self.shm.buf, offset, key, (seq + 1) & SEQ_MASK, section.flag)
+        self._data_view(slot)[:] = section.tiles.data
+        SEQ.pack_into(self.shm.buf, offset + SEQ_OFFSET, (seq + 2) & SEQ_MASK)
+
+        if key not in self.index:
+            # slot을 다 쓴 뒤에 reader에게 공개
+            self.index[key] = slot
+            self.known = slot + 1
+            HEADER.pack_into(self.shm.buf, 0, self.capacity, self.length, self.known)
+
+        return self.get(section.point)
+
+    def close(self):
+        """
+        공유 메모리를 닫는다. get/set이 돌려준 Section들은 더 이상 읽을 수 없다.
+        """
+        for view in self.views.values():
+            view.release()
+        self.views = {}
+
+        self.index = {}
+        self.shm.close()
+
+    def unlink(self):
+        assert self.writable
+        self.shm.unlink()
+
+    def _find(self, key: int) -> int | None:
+        slot = self.index.get(key)
+        if slot is not None or self.writable:
+            return slot
+
+        # writer가 그 사이 추가한 slot만 훑음
+        count = self.count()
+        for idx in range(self.known, count):
+            slot_key, _, _ = SLOT_HEADER.unpack_from(self.shm.buf, self._offset(idx))
+            self.index[slot_key] = idx
+        self.known = count
+
+        return self.index.get(key)
+
+    def _section(self, slot: int, point: Point) -> Section:
+        flag = self.shm.buf[self._offset(slot) + SLOT_HEADER.size - 1]
+
+        return Section(
+            point=point,
+            tiles=Tiles(data=self._data_view(slot), width=self.length, height=self.length),
+            flag=flag
+        )
+
+    def _seq(self, slot: int) -> int:
+        return SEQ.unpack_from(self.shm.buf, self._offset(slot) + SEQ_OFFSET)[0]
+
+    def _offset(self, slot: int) -> int:
+        return HEADER.size + slot * self.slot_size
+
+    def _data_view(self, slot: int) -> memoryview:
+        view = self.views.get(slot)
+        if view is None:
+            start = self._offset(slot) + SLOT_HEADER.size
+            view = self.shm.buf[start:start + self.data_size]
+            if not self.writable:
+                readonly = view.toreadonly()
+                view.release()
+                view = readonly
+            self.views[slot] = view
+        return view
@@ -1 +1,4 @@
 from .section_storage_test import SectionStorageTestCase
+from .section_cache_test import SectionCache_TestCase
+from .shared_section_store_test import SharedSectionStore_TestCase
+from .mmap_section_storage_test import MmapSectionStorage_TestCase
@@ -1,16 +1,29 @@
-from data.board import Section, Point
+from data.board import Point, Tiles
+from handler.board import Section, Config
 from handler.board.storage import SectionStorage
 
 from db import get_db
 
 
+def make_tiles(data: list[int]) -> Tiles:
+    return Tiles(
+        data=bytearray(data),
+        width=Config.LENGTH,
+        height=Config.LENGTH
+    )
+
+
+def make_section(p: Point) -> Section:
+    return Section(p, make_tiles([0] * (Config.LENGTH * Config.LENGTH)))
+
+
 async def setup_board():
     """
     /docs/example-map-state.png
     """
     await teardown_board()
 
-    Section.LENGTH = 4
+    Config.LENGTH = 4
 
     # # (x, y)
     # # applied_flag를 위해 반대되는 방향을 대칭되게 배치
@@ -20,30 +33,30 @@ async def setup_board():
     # ]
 
     sections = [
-        Section(Point(0, 0), bytearray([
+        Section(Point(0, 0), make_tiles([
             0b00000000, 0b00000000, 0b00000000, 0b00000000,
             0b00000001, 0b00000001, 0b00000001, 0b00000000,
             0b10000001, 0b01110000, 0b00000001, 0b00000000,
             0b10000001, 0b00000001, 0b00000001, 0b00000000
-        ]), applied_flag=0b10010010),
-        Section(Point(-1, 0), bytearray([
+        ]), flag=0b10010010),
+        Section(Point(-1, 0), make_tiles([
             0b00000001, 0b00000010, 0b00000010, 0b00000001,
             0b00000001, 0b01000000, 0b01000000, 0b00000001,
             0b00000001, 0b00000010, 0b10000010, 0b10000001,
             0b00000001, 0b00100001, 0b10000001, 0b10000000
-        ]), applied_flag=0b11100000),
-        Section(Point(-1, -1),  bytearray([
+        ]), flag=0b11100000),
+        Section(Point(-1, -1), make_tiles([
             0b00000001, 0b01000000, 0b10000010, 0b10000001,
             0b10000001, 0b10000001, 0b10000011, 0b01101000,
             0b10000000, 0b10000000, 0b10000010, 0b01000000,
             0b11000000, 0b10000000, 0b10000001, 0b00000001
-        ]), applied_flag=0b01001001),
-        Section(Point(0, -1),  bytearray([
+        ]), flag=0b01001001),
+        Section(Point(0, -1), make_tiles([
             0b10000001, 0b00111001, 0b00000001, 0b00000001,
             0b00000011, 0b00000010, 0b01000000, 0b00000001,
             0b00000011, 0b01000000, 0b00000010, 0b00000001,
             0b00000010, 0b00000001, 0b00000001, 0b00000000
-        ]), applied_flag=0b00000111)
+        ]), flag=0b00000111)
     ]
 
     for section in sections:
@@ -0,0 +1,158 @@
+from data.board import Point
+from handler.board import Config
+from handler.board.storage import MmapSectionStorage, BoardFileException, SectionCache
+from .fixtures import make_section
+
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+import asyncio
+import os
+import unittest
+
+SYNC_INTERVAL_PATH = "handler.board.storage.internal.mmap_section_storage.SYNC_INTERVAL_SECONDS"
+
+
+class MmapSectionStorage_TestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        length = patch.object(Config, "LENGTH", 4)
+        length.start()
+        self.addCleanup(length.stop)
+
+        self.dir = TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = os.path.join(self.dir.name, "board.bin")
+
+        self.storage = MmapSectionStorage(self.path, segment_pages=2)
+
+    def tearDown(self):
+        self.storage.close()
+
+    def reopen(self):
+        self.storage.close()
+        self.storage = MmapSectionStorage(self.path, segment_pages=2)
+
+    async def test_get_not_exists(self):
+        self.assertIsNone(await self.storage.get(Point(0, 0)))
+
+    async def test_set_get(self):
+        sec = make_section(Point(1, -1))
+        sec.tiles.data[0] = 0b10000000
+        sec.flag = 0b00000001
+
+        await self.storage.set(sec)
+
+        got = await self.storage.get(sec.point)
+        self.assertEqual(got, sec)
+
+    async def test_reopen(self):
+        secs = [make_section(Point(x, 0)) for x in range(5)]
+        for x, sec in enumerate(secs):
+            sec.tiles.data[0] = x
+
+        # segment 3개에 나눠 저장됨
+        await self.storage.set_many(secs)
+        self.reopen()
+
+        for sec in secs:
+            self.assertEqual(await self.storage.get(sec.point), sec)
+
+    async def test_in_place_update(self):
+        await self.storage.set(make_section(Point(0, 0)))
+
+        got = await self.storage.get(Point(0, 0))
+        got.tiles.data[5] = 0b10000001
+        await self.storage.set(got)
+        del got
+
+        self.reopen()
+
+        saved = await self.storage.get(Point(0, 0))
+        self.assertEqual(saved.tiles.data[5], 0b10000001)
+
+    async def test_set_update(self):
+        sec = make_section(Point(0, 0))
+        await self.storage.set(sec)
+
+        sec.tiles.data[0] = 0b11111111
+        await self.storage.set(sec)
+
+        self.assertEqual(self.storage.count, 1)
+        updated = await self.storage.get(sec.point)
+        self.assertEqual(updated.tiles.data[0], 0b11111111)
+
+    async def test_get_random_sec_point(self):
+        sec = make_section(Point(-3, 2))
+        await self.storage.set(sec)
+
+        self.assertEqual(await self.storage.get_random_sec_point(), sec.point)
+
+    async def test_get_random_sec_point_empty(self):
+        self.assertIsNone(await self.storage.get_random_sec_point())
+
+    async def test_section_cache_random_sec_point(self):
+        sec = make_section(Point(-3, 2))
+        await self.storage.set(sec)
+
+        with patch.object(SectionCache, "storage", self.storage):
+            self.assertEqual(await SectionCache.get_random_sec_point(), sec.point)
+
+    async def test_dirty_segments(self):
+        # segment 3개에 나눠 저장됨
+        secs = [make_section(Point(x, 0)) for x in range(5)]
+        await self.storage.set_many(secs)
+
+        self.assertEqual(self.storage.dirty_segments, {0, 1, 2})
+        self.assertTrue(self.storage.header_dirty)
+
+        self.storage.sync()
+        self.assertEqual(self.storage.dirty_segments, set())
+        self.assertFalse(self.storage.header_dirty)
+
+        # 이미 있는 page를 바꾸면 그 segment만
+        secs[2].tiles.data[0] = 1
+        await self.storage.set(secs[2])
+        self.assertEqual(self.storage.dirty_segments, {1})
+        self.assertFalse(self.storage.header_dirty)
+
+        await self.storage.stop()
+
+    @patch(SYNC_INTERVAL_PATH, 0.01)
+    async def test_syncer_thread(self):
+        with patch.object(asyncio, "to_thread", side_effect=asyncio.to_thread) as to_thread:
+            await self.storage.set(make_section(Point(0, 0)))
+            await asyncio.sleep(0.05)
+
+            # msync는 event loop 밖에서, 변경이 없으면 하지 않음
+            to_thread.assert_called_once_with(self.storage.sync)
+            self.assertEqual(self.storage.dirty_segments, set())
+
+        await self.storage.stop()
+
+    async def test_length_mismatch(self):
+        self.storage.close()
+
+        with patch.object(Config, "LENGTH", 8):
+            with self.assertRaises(BoardFileException):
+                MmapSectionStorage(self.path)
+
+        self.storage = MmapSectionStorage(self.path, segment_pages=2)
+
+    async def test_section_cache(self):
+        sec = make_section(Point(0, 0))
+        await self.storage.set(sec)
+
+        SectionCache.clear()
+        with patch.object(SectionCache, "storage", self.storage):
+            got = await SectionCache.get(sec.point)
+            got.tiles.data[1] = 0b10000001
+            SectionCache.mark_dirty(sec.point)
+            await SectionCache.stop()
+        SectionCache.clear()
+        del got
+
+        saved = await self.storage.get(sec.point)
+        self.assertEqual(saved.tiles.data[1], 0b10000001)
+
+
+if __name__ == "__main__":
+    unittest.main()
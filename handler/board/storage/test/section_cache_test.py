@@ -0,0 +1,170 @@
+from data.board import Point
+from handler.board.storage import SectionCache, SectionStorage
+from .fixtures import teardown_board, make_section
+
+from unittest.mock import patch
+import unittest
+import asyncio
+
+CACHE_SIZE_PATH = "handler.board.storage.internal.section_cache.CACHE_SIZE"
+FLUSH_INTERVAL_PATH = "handler.board.storage.internal.section_cache.FLUSH_INTERVAL_SECONDS"
+
+
+class SectionCache_TestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        SectionCache.clear()
+
+    async def asyncTearDown(self):
+        SectionCache.clear()
+        await teardown_board()
+
+    async def test_get_miss_load(self):
+        sec = make_section(Point(0, 0))
+        await SectionStorage.set(sec)
+
+        got = await SectionCache.get(sec.point)
+
+        self.assertEqual(got, sec)
+        self.assertIn(sec.point, SectionCache.sections)
+        self.assertEqual(SectionCache.pending(), 0)
+
+    async def test_get_not_exists(self):
+        got = await SectionCache.get(Point(0, 0))
+
+        self.assertIsNone(got)
+        self.assertEqual(len(SectionCache.sections), 0)
+
+    async def test_get_hit(self):
+        sec = make_section(Point(0, 0))
+        SectionCache.set(sec)
+
+        got = await SectionCache.get(sec.point)
+
+        self.assertIs(got, sec)
+
+    async def test_mark_dirty_flush(self):
+        sec = make_section(Point(0, 0))
+        SectionCache.set(sec)
+        await SectionCache.flush()
+
+        sec.tiles.data[0] = 0b10000000
+        SectionCache.mark_dirty(sec.point)
+        self.assertEqual(SectionCache.pending(), 1)
+
+        await SectionCache.flush()
+
+        self.assertEqual(SectionCache.pending(), 0)
+        saved = await SectionStorage.get(sec.point)
+        self.assertEqual(saved.tiles.data[0], 0b10000000)
+
+    @patch(CACHE_SIZE_PATH, 2)
+    async def test_evict_lru(self):
+        a, b, c = (make_section(Point(x, 0)) for x in range(3))
+        await SectionStorage.set_many([a, b, c])
+
+        await SectionCache.get(a.point)
+        await SectionCache.get(b.point)
+        # a를 최근에 사용
+        await SectionCache.get(a.point)
+        await SectionCache.get(c.point)
+
+        self.assertEqual(list(SectionCache.sections), [a.point, c.point])
+        self.assertEqual(SectionCache.pending(), 0)
+
+    @patch(CACHE_SIZE_PATH, 1)
+    async def test_evict_dirty(self):
+        a, b = make_section(Point(0, 0)), make_section(Point(1, 0))
+
+        SectionCache.set(a)
+        SectionCache.set(b)
+
+        self.assertNotIn(a.point, SectionCache.sections)
+        self.assertIn(a.point, SectionCache.evicted)
+
+        # 저장 전에 다시 읽어도 같은 section
+        got = await SectionCache.get(a.point)
+        self.assertIs(got, a)
+
+        await SectionCache.stop()
+
+        self.assertEqual(SectionCache.pending(), 0)
+        self.assertEqual(await SectionStorage.get(a.point), a)
+        self.assertEqual(await SectionStorage.get(b.point), b)
+
+    @patch(CACHE_SIZE_PATH, 1)
+    async def test_get_while_flushing(self):
+        a, b = make_section(Point(0, 0)), make_section(Point(1, 0))
+        await SectionStorage.set_many([a])
+
+        a = await SectionCache.get(a.point)
+        a.tiles.data[0] = 0b10000001
+        SectionCache.mark_dirty(a.point)
+        # a가 evicted로 밀려남
+        SectionCache.set(b)
+
+        set_many = SectionStorage.set_many
+        release = asyncio.Event()
+
+        async def slow_set_many(sections):
+            await release.wait()
+            await set_many(sections)
+
+        with patch.object(SectionStorage, "set_many", slow_set_many):
+            flush = asyncio.create_task(SectionCache.flush())
+            await asyncio.sleep(0)
+
+            # 저장이 끝나기 전에 읽어도 storage의 옛 내용이 아님
+            got = await SectionCache.get(a.point)
+            self.assertIs(got, a)
+
+            release.set()
+            await flush
+
+        self.assertEqual(SectionCache.flushing, {})
+        self.assertEqual(await SectionStorage.get(a.point), a)
+
+    @patch(FLUSH_INTERVAL_PATH, 0.01)
+    async def test_writer_flush_interval(self):
+        sec = make_section(Point(0, 0))
+        SectionCache.set(sec)
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(SectionCache.pending(), 0)
+        self.assertEqual(await SectionStorage.get(sec.point), sec)
+
+    @patch(FLUSH_INTERVAL_PATH, 0.01)
+    async def test_writer_retry_failed(self):
+        a = make_section(Point(0, 0))
+        b = make_section(Point(1, 0))
+
+        set_many = SectionStorage.set_many
+        calls = []
+
+        async def fail_once(sections):
+            calls.append(len(sections))
+            if len(calls) == 1:
+                raise Exception("disk I/O error")
+            await set_many(sections)
+
+        with patch.object(SectionStorage, "set_many", fail_once):
+            with self.assertLogs("handler.board.storage.internal.section_cache", level="ERROR"):
+                SectionCache.set(a)
+                SectionCache.set(b)
+                await asyncio.sleep(0.1)
+
+        # 더 바뀐 section이 없어도 실패한 section을 다시 저장
+        self.assertEqual(calls, [2, 2])
+        self.assertEqual(SectionCache.pending(), 0)
+        self.assertEqual(await SectionStorage.get(a.point), a)
+
+        # 저장이 끝나면 다음 mark_dirty가 다시 예약함
+        a.tiles.data[0] = 1
+        SectionCache.mark_dirty(a.point)
+        await asyncio.sleep(0.05)
+        self.assertEqual(await SectionStorage.get(a.point), a)
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
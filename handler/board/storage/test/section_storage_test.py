@@ -1,6 +1,10 @@
-from data.board import Point, Section
+from data.board import Point
+from handler.board import Section
 from handler.board.storage import SectionStorage
-from .fixtures import teardown_board
+from handler.board.storage.internal.section_storage import migrate_key
+from .fixtures import teardown_board, make_section
+
+from db import get_db
 
 import unittest
 
@@ -10,7 +14,7 @@ class SectionStorageTestCase(unittest.IsolatedAsyncioTestCase):
         await teardown_board()
 
     async def test_set_create(self):
-        sec = Section.create(Point(0, 0))
+        sec = make_section(Point(0, 0))
 
         await SectionStorage.set(sec)
 
@@ -19,31 +23,80 @@ class SectionStorageTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(section)
 
     async def test_get(self):
-        sec = Section.create(Point(1, -1))
+        sec = make_section(Point(1, -1))
         await SectionStorage.set(sec)
 
-        got = await SectionStorage.get(sec.p)
+        got = await SectionStorage.get(sec.point)
         self.assertIsNotNone(got)
         self.assertEqual(type(got), Section)
-        self.assertEqual(got.p, sec.p)
-        self.assertEqual(got.data, sec.data)
+        self.assertEqual(got.point, sec.point)
+        self.assertEqual(got.tiles, sec.tiles)
 
     async def test_set_update(self):
-        sec = Section.create(Point(0, 0))
+        sec = make_section(Point(0, 0))
         await SectionStorage.set(sec)
 
-        sec.data[0] = 0b11111111
+        sec.tiles.data[0] = 0b11111111
 
         await SectionStorage.set(sec)
 
-        updated = await SectionStorage.get(sec.p)
+        updated = await SectionStorage.get(sec.point)
         self.assertIsNotNone(updated)
-        self.assertEqual(updated.data[0], 0b11111111)
+        self.assertEqual(updated.tiles.data[0], 0b11111111)
+
+    async def test_set_many(self):
+        secs = [make_section(Point(x, 0)) for x in range(3)]
+        secs[1].tiles.data[0] = 0b10000000
+        secs[2].flag = 0b00000001
+
+        await SectionStorage.set_many(secs)
+
+        for sec in secs:
+            got = await SectionStorage.get(sec.point)
+            self.assertEqual(got, sec)
 
     async def test_get_random_sec_point(self):
-        sec = Section.create(Point(0, 0))
+        sec = make_section(Point(0, 0))
         await SectionStorage.set(sec)
 
         p = await SectionStorage.get_random_sec_point()
 
-        self.assertEqual(p, sec.p)
+        self.assertEqual(p, sec.point)
+
+    async def test_get_random_sec_point_empty(self):
+        self.assertIsNone(await SectionStorage.get_random_sec_point())
+
+    async def test_key(self):
+        sec = make_section(Point(-2, 3))
+        await SectionStorage.set(sec)
+
+        db = await get_db()
+        cur = await db.execute("SELECT key FROM sections")
+        row = await cur.fetchone()
+        await db.close()
+
+        self.assertEqual(row[0], sec.point.to_key())
+
+    async def test_migrate_key(self):
+        sec = make_section(Point(1, -1))
+        sec.flag = 0b00000001
+
+        db = await get_db()
+        await db.execute("DROP TABLE sections")
+        await db.execute("""
+        CREATE TABLE sections(
+            x INT NOT NULL,
+            y INT NOT NULL,
+            applied_flag INT NOT NULL,
+            data BLOB NOT NULL
+        )""")
+        await db.execute("CREATE UNIQUE INDEX x_y_idx ON sections(x, y)")
+        await db.execute(
+            "INSERT INTO sections(x, y, applied_flag, data) VALUES (?, ?, ?, ?)",
+            (1, -1, sec.flag, bytes(sec.tiles.data))
+        )
+
+        await migrate_key(db)
+        await db.close()
+
+        self.assertEqual(await SectionStorage.get(sec.point), sec)
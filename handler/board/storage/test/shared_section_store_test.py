@@ -0,0 +1,201 @@
+from data.board import Point, PointRange
+from handler.board import BoardHandler, Config
+from handler.board.storage import SharedSectionStore, SectionStoreFullException, ReadOnlyStoreException, SectionCache, SectionStorage
+from .fixtures import make_section, teardown_board
+
+from unittest.mock import AsyncMock, patch
+import unittest
+import threading
+
+
+class SharedSectionStore_TestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        length = patch.object(Config, "LENGTH", 4)
+        length.start()
+        self.addCleanup(length.stop)
+
+        self.writer = SharedSectionStore.create(None, capacity=2)
+        self.reader = SharedSectionStore.attach(self.writer.name)
+
+    def tearDown(self):
+        self.reader.close()
+        self.writer.close()
+        self.writer.unlink()
+
+    def test_get(self):
+        sec = make_section(Point(1, -1))
+        sec.tiles.data[0] = 0b10000000
+        sec.flag = 0b00000001
+
+        self.writer.set(sec)
+
+        got = self.reader.get(sec.point)
+        self.assertEqual(got.point, sec.point)
+        self.assertEqual(bytes(got.tiles.data), bytes(sec.tiles.data))
+        self.assertEqual(got.flag, sec.flag)
+        del got
+
+    def test_get_not_exists(self):
+        self.assertIsNone(self.reader.get(Point(0, 0)))
+
+    def test_zero_copy(self):
+        sec = make_section(Point(0, 0))
+
+        shared = self.writer.set(sec)
+        got = self.reader.get(sec.point)
+
+        # writer가 바꾼 내용이 reader에게 바로 보임
+        shared.tiles.data[3] = 0b10000001
+        self.assertEqual(got.tiles.data[3], 0b10000001)
+
+        with self.assertRaises(TypeError):
+            got.tiles.data[3] = 0
+        del shared, got
+
+    def test_set_update(self):
+        sec = make_section(Point(0, 0))
+        self.writer.set(sec)
+
+        sec.tiles.data[0] = 0b10000000
+        self.writer.set(sec)
+
+        self.assertEqual(self.writer.count(), 1)
+        got = self.reader.get(sec.point)
+        self.assertEqual(got.tiles.data[0], 0b10000000)
+        del got
+
+    def test_read(self):
+        sec = make_section(Point(0, 0))
+        sec.tiles.data[0] = 0b10000000
+        self.writer.set(sec)
+
+        copied = []
+        found = self.reader.read(sec.point, lambda got: copied.append(bytes(got.tiles.data)))
+
+        self.assertTrue(found)
+        self.assertEqual(copied, [bytes(sec.tiles.data)])
+        self.assertFalse(self.reader.read(Point(1, 0), lambda got: None))
+
+    def test_read_retry(self):
+        sec = make_section(Point(0, 0))
+        self.writer.set(sec)
+
+        copied = []
+
+        def copy(got):
+            copied.append(bytes(got.tiles.data))
+            if len(copied) == 1:
+                # 읽는 사이 writer가 slot을 바꿈
+                sec.tiles.data[0] = 0b10000000
+                self.writer.set(sec)
+
+        self.reader.read(sec.point, copy)
+
+        self.assertEqual(len(copied), 2)
+        self.assertEqual(copied[-1], bytes(sec.tiles.data))
+
+    def test_read_wait_writing(self):
+        sec = make_section(Point(0, 0))
+        self.writer.set(sec)
+
+        # writer가 slot을 쓰는 중인 상태(seq 홀수)
+        seq = self.writer._seq(0)
+        self.writer.shm.buf[self.writer._offset(0) + 8] = seq + 1
+
+        def finish():
+            self.writer.shm.buf[self.writer._offset(0) + 8] = seq + 2
+
+        copied = []
+        timer = threading.Timer(0.05, finish)
+        timer.start()
+        self.reader.read(sec.point, lambda got: copied.append(self.reader._seq(0)))
+        timer.join()
+
+        # 다 쓰인 뒤(seq 짝수)에만 읽음
+        self.assertEqual(len(copied), 1)
+        self.assertEqual(copied[0] % 2, 0)
+
+    def test_close_alive_sections(self):
+        self.writer.set(make_section(Point(0, 0)))
+        got = self.reader.get(Point(0, 0))
+
+        # 살아있는 Section이 있어도 닫힘
+        self.reader.close()
+
+        with self.assertRaises(ValueError):
+            got.tiles.data[0]
+
+        self.reader = SharedSectionStore.attach(self.writer.name)
+
+    def test_full(self):
+        self.writer.set(make_section(Point(0, 0)))
+        self.writer.set(make_section(Point(1, 0)))
+
+        with self.assertRaises(SectionStoreFullException):
+            self.writer.set(make_section(Point(2, 0)))
+
+    async def test_board_fetch(self):
+        self.writer.set(make_section(Point(0, 0)))
+        shared = self.writer.set(make_section(Point(1, 0)))
+        shared.tiles.data[12] = 0b10000001
+
+        with patch.object(SectionCache, "shared_store", self.reader):
+            tiles = await BoardHandler.fetch(PointRange(Point(3, 0), Point(4, 0)))
+
+        self.assertEqual(tiles.data, bytearray([0, 0b10000001]))
+        del shared
+
+    async def test_board_reader_write(self):
+        self.writer.set(make_section(Point(0, 0)))
+
+        with patch.object(SectionCache, "shared_store", self.reader):
+            with self.assertRaises(ReadOnlyStoreException):
+                await BoardHandler.togle_flag(Point(1, 1))
+            with self.assertRaises(ReadOnlyStoreException):
+                await BoardHandler.open_tiles(Point(1, 1))
+
+        got = self.reader.get(Point(0, 0))
+        self.assertEqual(got.tiles.data[9], 0)
+        del got
+
+    @patch("handler.board.internal.board.EventBroker.publish", new_callable=AsyncMock)
+    async def test_board_writer_publish(self, publish: AsyncMock):
+        SectionCache.clear()
+        self.addCleanup(SectionCache.clear)
+        SectionCache.set(make_section(Point(0, 0)))
+
+        with patch.object(SectionCache, "shared_store", self.writer):
+            await BoardHandler.togle_flag(Point(1, 1))
+
+        # writer에서 바뀐 section이 reader에게 보임
+        got = self.reader.get(Point(0, 0))
+        self.assertIsNotNone(got)
+        self.assertEqual(bytes(got.tiles.data), bytes(SectionCache.sections[Point(0, 0)].tiles.data))
+        self.assertNotEqual(got.tiles.data[9], 0)
+        del got
+
+        with patch.object(SectionCache, "shared_store", self.reader):
+            tiles = await BoardHandler.fetch(PointRange(Point(1, 1), Point(1, 1)))
+        self.assertTrue(tiles.at_tile(Point(0, 0)).is_flag)
+
+    async def test_cache_load_publish(self):
+        SectionCache.clear()
+        self.addCleanup(SectionCache.clear)
+        self.addAsyncCleanup(teardown_board)
+
+        sec = make_section(Point(1, 0))
+        sec.tiles.data[5] = 0b10000001
+        await SectionStorage.set(sec)
+
+        # 읽기만 해도 reader에게 보임
+        with patch.object(SectionCache, "shared_store", self.writer):
+            await SectionCache.get(sec.point)
+
+        got = self.reader.get(sec.point)
+        self.assertIsNotNone(got)
+        self.assertEqual(bytes(got.tiles.data), bytes(sec.tiles.data))
+        del got
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+A -> (0, 0), B -> (1, 0), LENGTH = 3
+F: 깃발, 숫자: 닫힌 숫자 타일, 0: 닫힌 빈 타일
+
+000 111
+001 111
+F01 111
+
+open(1, 1)
+->
+A는 깃발을 제외하고 모두 열림
+B는 A의 (2, 2) 빈 타일과 맞닿은 (3, 2), (3, 1)만 열림
+"""
+from data.board import Tiles, Point, PointRange
+from handler.board import Section
+from handler.board.internal.cascade import open_cascade, OPEN_BIT, FLAG_BIT
+from handler.board.storage import SectionCache
+
+from unittest import IsolatedAsyncioTestCase as AsyncTestCase
+
+F = FLAG_BIT
+
+
+def make_section(p: Point, data: list[int]):
+    return Section(p, Tiles(bytearray(data), 3, 3))
+
+
+class OpenCascade_TestCase(AsyncTestCase):
+    async def asyncSetUp(self):
+        SectionCache.clear()
+
+        self.a = make_section(Point(0, 0), [
+            0, 0, 0,
+            0, 0, 1,
+            F, 0, 1
+        ])
+        self.b = make_section(Point(1, 0), [1] * 9)
+
+        SectionCache.set(self.a)
+        SectionCache.set(self.b)
+        await SectionCache.flush()
+
+    def tearDown(self):
+        SectionCache.clear()
+
+    async def test_cascade(self):
+        ranges = await open_cascade(self.a, Point(1, 1))
+
+        self.assertEqual(self.a.tiles.data, bytearray([
+            OPEN_BIT, OPEN_BIT, OPEN_BIT,
+            OPEN_BIT, OPEN_BIT, OPEN_BIT | 1,
+            F, OPEN_BIT, OPEN_BIT | 1
+        ]))
+        self.assertEqual(self.b.tiles.data, bytearray([
+            OPEN_BIT | 1, 1, 1,
+            OPEN_BIT | 1, 1, 1,
+            1, 1, 1
+        ]))
+
+        self.assertEqual(len(ranges), 2)
+        self.assertIn(PointRange(Point(0, 2), Point(2, 0)), ranges)
+        self.assertIn(PointRange(Point(3, 2), Point(3, 1)), ranges)
+
+        self.assertEqual(SectionCache.dirty, {self.a.point, self.b.point})
+
+    async def test_number_tile(self):
+        ranges = await open_cascade(self.b, Point(1, 1))
+
+        self.assertEqual(self.b.tiles.data[4], OPEN_BIT | 1)
+        self.assertEqual(self.b.tiles.data.count(1), 8)
+        self.assertEqual(ranges, [PointRange(Point(4, 1), Point(4, 1))])
+
+    async def test_flag_tile(self):
+        ranges = await open_cascade(self.a, Point(0, 0))
+
+        self.assertEqual(ranges, [])
+        self.assertEqual(self.a.tiles.data[6], F)
+        self.assertEqual(SectionCache.pending(), 0)
+
+    async def test_opened_tile(self):
+        await open_cascade(self.b, Point(0, 0))
+
+        ranges = await open_cascade(self.b, Point(0, 0))
+
+        self.assertEqual(ranges, [])
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
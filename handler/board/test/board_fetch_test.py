@@ -18,6 +18,7 @@ fetch(R(P(-1, 0), P(0, -1)))
 """
 from data.board import Tiles, Point, PointRange
 from handler.board import Section, BoardHandler
+from handler.board.storage import SectionCache
 
 
 from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
@@ -43,13 +44,13 @@ SEC_4 = Section(Point(0, -1), make_tiles(4))
 
 
 class BoardHandler_TestCase(AsyncTestCase):
-    def setUp(self) -> None:
-        BoardHandler.section_dict = {
-            SEC_1.point: SEC_1,
-            SEC_2.point: SEC_2,
-            SEC_3.point: SEC_3,
-            SEC_4.point: SEC_4
-        }
+    async def asyncSetUp(self) -> None:
+        SectionCache.clear()
+        for sec in (SEC_1, SEC_2, SEC_3, SEC_4):
+            SectionCache.set(sec)
+
+    def tearDown(self) -> None:
+        SectionCache.clear()
 
     @patch("Config")
     async def test_fetch_normal(self, config):
@@ -66,6 +67,53 @@ class BoardHandler_TestCase(AsyncTestCase):
             res.data, bytearray([1, 2, 3, 4])
         )
 
+    @patch("Config")
+    async def test_fetch_partial(self, config):
+        """
+        section 경계에 걸친 일부 영역
+        1122
+        1122
+        3344
+        3344
+        ->
+        12
+        12
+        """
+        config.LENGTH = 2
+
+        res = await BoardHandler.fetch(
+            PointRange(
+                Point(-1, 1),
+                Point(0, 0)
+            )
+        )
+
+        self.assertEqual(res.width, 2)
+        self.assertEqual(res.height, 2)
+        self.assertEqual(
+            res.data, bytearray([1, 2, 1, 2])
+        )
+
+    @patch("Config")
+    async def test_fetch_whole(self, config):
+        config.LENGTH = 2
+
+        res = await BoardHandler.fetch(
+            PointRange(
+                Point(-2, 1),
+                Point(1, -2)
+            )
+        )
+
+        self.assertEqual(
+            res.data, bytearray([
+                1, 1, 2, 2,
+                1, 1, 2, 2,
+                3, 3, 4, 4,
+                3, 3, 4, 4
+            ])
+        )
+
 
 if __name__ == "__main__":
     from unittest import main
@@ -1,6 +1,8 @@
 from data.board import Tiles, Point, PointRange, Tile
 from data.cursor import Color
-from handler.board import Section, BoardHandler
+from handler.board import Section, BoardHandler, BoardEvent
+from event.payload import IdPayload
+from handler.board.storage import SectionCache
 
 from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
 from unittest.mock import AsyncMock, MagicMock, call
@@ -11,18 +13,30 @@ patch = PathPatch("handler.board.internal.board")
 
 
 class BoardHandler_TestCase(AsyncTestCase):
+    def tearDown(self) -> None:
+        SectionCache.clear()
+
+    @patch("EventBroker.publish")
     @patch("Config")
     @cases([
         {"sec": get_sec(CLOSE_TILE)},
     ])
-    async def test_open_tile(self, config, sec: Section):
+    async def test_open_tile(self, config, publish, sec: Section):
         setup_sec(sec)
         config.LENGTH = 1
 
-        await BoardHandler.open_tiles(
+        ranges = await BoardHandler.open_tiles(
             POINT
         )
 
+        self.assertEqual(ranges, [POINTRANGE])
+        publish.assert_awaited_once()
+
+        # 바뀐 영역만 보내고 타일은 담지 않음
+        message = publish.call_args.args[0]
+        self.assertEqual(message.event, BoardEvent.UPDATE)
+        self.assertEqual(message.payload, IdPayload(id=POINTRANGE))
+
         closed_tiles = await BoardHandler.fetch(
             POINTRANGE
         )
@@ -5,6 +5,7 @@ close tile에만 깃발 꽂기 가능
 from data.board import Tile, Tiles, Point, PointRange
 from data.cursor import Color
 from handler.board import Section, BoardHandler
+from handler.board.storage import SectionCache
 
 from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
 from unittest.mock import AsyncMock, MagicMock, call
@@ -15,12 +16,16 @@ patch = PathPatch("handler.board.internal.board")
 
 
 class BoardHandler_TestCase(AsyncTestCase):
+    def tearDown(self) -> None:
+        SectionCache.clear()
+
+    @patch("EventBroker.publish")
     @patch("Config")
     @cases([
         {"sec": get_sec(CLOSE_TILE), "exp": True},
         {"sec": get_sec(FLAG_ON_TILE), "exp": False}
     ])
-    async def test_togle_flag_togle(self, config, sec: Section, exp: bool):
+    async def test_togle_flag_togle(self, config, publish, sec: Section, exp: bool):
         setup_sec(sec)
 
         config.LENGTH = 1
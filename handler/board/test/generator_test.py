@@ -0,0 +1,116 @@
+from data.board import Point
+from handler.board import Config, generate_section, tile_at
+from handler.board.storage import SectionCache, SectionStorage
+from handler.board.internal.generator import is_raw_mine
+
+from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
+from unittest.mock import patch, AsyncMock
+
+MINE_BIT = 0b01000000
+NUM_MASK = 0b00000111
+
+
+class Generator_TestCase(TestCase):
+    def setUp(self):
+        for name, value in (("LENGTH", 8), ("SEED", 42), ("MINE_RATIO", 0.3)):
+            patcher = patch.object(Config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_deterministic(self):
+        a = generate_section(Point(3, -2))
+        b = generate_section(Point(3, -2))
+
+        self.assertEqual(a.tiles, b.tiles)
+
+    def test_seed(self):
+        a = generate_section(Point(0, 0))
+        with patch.object(Config, "SEED", 43):
+            b = generate_section(Point(0, 0))
+
+        self.assertNotEqual(a.tiles, b.tiles)
+
+    def test_tile_at(self):
+        # section 경계를 넘는 이웃까지 tile_at과 일치
+        for sec_p in (Point(0, 0), Point(-1, 1)):
+            section = generate_section(sec_p)
+            for rel_y in range(Config.LENGTH):
+                for rel_x in range(Config.LENGTH):
+                    abs_p = Point(sec_p.x * Config.LENGTH + rel_x, sec_p.y * Config.LENGTH + rel_y)
+                    tile = section.tiles.at_tile(Point(rel_x, rel_y))
+
+                    self.assertEqual(tile.data, tile_at(abs_p), abs_p)
+
+    def test_number(self):
+        # 숫자는 실제 주변 지뢰 개수
+        for y in range(-1, Config.LENGTH + 1):
+            for x in range(-1, Config.LENGTH + 1):
+                b = tile_at(Point(x, y))
+                if b & MINE_BIT:
+                    self.assertEqual(b & NUM_MASK, 0)
+                    continue
+
+                mines = sum(
+                    bool(tile_at(Point(x + dx, y + dy)) & MINE_BIT)
+                    for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                    if dx != 0 or dy != 0
+                )
+                self.assertEqual(b, mines, Point(x, y))
+
+    def test_surrounded_tile(self):
+        # 주변 8칸이 모두 지뢰 후보면 그 타일도 지뢰
+        surrounded = 0
+        with patch.object(Config, "MINE_RATIO", 0.9):
+            for y in range(Config.LENGTH):
+                for x in range(Config.LENGTH):
+                    if is_raw_mine(x, y):
+                        continue
+                    if all(
+                        is_raw_mine(x + dx, y + dy)
+                        for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                        if dx != 0 or dy != 0
+                    ):
+                        surrounded += 1
+                        self.assertEqual(tile_at(Point(x, y)), MINE_BIT)
+
+        self.assertGreater(surrounded, 0)
+
+    def test_mine_ratio(self):
+        with patch.object(Config, "LENGTH", 100):
+            section = generate_section(Point(5, 5))
+
+        self.assertAlmostEqual(section.tiles.count_mine() / 10000, 0.3, delta=0.03)
+
+
+class GeneratorSectionCache_TestCase(AsyncTestCase):
+    def setUp(self):
+        SectionCache.clear()
+        for name, value in (("LENGTH", 4), ("SEED", 7)):
+            patcher = patch.object(Config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        SectionCache.clear()
+
+    async def test_lazy(self):
+        section = await SectionCache.get(Point(2, 3))
+
+        self.assertEqual(section.tiles, generate_section(Point(2, 3)).tiles)
+        # 바뀌기 전에는 저장하지 않음
+        self.assertEqual(SectionCache.pending(), 0)
+        self.assertIsNone(await SectionStorage.get(Point(2, 3)))
+
+    async def test_no_seed(self):
+        with patch.object(Config, "SEED", None):
+            self.assertIsNone(await SectionCache.get(Point(2, 3)))
+
+    @patch.object(SectionStorage, "get_random_sec_point", new_callable=AsyncMock, return_value=None)
+    async def test_random_sec_point_empty(self, get_random_sec_point: AsyncMock):
+        # 저장된 section이 없어도 생성할 수 있는 section
+        point = await SectionCache.get_random_sec_point()
+        self.assertEqual(point, Point(0, 0))
+        self.assertEqual((await SectionCache.get(point)).tiles, generate_section(point).tiles)
+
+        with patch.object(Config, "SEED", None):
+            self.assertIsNone(await SectionCache.get_random_sec_point())
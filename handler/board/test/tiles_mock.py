@@ -3,6 +3,7 @@ from handler.board import Section
 from data.cursor import Color
 
 from handler.board import BoardHandler
+from handler.board.storage import SectionCache
 
 POINT = Point(0, 0)
 POINTRANGE = PointRange(POINT, POINT)
@@ -36,6 +37,5 @@ def get_sec(tile: Tile):
 
 
 def setup_sec(sec: Section):
-    BoardHandler.section_dict = {
-        sec.point: sec
-    }
+    SectionCache.clear()
+    SectionCache.set(sec)
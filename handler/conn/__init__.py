@@ -1,2 +1,2 @@
-from .internal.connection_handler import ConnectionHandler, ConnectionEvent
-from .internal.conn import Conn
+from .internal.connection_handler import ConnectionHandler, ConnectionEvent, FanoutResult
+from .internal.conn import Conn, Frame, OverflowPolicy, Protocol, TileEncoding, to_frame, BINARY_SUBPROTOCOL
@@ -0,0 +1,239 @@
+"""
+서버 이벤트 binary framing.
+protos/data/board, protos/data/cursor의 Point, Tiles, Cursor 필드 구성을 따르며
+정수는 varint(부호 있는 값은 zigzag), 타일은 hex 대신 raw bytes로 보낸다.
+
+frame = varint(event code) + body
+
+TILES_STATE
+    varint(개수) + [PointRange + varint(길이) + raw tile bytes] * 개수
+CURSORS_STATE
+    varint(개수) + [string(id) + byte(field mask) + (mask에 있는 필드들)] * 개수
+JSON
+    JSON 텍스트(utf-8) 그대로. binary layout이 없는 이벤트용
+"""
+from data.board import Point, PointRange
+from data.cursor import Color
+from data.conn.event import ServerEvent
+from event.payload import Empty
+
+from datetime import datetime
+from enum import IntEnum
+import json
+
+
+class EventCode(IntEnum):
+    JSON = 0
+    TILES_STATE = 1
+    CURSORS_STATE = 2
+
+
+class BinaryDecodeException(Exception):
+    pass
+
+
+# protos/data/cursor/cursor.proto의 Color 순서
+COLORS = [Color.RED, Color.YELLOW, Color.PURPLE, Color.BLUE]
+COLOR_INDEX = {color: idx for idx, color in enumerate(COLORS)}
+
+# CursorsState.Elem field mask
+POSITION = 1 << 0
+POINTER = 1 << 1
+POINTER_NONE = 1 << 2
+COLOR = 1 << 3
+REVIVE_AT = 1 << 4
+REVIVE_AT_NONE = 1 << 5
+SCORE = 1 << 6
+
+
+def write_varint(buf: bytearray, value: int):
+    assert value >= 0
+    while value > 0x7f:
+        buf.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def write_sint(buf: bytearray, value: int):
+    # zigzag: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ...
+    write_varint(buf, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+
+def write_bytes(buf: bytearray, data: bytes):
+    write_varint(buf, len(data))
+    buf += data
+
+
+def write_point(buf: bytearray, point: Point):
+    write_sint(buf, point.x)
+    write_sint(buf, point.y)
+
+
+def write_range(buf: bytearray, range: PointRange):
+    write_point(buf, range.top_left)
+    write_point(buf, range.bottom_right)
+
+
+class Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def varint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            if self.pos >= len(self.data):
+                raise BinaryDecodeException("unexpected end of frame")
+            b = self.data[self.pos]
+            self.pos += 1
+
+            result |= (b & 0x7f) << shift
+            if not (b & 0x80):
+                return result
+            shift += 7
+
+    def sint(self) -> int:
+        value = self.varint()
+        return (value >> 1) if not (value & 1) else -((value + 1) >> 1)
+
+    def byte(self) -> int:
+        return self.bytes(1)[0]
+
+    def bytes(self, length: int | None = None) -> bytes:
+        if length is None:
+            length = self.varint()
+        end = self.pos + length
+        if end > len(self.data):
+            raise BinaryDecodeException("unexpected end of frame")
+
+        data = self.data[self.pos:end].tobytes()
+        self.pos = end
+        return data
+
+    def rest(self) -> bytes:
+        return self.bytes(len(self.data) - self.pos)
+
+    def point(self) -> Point:
+        return Point(self.sint(), self.sint())
+
+    def range(self) -> PointRange:
+        return PointRange(self.point(), self.point())
+
+
+def encode_tiles_state(buf: bytearray, event: ServerEvent.TilesState):
+    write_varint(buf, len(event.tiles))
+    for elem in event.tiles:
+        write_range(buf, elem.range)
+        write_bytes(buf, bytes.fromhex(elem.data))
+
+
+def decode_tiles_state(reader: Reader) -> ServerEvent.TilesState:
+    tiles = []
+    for _ in range(reader.varint()):
+        point_range = reader.range()
+        data = reader.bytes()
+        tiles.append(ServerEvent.TilesState.Elem(range=point_range, data=data.hex()))
+
+    return ServerEvent.TilesState(tiles=tiles)
+
+
+def encode_cursors_state(buf: bytearray, event: ServerEvent.CursorsState):
+    write_varint(buf, len(event.cursors))
+    for elem in event.cursors:
+        write_bytes(buf, elem.id.encode())
+
+        mask = 0
+        if elem.position is not Empty:
+            mask |= POSITION
+        if elem.pointer is not Empty:
+            mask |= POINTER if elem.pointer is not None else POINTER_NONE
+        if elem.color is not Empty:
+            mask |= COLOR
+        if elem.revive_at is not Empty:
+            mask |= REVIVE_AT if elem.revive_at is not None else REVIVE_AT_NONE
+        if elem.score is not Empty:
+            mask |= SCORE
+        buf.append(mask)
+
+        if mask & POSITION:
+            write_point(buf, elem.position)
+        if mask & POINTER:
+            write_point(buf, elem.pointer)
+        if mask & COLOR:
+            write_varint(buf, COLOR_INDEX[elem.color])
+        if mask & REVIVE_AT:
+            # unix time(μs)
+            write_sint(buf, round(elem.revive_at.timestamp() * 1_000_000))
+        if mask & SCORE:
+            write_sint(buf, elem.score)
+
+
+def decode_cursors_state(reader: Reader) -> ServerEvent.CursorsState:
+    cursors = []
+    for _ in range(reader.varint()):
+        elem = ServerEvent.CursorsState.Elem(id=reader.bytes().decode())
+
+        mask = reader.byte()
+        if mask & POSITION:
+            elem.position = reader.point()
+        if mask & POINTER:
+            elem.pointer = reader.point()
+        elif mask & POINTER_NONE:
+            elem.pointer = None
+        if mask & COLOR:
+            elem.color = COLORS[reader.varint()]
+        if mask & REVIVE_AT:
+            sec, micro = divmod(reader.sint(), 1_000_000)
+            elem.revive_at = datetime.fromtimestamp(sec).replace(microsecond=micro)
+        elif mask & REVIVE_AT_NONE:
+            elem.revive_at = None
+        if mask & SCORE:
+            elem.score = reader.sint()
+
+        cursors.append(elem)
+
+    return ServerEvent.CursorsState(cursors=cursors)
+
+
+def encode_event(event: ServerEvent.Base) -> bytes | None:
+    """
+    binary layout이 없는 이벤트면 None. 이때는 encode_json을 쓴다.
+    """
+    buf = bytearray()
+
+    match event.event_name:
+        case ServerEvent.TilesState.event_name:
+            write_varint(buf, EventCode.TILES_STATE)
+            encode_tiles_state(buf, event)
+        case ServerEvent.CursorsState.event_name:
+            write_varint(buf, EventCode.CURSORS_STATE)
+            encode_cursors_state(buf, event)
+        case _:
+            return None
+
+    return bytes(buf)
+
+
+def encode_json(text: str) -> bytes:
+    buf = bytearray()
+    write_varint(buf, EventCode.JSON)
+    buf += text.encode()
+    return bytes(buf)
+
+
+def decode_event(data: bytes) -> ServerEvent.Base | dict:
+    """
+    binary layout이 있는 이벤트는 ServerEvent로, JSON 이벤트는 dict로 반환한다.
+    """
+    reader = Reader(data)
+
+    match reader.varint():
+        case EventCode.TILES_STATE:
+            return decode_tiles_state(reader)
+        case EventCode.CURSORS_STATE:
+            return decode_cursors_state(reader)
+        case EventCode.JSON:
+            return json.loads(reader.rest())
+        case code:
+            raise BinaryDecodeException(f"unknown event code: {code}")
@@ -1,10 +1,17 @@
 from fastapi.websockets import WebSocket, WebSocketState, WebSocketDisconnect
 from websockets.exceptions import ConnectionClosed
 from event.message import Message
-from dataclasses import dataclass
+from event.payload import ExternalEventPayload, Empty
+from dataclasses import dataclass, field, fields, replace
+from collections import deque
+from enum import Enum
 from uuid import uuid4
-from data.conn.event import from_message, ClientEvent
+from data.conn.event import from_message, ClientEvent, ServerEvent
+from data.board import rle_encode
+from .binary import encode_event, encode_json
+import asyncio
 import json
+import logging
 
 """
 {
@@ -15,24 +22,296 @@ import json
 }
 """
 
+QUEUE_SIZE = 256
+# 한 frame을 보내는 데 기다리는 최대 시간
+SEND_TIMEOUT_SECONDS = 1.0
+
+# 큐가 넘칠 때 합칠 수 있는 이벤트 -> (합칠 list 필드, 같은 대상인지 가리는 원소의 key)
+COALESCE_FIELDS = {
+    "tiles-state": ("tiles", lambda elem: (elem.range.top_left, elem.range.bottom_right)),
+    "cursors-state": ("cursors", lambda elem: elem.id)
+}
+# 합친 frame의 최대 원소 수. 넘으면 합치지 않고 overflow 처리
+COALESCE_MAX_ELEMS = 1024
+
+logger = logging.getLogger(__name__)
+
+
+# 이 subprotocol을 요청한 클라이언트에게는 binary frame을 보냄
+BINARY_SUBPROTOCOL = "gamulpung.binary"
+
+
+class Protocol(Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+
+# /session?tile_encoding=rle 로 TilesState 타일 인코딩을 고름
+TILE_ENCODING_PARAM = "tile_encoding"
+
+
+class TileEncoding(Enum):
+    # JSON에서는 hex, binary에서는 raw bytes
+    RAW = "raw"
+    # data.board.rle_encode 결과. JSON에서는 hex로 감쌈
+    RLE = "rle"
+
+
+class OverflowPolicy(Enum):
+    DROP_OLDEST = "drop-oldest"
+    # 같은 종류의 대기 중인 frame에 합침. 합칠 수 없으면 DROP_OLDEST
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+@dataclass
+class Frame:
+    """
+    connection들에 공유되는 서버 이벤트.
+    (protocol, tile encoding)별 직렬화 결과는 처음 쓰일 때 한 번만 만든다.
+    """
+    event: ServerEvent.Base
+    cache: dict[tuple[Protocol, TileEncoding], str | bytes] = field(default_factory=dict, repr=False)
+
+    @property
+    def text(self) -> str:
+        return self.serialize(Protocol.JSON, TileEncoding.RAW)
+
+    @property
+    def binary(self) -> bytes:
+        return self.serialize(Protocol.BINARY, TileEncoding.RAW)
+
+    def serialize(self, protocol: Protocol, tile_encoding: TileEncoding) -> str | bytes:
+        key = (protocol, tile_encoding)
+        if key in self.cache:
+            return self.cache[key]
+
+        event = self.event
+        if tile_encoding == TileEncoding.RLE:
+            event = encode_tiles(event)
+
+        match protocol:
+            case Protocol.JSON:
+                data = to_text(event)
+            case Protocol.BINARY:
+                data = encode_event(event)
+                if data is None:
+                    data = encode_json(self.serialize(Protocol.JSON, tile_encoding))
+
+        self.cache[key] = data
+        return data
+
+
+def to_text(event: ServerEvent.Base) -> str:
+    # TODO
+    # Payload랑 External Message랑 호환이 안됨
+    msg = Message(
+        event.event_name,
+        payload=ExternalEventPayload(
+            event
+        )
+    )
+    return msg.to_str()
+
+
+def encode_tiles(event: ServerEvent.Base) -> ServerEvent.Base:
+    """
+    TilesState의 타일 data를 RLE로 바꾼 이벤트를 반환한다.
+    """
+    if event.event_name != ServerEvent.TilesState.event_name:
+        return event
+
+    return replace(event, tiles=[
+        replace(elem, data=rle_encode(bytes.fromhex(elem.data)).hex())
+        for elem in event.tiles
+    ])
+
+
+def to_frame(event: ServerEvent.Base) -> Frame:
+    return Frame(event=event)
+
+
+def merge_elems(queued: list, new: list, key) -> list:
+    """
+    key가 같은 원소는 하나로 합쳐 맨 뒤로 보낸다. 새 원소의 Empty 필드는 이전 값을 쓴다.
+    """
+    merged = {key(elem): elem for elem in queued}
+
+    for elem in new:
+        old = merged.pop(key(elem), None)
+        if old is not None:
+            elem = replace(old, **{
+                f.name: getattr(elem, f.name)
+                for f in fields(elem) if getattr(elem, f.name) is not Empty
+            })
+        merged[key(elem)] = elem
+
+    return list(merged.values())
+
+
+@dataclass
+class ConnMetrics:
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    timed_out: int = 0
+
 
 @dataclass
 class Conn():
+    """
+    connection마다 bounded outbound queue와 writer task를 가진다.
+    receiver는 enqueue만 하고, 실제 전송은 writer가 순서대로 한다.
+    """
     id: str
     conn: WebSocket
+    queue_size: int = QUEUE_SIZE
+    overflow: OverflowPolicy = OverflowPolicy.COALESCE
+    protocol: Protocol = Protocol.JSON
+    tile_encoding: TileEncoding = TileEncoding.RAW
+
+    queue: deque[Frame] = field(default_factory=deque, repr=False)
+    metrics: ConnMetrics = field(default_factory=ConnMetrics, repr=False)
+    closed: bool = False
+
+    _writer: asyncio.Task | None = field(default=None, repr=False)
+    _wakeup: asyncio.Event | None = field(default=None, repr=False)
 
     @staticmethod
     async def create(ws: WebSocket, id: str | None = None):
-        await ws.accept()
+        # Sec-WebSocket-Protocol로 binary를 요청하지 않으면 JSON
+        protocol = Protocol.JSON
+        subprotocol = None
+        if BINARY_SUBPROTOCOL in ws.scope.get("subprotocols", []):
+            protocol = Protocol.BINARY
+            subprotocol = BINARY_SUBPROTOCOL
+
+        tile_encoding = TileEncoding.RAW
+        if ws.query_params.get(TILE_ENCODING_PARAM) == TileEncoding.RLE.value:
+            tile_encoding = TileEncoding.RLE
+
+        await ws.accept(subprotocol=subprotocol)
         if id is None:
             id = uuid4().hex
-        return Conn(id=id, conn=ws)
+        return Conn(id=id, conn=ws, protocol=protocol, tile_encoding=tile_encoding)
+
+    def enqueue(self, frame: Frame) -> bool:
+        """
+        frame을 보낼 큐에 넣는다.
+        connection이 닫혔거나 넘쳐서 끊겼으면 False.
+        """
+        if self.closed:
+            return False
+
+        if len(self.queue) >= self.queue_size:
+            match self.overflow:
+                case OverflowPolicy.DISCONNECT:
+                    self._disconnect()
+                    return False
+                case OverflowPolicy.COALESCE:
+                    if self._coalesce(frame):
+                        return True
+                    self._drop_oldest()
+                case OverflowPolicy.DROP_OLDEST:
+                    self._drop_oldest()
+
+        self.queue.append(frame)
+
+        self._ensure_writer()
+        self._wakeup.set()
+
+        return True
+
+    def stop(self):
+        """
+        남은 frame을 버리고 writer를 멈춘다.
+        """
+        self.closed = True
+        self.queue.clear()
+
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.cancel()
+
+    def _drop_oldest(self):
+        self.queue.popleft()
+        self.metrics.dropped += 1
+
+    def _coalesce(self, frame: Frame) -> bool:
+        coalesce = COALESCE_FIELDS.get(frame.event.event_name)
+        if coalesce is None:
+            return False
+        field_name, key = coalesce
+
+        # 가장 최근에 들어온 같은 종류의 frame에 합침
+        for idx in reversed(range(len(self.queue))):
+            queued = self.queue[idx]
+            if queued.event.event_name != frame.event.event_name:
+                continue
+
+            elems = merge_elems(getattr(queued.event, field_name), getattr(frame.event, field_name), key)
+            if len(elems) > COALESCE_MAX_ELEMS:
+                return False
+
+            self.queue[idx] = to_frame(replace(queued.event, **{field_name: elems}))
+            self.metrics.coalesced += 1
+            return True
+
+        return False
+
+    def _disconnect(self):
+        # 따라오지 못하는 connection은 끊음. receive 루프에서 quit 처리됨
+        self.stop()
+        asyncio.get_running_loop().create_task(self.close())
+
+    def _ensure_writer(self):
+        loop = asyncio.get_running_loop()
+
+        writer = self._writer
+        if writer is not None and not writer.done() and writer.get_loop() is loop:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._writer = loop.create_task(self._run_writer(self._wakeup))
+
+    async def _run_writer(self, wakeup: asyncio.Event):
+        while not self.closed:
+            if len(self.queue) == 0:
+                await wakeup.wait()
+                wakeup.clear()
+                continue
+
+            frame = self.queue.popleft()
+            try:
+                sent = await asyncio.wait_for(self.send_frame(frame), SEND_TIMEOUT_SECONDS)
+            except TimeoutError:
+                # frame이 일부만 쓰였을 수 있으므로 다음 frame을 이어 쓰지 않고 끊음
+                self.metrics.timed_out += 1
+                self.closed = True
+                self.queue.clear()
+                await self.close()
+                return
+            except Exception:
+                logger.exception("failed to send a frame to %s", self.id)
+                sent = False
+
+            if not sent:
+                # 끊긴 connection
+                self.closed = True
+                self.queue.clear()
+                return
+
+            self.metrics.sent += 1
 
     async def accept(self):
         await self.conn.accept()
 
     async def close(self):
-        await self.conn.close()
+        try:
+            await self.conn.close()
+        except (ConnectionClosed, WebSocketDisconnect, RuntimeError):
+            # 이미 닫힌 connection
+            return
 
     async def receive(self):
         row = await self.conn.receive_text()
@@ -41,11 +320,32 @@ class Conn():
         return client_event
 
     async def send(self, msg: Message):
+        await self.send_text(msg.to_str())
+
+    async def send_frame(self, frame: Frame) -> bool:
+        data = frame.serialize(self.protocol, self.tile_encoding)
+        if self.protocol == Protocol.BINARY:
+            return await self.send_bytes(data)
+        return await self.send_text(data)
+
+    async def send_text(self, text: str) -> bool:
+        """
+        이미 직렬화된 메시지를 보낸다.
+        연결이 끊겨 보내지 못했으면 False.
+        """
+        return await self._send(self.conn.send_text, text)
+
+    async def send_bytes(self, data: bytes) -> bool:
+        return await self._send(self.conn.send_bytes, data)
+
+    async def _send(self, send, data) -> bool:
         if self.conn.application_state == WebSocketState.DISCONNECTED:
-            return
+            return False
 
         try:
-            await self.conn.send_text(msg.to_str())
+            await send(data)
         except (ConnectionClosed, WebSocketDisconnect):
             # 커넥션이 종료되었는데도 타이밍 문제로 인해 커넥션을 가져왔을 수 있음.
-            return
+            return False
+
+        return True
@@ -3,41 +3,55 @@ join(WebSocket)
 quit(id)
 
 multycast(list[id], external_event)
-broadcast(list[id], external_event)
+broadcast(external_event)
 """
-from .conn import Conn
+from .conn import Conn, to_frame
+from dataclasses import dataclass, field
 from event.message import Message
 from event.payload import ExternalEventPayload, IdDataPayload, EventEnum, IdPayload, Event, set_scope
+# receiver들은 event.broker에 등록되어 있으므로 발행도 event.broker로
+from event.broker import EventBroker
 
-from core.event.frame import Event, EventSet, IdPayload, set_scope
-from core.event.broker import EventBroker
+# 아직 쓰이지 않는 core 이벤트 정의
+from core.event import frame
+from core.event.broker import EventBroker as CoreEventBroker
 from data.conn.external_event import ClientPayload, ServerPayload
+# 아래 EventSet과 이름이 겹치므로 실제로 주고받는 event 타입은 별칭으로
+from data.conn.event import ClientEvent as ExternalClientEvent, ServerEvent as ExternalServerEvent
 
 
-@EventBroker.set_external
-class ClientEvent(EventSet):
-    OPEN_TILE = Event[ClientPayload.OpenTile]
-    SET_FLAG = Event[ClientPayload.SetFlag]
-    MOVE = Event[ClientPayload.Move]
-    CHAT = Event[ClientPayload.Chat]
-    POINTING = Event[ClientPayload.Pointing]
-    SET_WINDOW_SIZE = Event[ClientPayload.SetWindowSize]
+@CoreEventBroker.set_external
+class ClientEvent(frame.EventSet):
+    OPEN_TILE = frame.Event[ClientPayload.OpenTile]
+    SET_FLAG = frame.Event[ClientPayload.SetFlag]
+    MOVE = frame.Event[ClientPayload.Move]
+    CHAT = frame.Event[ClientPayload.Chat]
+    POINTING = frame.Event[ClientPayload.Pointing]
+    SET_WINDOW_SIZE = frame.Event[ClientPayload.SetWindowSize]
 
 
-@EventBroker.set_external
-class ServerEvent(EventSet):
-    CHAT = Event[ServerPayload.Chat]
-    CURSORS_STATE = Event[ServerPayload.CursorsState]
-    EXPLOSION = Event[ServerPayload.Explosion]
-    MY_CURSOR = Event[ServerPayload.MyCursor]
-    SCOREBOARD_STATE = Event[ServerPayload.ScoreboardState]
-    TILES_STATE = Event[ServerPayload.TilesState]
+@CoreEventBroker.set_external
+class ServerEvent(frame.EventSet):
+    CHAT = frame.Event[ServerPayload.Chat]
+    CURSORS_STATE = frame.Event[ServerPayload.CursorsState]
+    EXPLOSION = frame.Event[ServerPayload.Explosion]
+    MY_CURSOR = frame.Event[ServerPayload.MyCursor]
+    SCOREBOARD_STATE = frame.Event[ServerPayload.ScoreboardState]
+    TILES_STATE = frame.Event[ServerPayload.TilesState]
 
 
 @set_scope("Connection")
-class ConnectionEvent(EventSet):
-    JOIN = Event[IdPayload]
-    QUIT = Event[IdPayload]
+class ConnectionEvent(EventEnum):
+    JOIN = Event()
+    QUIT = Event()
+
+
+@dataclass
+class FanoutResult:
+    # 보낼 큐에 들어간 connection
+    sent: list[str] = field(default_factory=list)
+    # 없거나 끊긴 connection
+    failed: list[str] = field(default_factory=list)
 
 
 class ConnectionHandler:
@@ -59,6 +73,7 @@ class ConnectionHandler:
     @classmethod
     async def quit(cls, conn: Conn):
         del ConnectionHandler.conn_dict[conn.id]
+        conn.stop()
 
         await EventBroker.publish(
             Message(
@@ -70,7 +85,7 @@ class ConnectionHandler:
         )
 
     @classmethod
-    async def publish_client_event(cls, conn: Conn, event: ClientEvent.Base):
+    async def publish_client_event(cls, conn: Conn, event: ExternalClientEvent.Base):
         await EventBroker.publish(
             Message(
                 event=event.event_name,
@@ -81,21 +96,43 @@ class ConnectionHandler:
         )
 
     @classmethod
-    async def multicast(cls, target_ids: list[str], external_event: ServerEvent.Base):
-
+    async def multicast(cls, target_ids: list[str], external_event: ExternalServerEvent.Base) -> FanoutResult:
+        conns = []
+        missing = []
         for id in target_ids:
-            conn = ConnectionHandler.conn_dict[id]
-
-            # TODO
-            # Payload랑 External Message랑 호환이 안됨
-            msg = Message(
-                external_event.event_name,
-                payload=ExternalEventPayload(
-                    external_event
-                )
-            )
-            await conn.send(msg)
+            conn = ConnectionHandler.conn_dict.get(id)
+            if conn is None:
+                # 이미 나간 connection
+                missing.append(id)
+                continue
+            conns.append(conn)
+
+        result = await cls._fanout(conns, external_event)
+        result.failed += missing
+
+        return result
+
+    @classmethod
+    async def broadcast(cls, external_event: ExternalServerEvent.Base) -> FanoutResult:
+        conns = list(ConnectionHandler.conn_dict.values())
+        return await cls._fanout(conns, external_event)
 
     @classmethod
-    async def broadcast(cls, external_event: ServerEvent.Base):
-        pass
+    async def _fanout(cls, conns: list[Conn], external_event: ExternalServerEvent.Base) -> FanoutResult:
+        """
+        이벤트를 한 번만 직렬화해서 각 connection의 큐에 넣는다.
+        실제 전송은 connection별 writer가 하므로 느린 connection을 기다리지 않는다.
+        """
+        result = FanoutResult()
+        if len(conns) == 0:
+            return result
+
+        frame = to_frame(external_event)
+
+        for conn in conns:
+            if conn.enqueue(frame):
+                result.sent.append(conn.id)
+            else:
+                result.failed.append(conn.id)
+
+        return result
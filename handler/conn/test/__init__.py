@@ -1,7 +1,10 @@
 import unittest
 
-from .conn_manager_test import ConnectionManagerTestCase
+# conn_manager_test는 주석 처리된 regacy_connection_manager의 테스트라 제외
+from .connection_handler_test import ConnectionHandler_Fanout_TestCase, ConnectionHandler_JoinQuit_TestCase
+from .conn_test import Conn_Queue_TestCase
+from .binary_test import Varint_TestCase, Binary_TestCase, Conn_Protocol_TestCase
 
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,175 @@
+from data.board import Point, PointRange, rle_decode
+from data.cursor import Color
+from data.conn.event import ServerEvent
+from handler.conn import Conn, Protocol, TileEncoding, to_frame, BINARY_SUBPROTOCOL
+from handler.conn.internal.binary import (
+    encode_event, encode_json, decode_event, write_sint, Reader, BinaryDecodeException
+)
+
+from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime
+import json
+
+TILES_STATE = ServerEvent.TilesState(tiles=[
+    ServerEvent.TilesState.Elem(
+        range=PointRange(Point(-3, 2), Point(0, 1)),
+        data=bytes([0b10000001, 0b00100000, 0, 0, 1, 2, 3, 4]).hex()
+    ),
+    ServerEvent.TilesState.Elem(
+        range=PointRange(Point(1000000, -5), Point(1000000, -5)),
+        data="ff"
+    )
+])
+
+CURSORS_STATE = ServerEvent.CursorsState(cursors=[
+    ServerEvent.CursorsState.Elem(
+        id="A",
+        position=Point(-1, 1),
+        pointer=Point(3, -4),
+        color=Color.PURPLE,
+        revive_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+        score=-7
+    ),
+    ServerEvent.CursorsState.Elem(
+        id="B",
+        pointer=None,
+        revive_at=None
+    ),
+    ServerEvent.CursorsState.Elem(
+        id="C",
+        position=Point(0, 0)
+    )
+])
+
+
+def encode(event) -> bytes:
+    return to_frame(event).binary
+
+
+class Varint_TestCase(TestCase):
+    def test_sint(self):
+        for value in [0, 1, -1, 63, -64, 64, 2 ** 40, -(2 ** 40)]:
+            buf = bytearray()
+            write_sint(buf, value)
+
+            self.assertEqual(Reader(bytes(buf)).sint(), value)
+
+    def test_small_sint_one_byte(self):
+        buf = bytearray()
+        write_sint(buf, -64)
+
+        self.assertEqual(len(buf), 1)
+
+    def test_truncated(self):
+        with self.assertRaises(BinaryDecodeException):
+            Reader(bytes([0x80])).varint()
+
+
+class Binary_TestCase(TestCase):
+    def test_tiles_state(self):
+        data = encode(TILES_STATE)
+
+        self.assertEqual(decode_event(data), TILES_STATE)
+
+    def test_tiles_state_smaller(self):
+        data = encode(TILES_STATE)
+        text = to_frame(TILES_STATE).text
+
+        self.assertLess(len(data), len(text.encode()))
+
+    def test_cursors_state(self):
+        data = encode(CURSORS_STATE)
+
+        self.assertEqual(decode_event(data), CURSORS_STATE)
+
+    def test_json_fallback(self):
+        event = ServerEvent.Error(msg="example")
+        frame = to_frame(event)
+
+        self.assertIsNone(encode_event(event))
+        self.assertEqual(frame.binary, encode_json(frame.text))
+        self.assertEqual(decode_event(frame.binary), json.loads(frame.text))
+
+    def test_unknown_code(self):
+        with self.assertRaises(BinaryDecodeException):
+            decode_event(bytes([0x7f]))
+
+
+class Conn_Protocol_TestCase(AsyncTestCase):
+    async def test_create_binary(self):
+        ws = MagicMock()
+        ws.scope = {"subprotocols": ["other", BINARY_SUBPROTOCOL]}
+        ws.accept = AsyncMock()
+
+        conn = await Conn.create(ws)
+
+        self.assertEqual(conn.protocol, Protocol.BINARY)
+        ws.accept.assert_awaited_once_with(subprotocol=BINARY_SUBPROTOCOL)
+
+    async def test_create_json(self):
+        ws = MagicMock()
+        ws.scope = {}
+        ws.query_params = {}
+        ws.accept = AsyncMock()
+
+        conn = await Conn.create(ws)
+
+        self.assertEqual(conn.protocol, Protocol.JSON)
+        self.assertEqual(conn.tile_encoding, TileEncoding.RAW)
+        ws.accept.assert_awaited_once_with(subprotocol=None)
+
+    async def test_create_rle(self):
+        ws = MagicMock()
+        ws.scope = {}
+        ws.query_params = {"tile_encoding": "rle"}
+        ws.accept = AsyncMock()
+
+        conn = await Conn.create(ws)
+
+        self.assertEqual(conn.tile_encoding, TileEncoding.RLE)
+
+    async def test_send_frame(self):
+        binary = Conn(id="A", conn=MagicMock(), protocol=Protocol.BINARY)
+        binary.send_bytes = AsyncMock(return_value=True)
+        json_conn = Conn(id="B", conn=MagicMock())
+        json_conn.send_text = AsyncMock(return_value=True)
+
+        frame = to_frame(TILES_STATE)
+        await binary.send_frame(frame)
+        await json_conn.send_frame(frame)
+
+        binary.send_bytes.assert_awaited_once_with(frame.binary)
+        json_conn.send_text.assert_awaited_once_with(frame.text)
+
+    async def test_send_frame_rle(self):
+        conn = Conn(id="A", conn=MagicMock(), protocol=Protocol.BINARY, tile_encoding=TileEncoding.RLE)
+        conn.send_bytes = AsyncMock(return_value=True)
+
+        frame = to_frame(TILES_STATE)
+        await conn.send_frame(frame)
+
+        data = conn.send_bytes.await_args.args[0]
+        self.assertIs(data, frame.serialize(Protocol.BINARY, TileEncoding.RLE))
+
+        decoded = decode_event(data)
+        for elem, expected in zip(decoded.tiles, TILES_STATE.tiles):
+            self.assertEqual(elem.range, expected.range)
+            self.assertEqual(rle_decode(bytes.fromhex(elem.data)).hex(), expected.data)
+
+    def test_serialize_rle_json(self):
+        frame = to_frame(TILES_STATE)
+
+        content = json.loads(frame.serialize(Protocol.JSON, TileEncoding.RLE))["payload"]["data"]
+
+        self.assertEqual(
+            rle_decode(bytes.fromhex(content["tiles"][0]["data"])).hex(),
+            TILES_STATE.tiles[0].data
+        )
+        # 원본 이벤트는 그대로
+        self.assertEqual(frame.event, TILES_STATE)
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
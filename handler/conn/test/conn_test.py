@@ -0,0 +1,213 @@
+from data.board import Point, PointRange
+from data.conn.event import ServerEvent
+from handler.conn import Conn, OverflowPolicy, to_frame
+
+from unittest import IsolatedAsyncioTestCase as AsyncTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncio
+
+
+def tiles_frame(x: int, data: str = "00"):
+    return to_frame(ServerEvent.TilesState(tiles=[
+        ServerEvent.TilesState.Elem(
+            range=PointRange(Point(x, 0), Point(x, 0)),
+            data=data
+        )
+    ]))
+
+
+def error_frame(msg: str):
+    return to_frame(ServerEvent.Error(msg=msg))
+
+
+async def blocked_send_text(text: str) -> bool:
+    await asyncio.sleep(10)
+    return True
+
+
+class Conn_Queue_TestCase(AsyncTestCase):
+    def create_conn(self, overflow: OverflowPolicy, send_text=None) -> Conn:
+        conn = Conn(id="A", conn=MagicMock(), queue_size=2, overflow=overflow)
+        conn.send_text = AsyncMock(side_effect=blocked_send_text) if send_text is None else send_text
+        conn.close = AsyncMock()
+        self.conns.append(conn)
+        return conn
+
+    def setUp(self):
+        self.conns: list[Conn] = []
+
+    def tearDown(self):
+        for conn in self.conns:
+            conn.stop()
+
+    async def test_enqueue_not_wait(self):
+        conn = self.create_conn(OverflowPolicy.DROP_OLDEST)
+
+        # 전송이 막혀있어도 바로 반환
+        self.assertTrue(conn.enqueue(error_frame("a")))
+        self.assertEqual(len(conn.queue), 1)
+
+    async def test_writer_order(self):
+        sent = []
+
+        async def send_text(text: str) -> bool:
+            sent.append(text)
+            return True
+
+        conn = self.create_conn(OverflowPolicy.DROP_OLDEST, send_text)
+        frames = [error_frame("a"), error_frame("b")]
+        for frame in frames:
+            conn.enqueue(frame)
+
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(sent, [frame.text for frame in frames])
+        self.assertEqual(conn.metrics.sent, 2)
+
+    async def test_drop_oldest(self):
+        conn = self.create_conn(OverflowPolicy.DROP_OLDEST)
+        conn.enqueue(error_frame("a"))
+        # writer가 "a"를 가져가 전송 중
+        await asyncio.sleep(0)
+
+        frames = [error_frame(msg) for msg in "bcd"]
+        for frame in frames:
+            self.assertTrue(conn.enqueue(frame))
+
+        self.assertEqual(list(conn.queue), frames[1:])
+        self.assertEqual(conn.metrics.dropped, 1)
+
+    async def test_coalesce(self):
+        conn = self.create_conn(OverflowPolicy.COALESCE)
+        conn.enqueue(error_frame("a"))
+        await asyncio.sleep(0)
+
+        conn.enqueue(tiles_frame(0))
+        conn.enqueue(error_frame("b"))
+        self.assertTrue(conn.enqueue(tiles_frame(1)))
+
+        self.assertEqual(len(conn.queue), 2)
+        merged = conn.queue[0].event
+        self.assertEqual(
+            [elem.range.top_left.x for elem in merged.tiles],
+            [0, 1]
+        )
+        self.assertEqual(conn.queue[0].text, to_frame(merged).text)
+        self.assertEqual(conn.metrics.coalesced, 1)
+
+    async def test_coalesce_same_range(self):
+        conn = self.create_conn(OverflowPolicy.COALESCE)
+        conn.enqueue(error_frame("a"))
+        await asyncio.sleep(0)
+
+        conn.enqueue(tiles_frame(0, "00"))
+        conn.enqueue(error_frame("b"))
+        conn.enqueue(tiles_frame(1))
+        conn.enqueue(tiles_frame(0, "01"))
+
+        # 같은 range는 최신 것 하나만, 맨 뒤에
+        merged = conn.queue[0].event
+        self.assertEqual(
+            [(elem.range.top_left.x, elem.data) for elem in merged.tiles],
+            [(1, "00"), (0, "01")]
+        )
+
+    async def test_coalesce_same_cursor(self):
+        conn = self.create_conn(OverflowPolicy.COALESCE)
+        conn.enqueue(error_frame("a"))
+        await asyncio.sleep(0)
+
+        Elem = ServerEvent.CursorsState.Elem
+        conn.enqueue(to_frame(ServerEvent.CursorsState(cursors=[Elem(id="B", position=Point(0, 0), score=1)])))
+        conn.enqueue(error_frame("b"))
+        conn.enqueue(to_frame(ServerEvent.CursorsState(cursors=[Elem(id="B", position=Point(1, 0))])))
+
+        # 비어있는 필드는 이전 값 유지
+        merged = conn.queue[0].event
+        self.assertEqual(merged.cursors, [Elem(id="B", position=Point(1, 0), score=1)])
+
+    @patch("handler.conn.internal.conn.COALESCE_MAX_ELEMS", 2)
+    async def test_coalesce_limit(self):
+        conn = self.create_conn(OverflowPolicy.COALESCE)
+        conn.enqueue(error_frame("a"))
+        await asyncio.sleep(0)
+
+        conn.enqueue(tiles_frame(0))
+        conn.enqueue(error_frame("b"))
+        conn.enqueue(tiles_frame(1))
+        # 더 합치면 한도를 넘으므로 가장 오래된 frame을 버림
+        conn.enqueue(tiles_frame(2))
+
+        self.assertEqual(conn.queue[0].event.msg, "b")
+        self.assertEqual(len(conn.queue[1].event.tiles), 1)
+        self.assertEqual(conn.metrics.coalesced, 1)
+        self.assertEqual(conn.metrics.dropped, 1)
+
+    async def test_coalesce_fallback_drop(self):
+        conn = self.create_conn(OverflowPolicy.COALESCE)
+        conn.enqueue(error_frame("a"))
+        await asyncio.sleep(0)
+
+        frames = [error_frame(msg) for msg in "bcd"]
+        for frame in frames:
+            conn.enqueue(frame)
+
+        self.assertEqual(list(conn.queue), frames[1:])
+        self.assertEqual(conn.metrics.dropped, 1)
+
+    async def test_disconnect(self):
+        conn = self.create_conn(OverflowPolicy.DISCONNECT)
+        conn.enqueue(error_frame("a"))
+        await asyncio.sleep(0)
+
+        conn.enqueue(error_frame("b"))
+        conn.enqueue(error_frame("c"))
+        self.assertFalse(conn.enqueue(error_frame("d")))
+
+        await asyncio.sleep(0)
+
+        self.assertTrue(conn.closed)
+        self.assertEqual(len(conn.queue), 0)
+        conn.close.assert_awaited_once()
+        self.assertFalse(conn.enqueue(error_frame("e")))
+
+    @patch("handler.conn.internal.conn.SEND_TIMEOUT_SECONDS", 0.01)
+    async def test_send_timeout(self):
+        conn = self.create_conn(OverflowPolicy.DROP_OLDEST)
+        conn.enqueue(error_frame("a"))
+        conn.enqueue(error_frame("b"))
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(conn.metrics.timed_out, 1)
+        self.assertTrue(conn.closed)
+        self.assertEqual(len(conn.queue), 0)
+        # 다음 frame은 보내지 않음
+        conn.send_text.assert_awaited_once()
+        conn.close.assert_awaited_once()
+        self.assertFalse(conn.enqueue(error_frame("c")))
+
+    async def test_send_failed(self):
+        conn = self.create_conn(OverflowPolicy.DROP_OLDEST, AsyncMock(return_value=False))
+        conn.enqueue(error_frame("a"))
+        conn.enqueue(error_frame("b"))
+
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(conn.closed)
+        self.assertEqual(len(conn.queue), 0)
+
+    async def test_send_error_logged(self):
+        conn = self.create_conn(OverflowPolicy.DROP_OLDEST, AsyncMock(side_effect=ValueError("bad frame")))
+
+        with self.assertLogs("handler.conn.internal.conn", level="ERROR"):
+            conn.enqueue(error_frame("a"))
+            await asyncio.sleep(0.01)
+
+        self.assertTrue(conn.closed)
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
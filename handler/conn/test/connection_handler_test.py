@@ -0,0 +1,110 @@
+from data.conn.event import ServerEvent
+from handler.conn import ConnectionHandler, ConnectionEvent, Conn
+from event.broker import EventBroker
+from event.message import Message
+from event.payload import IdPayload
+
+from receiver.internal.external.new import NewExternalReceiver
+from receiver.internal.external.quit import QuitExternalReceiver
+
+from unittest import IsolatedAsyncioTestCase as AsyncTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncio
+
+EVENT = ServerEvent.Error(msg="example")
+
+
+def create_conn_mock(id: str) -> Conn:
+    conn = Conn(id=id, conn=MagicMock())
+    conn.send_text = AsyncMock(return_value=True)
+    return conn
+
+
+class ConnectionHandler_Fanout_TestCase(AsyncTestCase):
+    def setUp(self):
+        self.a = create_conn_mock("A")
+        self.b = create_conn_mock("B")
+        self.closed = create_conn_mock("closed")
+        self.closed.stop()
+
+        ConnectionHandler.conn_dict = {
+            conn.id: conn
+            for conn in (self.a, self.b, self.closed)
+        }
+
+    def tearDown(self):
+        for conn in ConnectionHandler.conn_dict.values():
+            conn.stop()
+        ConnectionHandler.conn_dict = {}
+
+    async def test_multicast(self):
+        result = await ConnectionHandler.multicast(["A", "B"], EVENT)
+
+        self.assertEqual(result.sent, ["A", "B"])
+        self.assertEqual(result.failed, [])
+
+        # 한 번만 직렬화된 같은 frame
+        self.assertIs(self.a.queue[0], self.b.queue[0])
+
+    async def test_multicast_missing(self):
+        result = await ConnectionHandler.multicast(["A", "gone"], EVENT)
+
+        self.assertEqual(result.sent, ["A"])
+        self.assertEqual(result.failed, ["gone"])
+
+    async def test_multicast_closed(self):
+        result = await ConnectionHandler.multicast(["A", "closed"], EVENT)
+
+        self.assertEqual(result.sent, ["A"])
+        self.assertEqual(result.failed, ["closed"])
+
+    async def test_multicast_empty(self):
+        result = await ConnectionHandler.multicast([], EVENT)
+
+        self.assertEqual(result.sent, [])
+        self.assertEqual(len(self.a.queue), 0)
+
+    async def test_broadcast(self):
+        result = await ConnectionHandler.broadcast(EVENT)
+
+        self.assertEqual(result.sent, ["A", "B"])
+        self.assertEqual(result.failed, ["closed"])
+
+    async def test_writer_send(self):
+        await ConnectionHandler.multicast(["A"], EVENT)
+
+        # writer task가 보냄
+        await asyncio.sleep(0)
+
+        text = self.a.send_text.call_args.args[0]
+        self.assertIn(EVENT.event_name, text)
+        self.assertEqual(self.a.metrics.sent, 1)
+
+
+class ConnectionHandler_JoinQuit_TestCase(AsyncTestCase):
+    def tearDown(self):
+        ConnectionHandler.conn_dict = {}
+
+    def test_receivers_registered(self):
+        # join, quit 메시지를 받을 receiver가 event.broker에 있음
+        self.assertIn(ConnectionEvent.JOIN, EventBroker.dispatch_table)
+        self.assertIn(ConnectionEvent.QUIT, EventBroker.dispatch_table)
+
+    @patch("event.broker.EventBroker.publish", new_callable=AsyncMock)
+    async def test_join_quit(self, publish: AsyncMock):
+        conn = create_conn_mock("A")
+
+        await ConnectionHandler.join(conn)
+        self.assertIs(ConnectionHandler.conn_dict["A"], conn)
+        publish.assert_awaited_once_with(Message(event=ConnectionEvent.JOIN, payload=IdPayload("A")))
+
+        publish.reset_mock()
+        await ConnectionHandler.quit(conn)
+        self.assertNotIn("A", ConnectionHandler.conn_dict)
+        publish.assert_awaited_once_with(Message(event=ConnectionEvent.QUIT, payload=IdPayload("A")))
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
@@ -1,5 +1,5 @@
 from data.base.utils import Relation
-from data.board import Point, PointRange, is_overlap
+from data.board import Point, PointRange
 from data.cursor import Cursor, Color
 
 from . import cursor_exception as CursorException
@@ -9,9 +9,11 @@ from event.broker import publish_data_event, EventBroker
 
 from event.payload import EventEnum, IdDataPayload, Event, set_scope, IdPayload
 
-from handler.storage.interface import KeyValueInterface, ListInterface
+from handler.storage.interface import KeyValueInterface, ListInterface, SpatialInterface
 from handler.storage.dict import DictStorage
 from handler.storage.list.array import ArrayListStorage
+from handler.storage.spatial.grid import GridStorage
+from handler.storage.spatial.rtree import RTreeStorage
 from event.message import Message
 
 from utils.config import Config
@@ -36,18 +38,33 @@ class CursorHandler:
     __event__: CursorEvent
 
     # 메인 스토리지
+    # 조회가 잦아 복사 없이 공유. 수정할 때는 get으로 받은 복사본을 _update
     cursor_storage: KeyValueInterface[str, Cursor] = DictStorage.create_space(
-        key=__identify__ + ".cursor"
+        key=__identify__ + ".cursor",
+        shared=True
     )
 
     # 부가 스토리지
     # Handler <-1---N-> Space
     # Data    <-1---N-> Space
+    # 관계는 통째로 교체해서 갱신
     watcher_storage: KeyValueInterface[str, Relation[str]] = DictStorage.create_space(
-        key=__identify__ + ".watcher"
+        key=__identify__ + ".watcher",
+        shared=True
     )
     target_storage: KeyValueInterface[str, Relation[str]] = DictStorage.create_space(
-        key=__identify__ + ".target"
+        key=__identify__ + ".target",
+        shared=True
+    )
+
+    # 공간 인덱스
+    # cursor_storage 전체 순회 없이 범위 조회를 하기 위함
+    position_index: SpatialInterface[str] = GridStorage.create_space(
+        key=__identify__ + ".position"
+    )
+    # 시야는 크기가 제각각이라 한 번씩만 저장하는 R-tree 사용
+    view_index: SpatialInterface[str] = RTreeStorage.create_space(
+        key=__identify__ + ".view"
     )
 
     @classmethod
@@ -61,11 +78,8 @@ class CursorHandler:
         if (target.id in targets.relations) or (watcher.id in watchers.relations):
             raise CursorException.AlreadyWatching
 
-        targets.relations.append(target.id)
-        watchers.relations.append(watcher.id)
-
-        await cls.target_storage.set(watcher.id, targets)
-        await cls.watcher_storage.set(target.id, watchers)
+        await cls.target_storage.set(watcher.id, Relation(_id=watcher.id, relations=[*targets.relations, target.id]))
+        await cls.watcher_storage.set(target.id, Relation(_id=target.id, relations=[*watchers.relations, watcher.id]))
 
     @classmethod
     async def _remove_watcher(cls, watcher: Cursor, target: Cursor):
@@ -75,11 +89,8 @@ class CursorHandler:
         if not ((target.id in targets.relations) and (watcher.id in watchers.relations)):
             raise CursorException.NotWatching
 
-        targets.relations.remove(target.id)
-        watchers.relations.remove(watcher.id)
-
-        await cls.target_storage.set(watcher.id, targets)
-        await cls.watcher_storage.set(target.id, watchers)
+        await cls.target_storage.set(watcher.id, Relation(_id=watcher.id, relations=[id for id in targets if id != target.id]))
+        await cls.watcher_storage.set(target.id, Relation(_id=target.id, relations=[id for id in watchers if id != watcher.id]))
 
     @classmethod  # argument가 id인 이유 -> get해서 최신 cursor 받아와야함
     async def revive(cls, id: str) -> Cursor:
@@ -213,6 +224,17 @@ class CursorHandler:
         무조건 유효한 커서를 넘겨야 함. 
         """
         await cls.cursor_storage.set(key=cursor.id, value=cursor)
+        await cls._index(cursor)
+
+    @classmethod
+    async def _index(cls, cursor: Cursor):
+        await cls.position_index.set(cursor.id, PointRange(cursor.position, cursor.position))
+        await cls.view_index.set(cursor.id, cursor.view_range)
+
+    @classmethod
+    async def _unindex(cls, id: str):
+        await cls.position_index.delete(id)
+        await cls.view_index.delete(id)
 
     @classmethod
     async def create(cls, template: Cursor) -> Cursor:
@@ -221,6 +243,7 @@ class CursorHandler:
             raise CursorException.AlreadyExists
 
         await cls.cursor_storage.set(template.id, template)
+        await cls._index(template)
 
         await EventBroker.publish(
             Message(
@@ -240,11 +263,19 @@ class CursorHandler:
             raise CursorException.NotFound
 
         await cls.cursor_storage.delete(id)
+        await cls._unindex(id)
 
         await publish_data_event(CursorEvent.DELETE, data=cur)
 
     @classmethod
     async def get(cls, id: str) -> Cursor:
+        """
+        수정해도 되는 복사본을 반환한다.
+        """
+        return (await cls._get_shared(id)).copy()
+
+    @classmethod
+    async def _get_shared(cls, id: str) -> Cursor:
         cur = await cls.cursor_storage.get(id)
         if cur is None:
             raise CursorException.NotFound
@@ -253,20 +284,8 @@ class CursorHandler:
 
     @classmethod
     async def get_by_range(cls, range: PointRange, filters: list[Callable[[Cursor], bool]] | None = None) -> list[Cursor]:
-        result = []
-        for id in await cls.cursor_storage.keys():
-            cursor = await cls.cursor_storage.get(id)
-            assert cursor
-
-            if not range.is_in(cursor.position):
-                continue
-
-            if filters is not None and not all(filter(cursor) for filter in filters):
-                continue
-
-            result.append(cursor)
-
-        return result
+        ids = await cls.position_index.query(range)
+        return await cls._get_filtered(ids, filters)
 
     @classmethod
     async def get_by_point(cls, point: Point) -> list[Cursor]:
@@ -274,15 +293,19 @@ class CursorHandler:
 
     @classmethod
     async def get_by_watching_range(cls, range: PointRange, filters: list[Callable[[Cursor], bool]] | None = None) -> list[Cursor]:
-        result = []
+        ids = await cls.view_index.query(range)
+        return await cls._get_filtered(ids, filters)
 
-        for id in await cls.cursor_storage.keys():
+    @classmethod
+    async def _get_filtered(cls, ids: list[str], filters: list[Callable[[Cursor], bool]] | None) -> list[Cursor]:
+        """
+        조회용. 저장된 커서를 복사 없이 반환하므로 수정하면 안 된다.
+        """
+        result = []
+        for id in ids:
             cursor = await cls.cursor_storage.get(id)
             assert cursor
 
-            if not is_overlap(cursor.view_range, range):
-                continue
-
             if filters is not None and not all(filter(cursor) for filter in filters):
                 continue
 
@@ -296,19 +319,25 @@ class CursorHandler:
 
     @classmethod
     async def get_watchers(cls, cursor: Cursor) -> list[Cursor]:
+        """
+        조회용. get_by_range 등과 같이 수정하면 안 된다.
+        """
         ids = await cls.watcher_storage.get(cursor.id)
         if ids is None:
             ids = []
 
-        return [await cls.get(id) for id in ids]
+        return [await cls._get_shared(id) for id in ids]
 
     @classmethod
     async def get_targets(cls, cursor: Cursor) -> list[Cursor]:
+        """
+        조회용. get_by_range 등과 같이 수정하면 안 된다.
+        """
         ids = await cls.target_storage.get(cursor.id)
         if ids is None:
             ids = []
 
-        return [await cls.get(id) for id in ids]
+        return [await cls._get_shared(id) for id in ids]
 
 
 def set_watchers(cursor: Cursor, watchers: list[Cursor]) -> Cursor[Cursor.Watchers]:
@@ -1,7 +1,7 @@
 from data.cursor import Cursor, Color
 from data.board import PointRange
-from data.payload import DataPayload
 from event.message import Message
+from event.payload import IdPayload
 
 from datetime import datetime, timedelta
 
@@ -23,6 +23,8 @@ from unittest.mock import call, AsyncMock, MagicMock, patch as _patch
 from tests.utils import cases, PathPatch
 
 from handler.storage.dict import DictSpace, DictStorage
+from handler.storage.spatial.grid import GridSpace
+from handler.storage.spatial.rtree import RTreeSpace
 
 patch = PathPatch("handler.cursor.internal.cursor_handler")
 
@@ -84,6 +86,16 @@ class CursorHandler_TestCase(AsyncTest):
         CursorHandler.watcher_storage = self.watcher_storage
         CursorHandler.target_storage = self.target_storage
 
+        self.position_index = GridSpace[str]("position", {
+            id: PointRange(cur.position, cur.position) for id, cur in DATASET.items()
+        })
+        self.view_index = RTreeSpace[str]("view", {
+            id: cur.view_range for id, cur in DATASET.items()
+        })
+
+        CursorHandler.position_index = self.position_index
+        CursorHandler.view_index = self.view_index
+
     @cases([
         {"id": id, "cur": cur} for id, cur in DATASET.items()
     ])
@@ -118,7 +130,7 @@ class CursorHandler_TestCase(AsyncTest):
         {"point": Point(0, 0), "curs": []}
     ])
     async def test_get_by_point(self, point: Point, curs: list[Cursor]):
-        await self.cursor_storage.set(EXTRA_CUR.id, EXTRA_CUR)
+        await CursorHandler._update(EXTRA_CUR)
 
         got = await CursorHandler.get_by_point(point)
         self.assertCountEqual(got, curs, msg=(got, curs))
@@ -161,7 +173,7 @@ class CursorHandler_TestCase(AsyncTest):
         expected = [DATASET[id] for id in TARGET_DATASET[cursor.id]]
         self.assertCountEqual(got, expected)
 
-    @patch("publish_data_event")
+    @patch("EventBroker.publish")
     async def test_create(self, publish: AsyncMock):
         template = Cursor.create("D")
         created = await CursorHandler.create(template)
@@ -171,7 +183,12 @@ class CursorHandler_TestCase(AsyncTest):
         fetched = await self.cursor_storage.get("D")
         self.assertEqual(created, fetched)
 
-        publish.assert_called_once_with(CursorEvent.CREATED, id=template.id)
+        self.assertIn("D", await self.position_index.query(PointRange(template.position, template.position)))
+        self.assertIn("D", await self.view_index.query(PointRange(template.position, template.position)))
+
+        publish.assert_called_once_with(
+            Message(event=CursorEvent.CREATED, payload=IdPayload(id=template.id))
+        )
 
     @patch("publish_data_event")
     async def test_delete(self, publish: AsyncMock):
@@ -184,6 +201,9 @@ class CursorHandler_TestCase(AsyncTest):
         fetched = await self.cursor_storage.get("A")
         self.assertIsNone(fetched)
 
+        self.assertIsNone(await self.position_index.get("A"))
+        self.assertIsNone(await self.view_index.get("A"))
+
     async def test_private_update(self):
         cur_a = await self.cursor_storage.get("A")
         cur_a.pointer = Point(100, 100)
@@ -193,6 +213,18 @@ class CursorHandler_TestCase(AsyncTest):
         cur_a = await self.cursor_storage.get("A")
         self.assertEqual(cur_a.pointer, Point(100, 100))
 
+    async def test_private_update_index(self):
+        cur_a = await self.cursor_storage.get("A")
+        cur_a.position = Point(300, 300)
+        cur_a.width, cur_a.height = 1, 1
+
+        await CursorHandler._update(cur_a)
+
+        self.assertCountEqual(await CursorHandler.get_by_point(Point(300, 300)), [cur_a])
+        self.assertCountEqual(await CursorHandler.get_by_watching_point(Point(301, 299)), [cur_a])
+        self.assertNotIn(cur_a, await CursorHandler.get_by_point(Point(-3, 3)))
+        self.assertNotIn(cur_a, await CursorHandler.get_by_watching_point(Point(0, 0)))
+
     @patch("datetime")
     @patch("CursorHandler._update")
     @patch("publish_data_event")
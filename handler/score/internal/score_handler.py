@@ -1,12 +1,14 @@
 from data.score import Score
 from event.payload import EventEnum, IdDataPayload
 
-from handler.storage.interface import KeyValueInterface, ListInterface
+from handler.storage.interface import KeyValueInterface, SortedInterface
 from handler.storage.dict import DictStorage
-from handler.storage.list.array import ArrayListStorage
+from handler.storage.sorted.skiplist import SkipListStorage
 from event.broker import EventBroker, publish_data_event
 from event.message import Message
 
+from dataclasses import replace
+
 
 class ScoreEvent(EventEnum):
     CREATED = "Score.created"
@@ -36,10 +38,14 @@ class ScoreHandler:
     __identify__: str = "Score"
     __event__: ScoreEvent
 
+    # 복사 없이 공유. rank는 반환할 때 replace로 채움
     score_storage: KeyValueInterface[str, Score] = DictStorage.create_space(
-        key=__identify__ + ".score"
+        key=__identify__ + ".score",
+        shared=True
     )
-    rank_index: ListInterface[str] = ArrayListStorage.create_space(
+    # id -> -value
+    # value 내림차순 정렬을 위해 음수로 저장, rank는 여기서 조회 시점에 계산
+    rank_index: SortedInterface[str, int] = SkipListStorage.create_space(
         key=__identify__ + ".rank"
     )
 
@@ -51,7 +57,7 @@ class ScoreHandler:
         if score is None:
             raise ScoreNotFoundException()
 
-        return score
+        return replace(score, rank=await cls.rank_index.index(id) + 1)
 
     @classmethod
     async def get_by_rank(cls, start: int, end: int | None = None) -> tuple[Score]:
@@ -61,32 +67,25 @@ class ScoreHandler:
         if not (1 <= start <= end <= await cls.rank_index.length()):
             raise RankOutOfRangeException()
 
-        async def get_score_by_idx(idx: int):
-            key = await cls.rank_index.get(idx)
-            score = await cls.score_storage.get(key)
-            return score
+        ids = await cls.rank_index.range(start-1, end)  # 1,2,3 -> 0,1,2
 
-        result = [
-            await get_score_by_idx(idx)
-            for idx in range(start-1, end)  # 1,2,3 -> 0,1,2
-        ]
+        result = []
+        for rank, id in enumerate(ids, start=start):
+            score = await cls.score_storage.get(id)
+            result.append(replace(score, rank=rank))
 
         return tuple(result)
 
     @classmethod
     async def increase(cls, id: str, value: int):
-        score = await cls.score_storage.get(id)
-        if score is None:
-            raise ScoreNotFoundException()
+        score = await cls.get(id)
 
         score.value += value
         return await cls.update(score)
 
     @classmethod
     async def update(cls, score: Score):
-        current = await cls.score_storage.get(score.id)
-        if current is None:
-            raise ScoreNotFoundException()
+        current = await cls.get(score.id)
 
         score = await cls.__update(current, score.value)
 
@@ -111,9 +110,7 @@ class ScoreHandler:
 
     @classmethod
     async def delete(cls, id: str):
-        score = await cls.score_storage.get(id)
-        if score is None:
-            raise ScoreNotFoundException()
+        score = await cls.get(id)
 
         await cls.__delete(score)
 
@@ -124,54 +121,29 @@ class ScoreHandler:
     @classmethod
     async def __delete(cls, score: Score):
         await cls.score_storage.delete(score.id)
-        await cls.rank_index.pop(score.rank - 1)
-
-        length = await cls.length()
-        await cls.__adjust_rank_range(score.rank, length)
+        await cls.rank_index.delete(score.id)
 
     @classmethod
     async def __create(cls, score: Score):
-        score = score.copy()
-        score.rank = await cls.rank_index.length() + 1
-
-        await cls.rank_index.append(score.id)
-        await cls.score_storage.set(score.id, score)
-        return score
+        return await cls.__save(score)
 
     @classmethod
     async def __update(cls, score: Score, new_value: int):
-        """score가 증가한다고만 가정"""
-        # 이전 score, 증가 new_socre:int
         score = score.copy()
-
-        before_rank = score.rank
-        score.rank = await cls.__find_rank(new_value)
         score.value = new_value
 
-        await cls.rank_index.pop(before_rank - 1)
-        await cls.rank_index.insert(score.rank - 1, score.id)
-        await cls.score_storage.set(score.id, score)
-
-        await cls.__adjust_rank_range(score.rank, before_rank)
-        return score
+        return await cls.__save(score)
 
     @classmethod
-    async def __adjust_rank_range(cls, start_rank: int, before_rank: int):
-        for idx in range(start_rank - 1, before_rank):
-            id = await cls.rank_index.get(idx)
-            score = await cls.score_storage.get(id)
-
-            score.rank = idx + 1
-            await cls.score_storage.set(score.id, score)
-
-    @classmethod
-    async def __find_rank(cls, value: int):
-        length = await cls.rank_index.length()
-        for i in range(length):
-            id = await cls.rank_index.get(i)
-            score = await cls.score_storage.get(id)
+    async def __save(cls, score: Score):
+        """
+        rank는 저장하지 않고 반환 시 채움
+        """
+        score = score.copy()
+        score.rank = None
 
-            if score.value < value:
-                return score.rank
+        await cls.rank_index.set(score.id, -score.value)
+        await cls.score_storage.set(score.id, score)
 
-        return length
+        score.rank = await cls.rank_index.index(score.id) + 1
+        return score
@@ -4,11 +4,9 @@ from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
 from unittest.mock import AsyncMock, MagicMock, call
 from tests.utils import PathPatch
 from handler.storage.dict import DictSpace
-from handler.storage.list.array import ArrayListSpace
+from handler.storage.sorted.skiplist import SkipListSpace
 from event.message import Message
 
-from data.payload import DataPayload
-
 patch = PathPatch("handler.score.internal.score_handler")
 
 
@@ -17,13 +15,17 @@ class ScoreHandler_TestCase(AsyncTestCase):
         self.score_a = Score("A", 100, 2)
         self.score_b = Score("B", 200, 1)
 
+        # rank는 저장되지 않고 조회 시 채워짐
         self.score_storage = DictSpace[str, Score](
             "score", {
-                "A": self.score_a,
-                "B": self.score_b
+                "A": Score("A", 100),
+                "B": Score("B", 200)
             })
-        self.rank_index = ArrayListSpace[str](
-            "rank", [self.score_b.id, self.score_a.id]
+        self.rank_index = SkipListSpace[str, int](
+            "rank", {
+                self.score_b.id: -self.score_b.value,
+                self.score_a.id: -self.score_a.value
+            }
         )
 
         ScoreHandler.score_storage = self.score_storage
@@ -67,7 +69,8 @@ class ScoreHandler_TestCase(AsyncTestCase):
     async def test_create(self, mock: AsyncMock):
         await ScoreHandler.create("C")
         mock.assert_called_once_with(ScoreEvent.CREATED, id="C")
-        self.assertEqual(self.score_storage.data["C"], Score("C", 0, 3))
+        self.assertEqual(self.score_storage.data["C"], Score("C", 0))
+        self.assertEqual(await ScoreHandler.get("C"), Score("C", 0, 3))
 
     @patch("publish_data_event")
     async def test_update(self, mock: AsyncMock):
@@ -75,10 +78,18 @@ class ScoreHandler_TestCase(AsyncTestCase):
 
         mock.assert_called_once_with(ScoreEvent.UPDATED, data=self.score_a)
 
-        self.assertNotEqual(self.score_storage.data["A"], self.score_a)
-        self.assertEqual(self.score_storage.data["A"], Score("A", 300, 1))
-        self.assertEqual(self.score_storage.data["A"], score)
-        self.assertEqual(self.score_storage.data["B"], Score("B", 200, 2))
+        self.assertEqual(self.score_storage.data["A"], Score("A", 300))
+        self.assertEqual(await ScoreHandler.get("A"), Score("A", 300, 1))
+        self.assertEqual(await ScoreHandler.get("A"), score)
+        self.assertEqual(await ScoreHandler.get("B"), Score("B", 200, 2))
+
+    @patch("publish_data_event")
+    async def test_update_tie(self, mock: AsyncMock):
+        # 같은 점수면 먼저 도달한 쪽이 높은 순위
+        score = await ScoreHandler.update(Score("A", 200))
+
+        self.assertEqual(score, Score("A", 200, 2))
+        self.assertEqual(await ScoreHandler.get("B"), Score("B", 200, 1))
 
     @patch("ScoreHandler.update")
     async def test_increase(self, mock: AsyncMock):
@@ -101,7 +112,8 @@ class ScoreHandler_TestCase(AsyncTestCase):
         mock.assert_called_once_with(ScoreEvent.DELETED, data=self.score_b)
 
         self.assertNotIn("B", self.score_storage.data)
-        self.assertEqual(self.score_storage.data["A"], Score("A", 100, 1))
+        self.assertEqual(await ScoreHandler.get("A"), Score("A", 100, 1))
+        self.assertEqual(await ScoreHandler.length(), 1)
 
     @patch("publish_data_event")
     async def test_delete_not_found(self, mock: AsyncMock):
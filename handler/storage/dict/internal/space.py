@@ -13,17 +13,30 @@ VALUE_TYPE = TypeVar(
 
 
 class DictSpace(Generic[KEY_TYPE, VALUE_TYPE], KeyValueInterface[KEY_TYPE, VALUE_TYPE]):
-    def __init__(self, name: str, data: dict):
+    """
+    shared면 get이 복사 없이 저장된 값을 그대로 반환한다.
+    반환된 값은 여러 곳에서 공유되므로 수정하면 안 되고, 바꿀 때는 새 값을 set 해야 한다.
+    set은 frozen dataclass가 아니면 한 번 복사해 저장한다.
+    """
+
+    def __init__(self, name: str, data: dict, shared: bool = False):
         self.name = name
+        self.shared = shared
         self.data: dict[KEY_TYPE, VALUE_TYPE] = copy(data)
 
     async def get(self, key: KEY_TYPE) -> VALUE_TYPE | None:
         if key not in self.data:
             return None
 
+        if self.shared:
+            return self.data[key]
         return copy(self.data[key])
 
     async def set(self, key: KEY_TYPE, value: VALUE_TYPE):
+        if self.shared and is_frozen(value):
+            self.data[key] = value
+            return
+
         self.data[key] = copy(value)
 
     async def delete(self, key: KEY_TYPE):
@@ -31,3 +44,8 @@ class DictSpace(Generic[KEY_TYPE, VALUE_TYPE], KeyValueInterface[KEY_TYPE, VALUE
 
     async def keys(self) -> Iterable[KEY_TYPE]:
         return self.data.keys()
+
+
+def is_frozen(value) -> bool:
+    params = getattr(value, "__dataclass_params__", None)
+    return params is not None and params.frozen
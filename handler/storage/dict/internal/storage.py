@@ -5,11 +5,14 @@ from handler.storage.interface import (
 
 class DictStorage(Storage):
     @staticmethod
-    def create_space(key: str):
+    def create_space(key: str, shared: bool = False):
+        """
+        shared: get에서 복사하지 않고 저장된 값을 공유함. (DictSpace 참고)
+        """
         if key in DictStorage.spaces:
             raise DuplicateSpaceException
 
-        space = DictSpace(name=key, data={})
+        space = DictSpace(name=key, data={}, shared=shared)
         DictStorage.spaces[key] = space
 
         return space
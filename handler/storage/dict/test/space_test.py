@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from data.base import DataObj
 from handler.storage.dict import DictSpace
 from handler.storage.interface.test.key_value_test import KeyValueInterface_TestCase
+from handler.storage.interface.test.example_data import ExampleData
 
 # 숙제
 # 사용성 개선
@@ -17,3 +18,44 @@ class DictSpace_TestCase(KeyValueInterface_TestCase, AsyncTestCase):
             name="example", 
             data=self.init_data
         )
+
+
+@dataclass(frozen=True)
+class FrozenData(DataObj):
+    data: int
+
+
+class DictSpace_Shared_TestCase(AsyncTestCase):
+    def setUp(self):
+        self.data = ExampleData(1)
+        self.storage = DictSpace(
+            name="example",
+            data={"A": self.data},
+            shared=True
+        )
+
+    async def test_get_shared(self):
+        first = await self.storage.get("A")
+        second = await self.storage.get("A")
+
+        self.assertEqual(first, ExampleData(1))
+        self.assertIs(first, second)
+
+    async def test_set_mutable(self):
+        input = ExampleData(2)
+        await self.storage.set("A", input)
+
+        # 변경 가능한 값은 set 할 때 한 번 복사
+        input.data = 3
+        got = await self.storage.get("A")
+
+        self.assertEqual(got, ExampleData(2))
+        self.assertIsNot(got, input)
+
+    async def test_set_frozen(self):
+        input = FrozenData(2)
+        await self.storage.set("A", input)
+
+        got = await self.storage.get("A")
+
+        self.assertIs(got, input)
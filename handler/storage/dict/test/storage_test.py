@@ -17,4 +17,10 @@ class DictStorage_TestCase(Storage_TestCase, TestCase):
 
 
     def tearDown(self):
-        DictStorage.spaces = {}
\ No newline at end of file
+        DictStorage.spaces = {}
+
+    def test_create_shared(self):
+        space = DictStorage.create_space("B", shared=True)
+
+        self.assertTrue(space.shared)
+        self.assertFalse(DictStorage.create_space("C").shared)
\ No newline at end of file
@@ -11,4 +11,16 @@ from .internal.key_value import (
 from .internal.list import (
     ListInterface,
     IndexOutOfRangeException
+)
+
+from .internal.spatial import (
+    SpatialInterface,
+    Rect,
+    to_rect,
+    to_range,
+    is_rect_overlap
+)
+
+from .internal.sorted import (
+    SortedInterface
 )
\ No newline at end of file
@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar, Iterable
+
+KEY_TYPE = TypeVar(
+    "KEY_TYPE"
+)
+VALUE_TYPE = TypeVar(
+    "VALUE_TYPE"
+)
+
+
+class SortedInterface(Generic[KEY_TYPE, VALUE_TYPE], ABC):
+    """
+    key들을 value 오름차순으로 유지하는 순서 통계 인덱스.
+    value가 같으면 먼저 set된 key가 앞에 온다.
+    idx는 0부터 시작한다.
+    """
+    @abstractmethod
+    async def length(self) -> int:
+        pass
+
+    @abstractmethod
+    async def keys(self) -> Iterable[KEY_TYPE]:
+        pass
+
+    @abstractmethod
+    async def get(self, key: KEY_TYPE) -> VALUE_TYPE | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: KEY_TYPE, value: VALUE_TYPE):
+        """
+        이미 있는 key면 value를 갱신하고 위치를 다시 잡음
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: KEY_TYPE):
+        pass
+
+    @abstractmethod
+    async def index(self, key: KEY_TYPE) -> int | None:
+        """
+        key의 순서, 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    async def at(self, idx: int) -> KEY_TYPE:
+        """
+        idx번째 key, 범위 밖이면 IndexOutOfRangeException
+        """
+        pass
+
+    @abstractmethod
+    async def range(self, start: int, end: int) -> list[KEY_TYPE]:
+        """
+        [start, end) 순서의 key들, 범위 밖이면 IndexOutOfRangeException
+        """
+        pass
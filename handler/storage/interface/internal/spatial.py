@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar, Iterable
+from data.board import Point, PointRange
+
+KEY_TYPE = TypeVar(
+    "KEY_TYPE"
+)
+
+# 구현체 내부 표현: (left, top, right, bottom)
+Rect = tuple[int, int, int, int]
+
+
+def to_rect(range: PointRange) -> Rect:
+    return (
+        range.top_left.x, range.top_left.y,
+        range.bottom_right.x, range.bottom_right.y
+    )
+
+
+def to_range(rect: Rect) -> PointRange:
+    left, top, right, bottom = rect
+    return PointRange(
+        top_left=Point(left, top),
+        bottom_right=Point(right, bottom)
+    )
+
+
+def is_rect_overlap(a: Rect, b: Rect) -> bool:
+    return \
+        a[0] <= b[2] and b[0] <= a[2] and \
+        a[3] <= b[1] and b[3] <= a[1]
+
+
+class SpatialInterface(Generic[KEY_TYPE], ABC):
+    """
+    key마다 하나의 영역(PointRange)을 저장하고,
+    특정 영역과 겹치는 key들을 조회할 수 있는 공간 인덱스.
+    점은 PointRange(p, p)로 저장한다.
+    """
+    @abstractmethod
+    async def keys(self) -> Iterable[KEY_TYPE]:
+        pass
+
+    @abstractmethod
+    async def get(self, key: KEY_TYPE) -> PointRange | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: KEY_TYPE, range: PointRange):
+        """
+        이미 있는 key면 영역을 갱신
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: KEY_TYPE):
+        pass
+
+    @abstractmethod
+    async def query(self, range: PointRange) -> list[KEY_TYPE]:
+        """
+        range와 겹치는(경계 포함) 영역을 가진 key들을 반환
+        """
+        pass
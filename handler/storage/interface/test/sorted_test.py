@@ -0,0 +1,78 @@
+from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
+from unittest.mock import AsyncMock, MagicMock
+from tests.utils import cases
+
+from handler.storage.interface import (
+    SortedInterface, IndexOutOfRangeException
+)
+
+
+class SortedInterface_TestCase():
+    def setUp(self):
+        self.storage: SortedInterface
+        self.init_data = {
+            "A": 30,
+            "B": 10,
+            "C": 20,
+        }
+
+    async def test_length(self: AsyncTestCase):
+        self.assertEqual(await self.storage.length(), 3)
+
+    async def test_keys(self: AsyncTestCase):
+        self.assertCountEqual(list(await self.storage.keys()), ["A", "B", "C"])
+
+    async def test_get(self: AsyncTestCase):
+        self.assertEqual(await self.storage.get("A"), 30)
+        self.assertIsNone(await self.storage.get("D"))
+
+    @cases([
+        {"key": "B", "idx": 0},
+        {"key": "C", "idx": 1},
+        {"key": "A", "idx": 2},
+        {"key": "D", "idx": None},
+    ])
+    async def test_index(self: AsyncTestCase, key: str, idx: int | None):
+        self.assertEqual(await self.storage.index(key), idx)
+
+    async def test_at(self: AsyncTestCase):
+        self.assertEqual(await self.storage.at(0), "B")
+        self.assertEqual(await self.storage.at(2), "A")
+
+    async def test_at_out_of_range(self: AsyncTestCase):
+        with self.assertRaises(IndexOutOfRangeException):
+            await self.storage.at(3)
+        with self.assertRaises(IndexOutOfRangeException):
+            await self.storage.at(-1)
+
+    async def test_range(self: AsyncTestCase):
+        self.assertEqual(await self.storage.range(0, 3), ["B", "C", "A"])
+        self.assertEqual(await self.storage.range(1, 2), ["C"])
+        self.assertEqual(await self.storage.range(1, 1), [])
+
+    async def test_range_out_of_range(self: AsyncTestCase):
+        with self.assertRaises(IndexOutOfRangeException):
+            await self.storage.range(0, 4)
+        with self.assertRaises(IndexOutOfRangeException):
+            await self.storage.range(2, 1)
+
+    async def test_set_update(self: AsyncTestCase):
+        await self.storage.set("A", 0)
+
+        self.assertEqual(await self.storage.range(0, 3), ["A", "B", "C"])
+        self.assertEqual(await self.storage.get("A"), 0)
+
+    async def test_set_tie(self: AsyncTestCase):
+        # 같은 value면 나중에 set된 key가 뒤로 감
+        await self.storage.set("D", 20)
+        await self.storage.set("B", 20)
+
+        self.assertEqual(await self.storage.range(0, 4), ["C", "D", "B", "A"])
+
+    async def test_delete(self: AsyncTestCase):
+        await self.storage.delete("C")
+        await self.storage.delete("D")
+
+        self.assertEqual(await self.storage.length(), 2)
+        self.assertEqual(await self.storage.range(0, 2), ["B", "A"])
+        self.assertIsNone(await self.storage.index("C"))
@@ -0,0 +1,74 @@
+from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
+from unittest.mock import AsyncMock, MagicMock
+from tests.utils import cases
+
+from data.board import Point, PointRange
+from handler.storage.interface import (
+    SpatialInterface
+)
+
+
+def point_range(x: int, y: int):
+    return PointRange(Point(x, y), Point(x, y))
+
+
+class SpatialInterface_TestCase():
+    def setUp(self):
+        self.storage: SpatialInterface
+        self.init_data = {
+            "A": point_range(0, 0),
+            "B": PointRange(Point(-10, 10), Point(10, -10)),
+            "C": point_range(250, -250),
+        }
+
+    async def test_keys(self: AsyncTestCase):
+        keys = await self.storage.keys()
+
+        self.assertCountEqual(list(keys), ["A", "B", "C"])
+
+    async def test_get_normal(self: AsyncTestCase):
+        got = await self.storage.get("B")
+
+        self.assertEqual(got, self.init_data["B"])
+
+    async def test_get_not_found(self: AsyncTestCase):
+        got = await self.storage.get("D")
+
+        self.assertIsNone(got)
+
+    @cases([
+        {"range": point_range(0, 0), "keys": ["A", "B"]},
+        {"range": point_range(10, -10), "keys": ["B"]},
+        {"range": point_range(11, 0), "keys": []},
+        {"range": PointRange(Point(-300, 300), Point(300, -300)), "keys": ["A", "B", "C"]},
+        # 모서리가 서로 포함되지 않는 교차
+        {"range": PointRange(Point(-20, 1), Point(20, -1)), "keys": ["A", "B"]},
+    ])
+    async def test_query(self: AsyncTestCase, range: PointRange, keys: list[str]):
+        got = await self.storage.query(range)
+
+        self.assertCountEqual(got, keys)
+
+    async def test_set_create(self: AsyncTestCase):
+        await self.storage.set("D", point_range(-150, 150))
+
+        got = await self.storage.query(point_range(-150, 150))
+        self.assertCountEqual(got, ["D"])
+
+    async def test_set_update(self: AsyncTestCase):
+        await self.storage.set("A", point_range(250, -250))
+
+        self.assertCountEqual(await self.storage.query(point_range(0, 0)), ["B"])
+        self.assertCountEqual(await self.storage.query(point_range(250, -250)), ["A", "C"])
+        self.assertEqual(await self.storage.get("A"), point_range(250, -250))
+
+    async def test_delete_normal(self: AsyncTestCase):
+        await self.storage.delete("B")
+
+        self.assertIsNone(await self.storage.get("B"))
+        self.assertCountEqual(await self.storage.query(point_range(0, 0)), ["A"])
+
+    async def test_delete_not_found(self: AsyncTestCase):
+        await self.storage.delete("D")
+
+        self.assertCountEqual(list(await self.storage.keys()), ["A", "B", "C"])
@@ -0,0 +1,2 @@
+from .internal.space import SkipListSpace
+from .internal.storage import SkipListStorage
\ No newline at end of file
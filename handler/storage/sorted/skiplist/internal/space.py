@@ -0,0 +1,181 @@
+from __future__ import annotations
+from handler.storage.interface import SortedInterface, IndexOutOfRangeException
+from typing import Generic, TypeVar, Iterable
+from itertools import count
+from random import random
+
+KEY_TYPE = TypeVar(
+    "KEY_TYPE"
+)
+VALUE_TYPE = TypeVar(
+    "VALUE_TYPE"
+)
+
+MAX_LEVEL = 32
+
+
+def random_level() -> int:
+    level = 1
+    while level < MAX_LEVEL and random() < 0.5:
+        level += 1
+    return level
+
+
+class _Node:
+    """
+    width[level]: next[level]까지의 거리(next가 없으면 끝+1까지의 거리)
+    """
+    __slots__ = ("key", "order", "next", "width")
+
+    def __init__(self, key, order, level: int):
+        self.key = key
+        self.order = order
+        self.next: list[_Node | None] = [None] * level
+        self.width: list[int] = [1] * level
+
+
+class SkipListSpace(Generic[KEY_TYPE, VALUE_TYPE], SortedInterface[KEY_TYPE, VALUE_TYPE]):
+    """
+    indexable skip list.
+    set, delete, index, at 모두 O(log n)
+    """
+
+    def __init__(self, name: str, data: dict[KEY_TYPE, VALUE_TYPE]):
+        self.name = name
+
+        self.head = _Node(None, None, MAX_LEVEL)
+        self.size = 0
+
+        # key -> (value, 순번)
+        # 순번으로 같은 value 사이의 순서를 정함
+        self.orders: dict[KEY_TYPE, tuple[VALUE_TYPE, int]] = {}
+        self.counter = count()
+
+        for key, value in data.items():
+            self._insert(key, value)
+
+    def _insert(self, key: KEY_TYPE, value: VALUE_TYPE):
+        order = (value, next(self.counter))
+        self.orders[key] = order
+
+        chain: list[_Node] = [self.head] * MAX_LEVEL
+        steps = [0] * MAX_LEVEL
+
+        node = self.head
+        for level in reversed(range(MAX_LEVEL)):
+            while (nxt := node.next[level]) is not None and nxt.order <= order:
+                steps[level] += node.width[level]
+                node = nxt
+            chain[level] = node
+
+        level_count = random_level()
+        new = _Node(key, order, level_count)
+
+        passed = 0
+        for level in range(level_count):
+            prev = chain[level]
+            new.next[level] = prev.next[level]
+            prev.next[level] = new
+            new.width[level] = prev.width[level] - passed
+            prev.width[level] = passed + 1
+            passed += steps[level]
+
+        for level in range(level_count, MAX_LEVEL):
+            chain[level].width[level] += 1
+
+        self.size += 1
+
+    def _remove(self, key: KEY_TYPE):
+        order = self.orders.pop(key)
+
+        chain: list[_Node] = [self.head] * MAX_LEVEL
+        node = self.head
+        for level in reversed(range(MAX_LEVEL)):
+            while (nxt := node.next[level]) is not None and nxt.order < order:
+                node = nxt
+            chain[level] = node
+
+        target = chain[0].next[0]
+        assert target is not None and target.key == key
+
+        level_count = len(target.next)
+        for level in range(level_count):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+
+        for level in range(level_count, MAX_LEVEL):
+            chain[level].width[level] -= 1
+
+        self.size -= 1
+
+    def _node_at(self, idx: int) -> _Node:
+        pos = idx + 1
+        node = self.head
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and node.width[level] <= pos:
+                pos -= node.width[level]
+                node = node.next[level]
+        return node
+
+    async def length(self) -> int:
+        return self.size
+
+    async def keys(self) -> Iterable[KEY_TYPE]:
+        return self.orders.keys()
+
+    async def get(self, key: KEY_TYPE) -> VALUE_TYPE | None:
+        if key not in self.orders:
+            return None
+
+        return self.orders[key][0]
+
+    async def set(self, key: KEY_TYPE, value: VALUE_TYPE):
+        if key in self.orders:
+            if self.orders[key][0] == value:
+                return
+            self._remove(key)
+
+        self._insert(key, value)
+
+    async def delete(self, key: KEY_TYPE):
+        if key not in self.orders:
+            return
+
+        self._remove(key)
+
+    async def index(self, key: KEY_TYPE) -> int | None:
+        if key not in self.orders:
+            return None
+
+        order = self.orders[key]
+
+        pos = 0
+        node = self.head
+        for level in reversed(range(MAX_LEVEL)):
+            while (nxt := node.next[level]) is not None and nxt.order < order:
+                pos += node.width[level]
+                node = nxt
+
+        return pos
+
+    async def at(self, idx: int) -> KEY_TYPE:
+        if not (0 <= idx < self.size):
+            raise IndexOutOfRangeException()
+
+        return self._node_at(idx).key
+
+    async def range(self, start: int, end: int) -> list[KEY_TYPE]:
+        if not (0 <= start <= end <= self.size):
+            raise IndexOutOfRangeException()
+        if start == end:
+            return []
+
+        node = self._node_at(start)
+
+        result = []
+        for _ in range(end - start):
+            result.append(node.key)
+            node = node.next[0]
+
+        return result
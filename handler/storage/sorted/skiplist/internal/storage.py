@@ -0,0 +1,23 @@
+from .space import SkipListSpace
+from handler.storage.interface import (
+    DuplicateSpaceException, SpaceNotFoundException, Storage
+)
+
+
+class SkipListStorage(Storage):
+    @staticmethod
+    def create_space(key: str):
+        if key in SkipListStorage.spaces:
+            raise DuplicateSpaceException
+
+        space = SkipListSpace(name=key, data={})
+        SkipListStorage.spaces[key] = space
+
+        return space
+
+    @staticmethod
+    def get_space(key: str):
+        if key not in SkipListStorage.spaces:
+            raise SpaceNotFoundException
+
+        return SkipListStorage.spaces[key]
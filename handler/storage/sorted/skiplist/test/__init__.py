@@ -0,0 +1,2 @@
+from .space_test import SkipListSpace_TestCase
+from .storage_test import SkipListStorage_TestCase
@@ -0,0 +1,53 @@
+from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
+from random import Random
+
+from handler.storage.sorted.skiplist import SkipListSpace
+
+from handler.storage.interface.test.sorted_test import SortedInterface_TestCase
+
+
+class SkipListSpace_TestCase(SortedInterface_TestCase, AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.storage = SkipListSpace(
+            name="example",
+            data=self.init_data
+        )
+
+    async def test_many_random(self):
+        """
+        set/delete를 반복해도 정렬된 list와 같아야 함
+        """
+        rand = Random(0)
+        expected: list[tuple[int, int, int]] = []  # (value, 순번, key)
+        self.storage = SkipListSpace(name="example", data={})
+
+        for step in range(1000):
+            key = rand.randint(0, 200)
+            value = rand.randint(0, 50)
+            prev = [e for e in expected if e[2] == key]
+            delete = rand.random() < 0.3
+
+            if delete:
+                await self.storage.delete(key)
+            else:
+                await self.storage.set(key, value)
+
+            # 같은 value로 set하면 위치 유지
+            if not delete and prev and prev[0][0] == value:
+                continue
+
+            expected = [e for e in expected if e[2] != key]
+            if not delete:
+                expected.append((value, step, key))
+                expected.sort()
+
+            if step % 100 > 10:
+                continue
+
+            keys = [e[2] for e in expected]
+            self.assertEqual(await self.storage.length(), len(keys))
+            self.assertEqual(await self.storage.range(0, len(keys)), keys)
+            for idx, key in enumerate(keys):
+                self.assertEqual(await self.storage.index(key), idx)
+                self.assertEqual(await self.storage.at(idx), key)
@@ -0,0 +1,14 @@
+from unittest import TestCase
+
+from handler.storage.sorted.skiplist import SkipListStorage
+from handler.storage.interface.test.storage_test import Storage_TestCase
+
+
+class SkipListStorage_TestCase(Storage_TestCase, TestCase):
+    def setUp(self):
+        super().setUp()
+        SkipListStorage.spaces = self.init_data
+        self.storage = SkipListStorage
+
+    def tearDown(self):
+        SkipListStorage.spaces = {}
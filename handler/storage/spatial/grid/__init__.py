@@ -0,0 +1,2 @@
+from .internal.space import GridSpace
+from .internal.storage import GridStorage
\ No newline at end of file
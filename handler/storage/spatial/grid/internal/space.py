@@ -0,0 +1,114 @@
+from handler.storage.interface import SpatialInterface, Rect, to_rect, to_range, is_rect_overlap
+from typing import Generic, TypeVar, Iterable
+from data.board import PointRange
+
+KEY_TYPE = TypeVar(
+    "KEY_TYPE"
+)
+
+Cell = tuple[int, int]
+
+DEFAULT_CELL_SIZE = 100
+
+
+class GridSpace(Generic[KEY_TYPE], SpatialInterface[KEY_TYPE]):
+    """
+    균일 격자(uniform grid) 공간 인덱스.
+    각 영역은 자신이 걸치는 모든 cell에 등록되며,
+    query는 range 아래의 cell들만 확인한다.
+    """
+
+    def __init__(self, name: str, data: dict[KEY_TYPE, PointRange], cell_size: int = DEFAULT_CELL_SIZE):
+        assert cell_size > 0
+
+        self.name = name
+        self.cell_size = cell_size
+
+        self.data: dict[KEY_TYPE, Rect] = {}
+        self.cells: dict[Cell, set[KEY_TYPE]] = {}
+
+        for key, range in data.items():
+            self._insert(key, to_rect(range))
+
+    def _cell_bound(self, rect: Rect) -> Rect:
+        left, top, right, bottom = rect
+        size = self.cell_size
+        return (left // size, top // size, right // size, bottom // size)
+
+    def _cells_of(self, rect: Rect) -> Iterable[Cell]:
+        left, top, right, bottom = self._cell_bound(rect)
+        for cy in range(bottom, top + 1):
+            for cx in range(left, right + 1):
+                yield (cx, cy)
+
+    def _insert(self, key: KEY_TYPE, rect: Rect):
+        self.data[key] = rect
+        for cell in self._cells_of(rect):
+            if cell not in self.cells:
+                self.cells[cell] = set()
+            self.cells[cell].add(key)
+
+    def _remove(self, key: KEY_TYPE):
+        rect = self.data.pop(key)
+        for cell in self._cells_of(rect):
+            keys = self.cells[cell]
+            keys.discard(key)
+            if len(keys) == 0:
+                del self.cells[cell]
+
+    async def keys(self) -> Iterable[KEY_TYPE]:
+        return self.data.keys()
+
+    async def get(self, key: KEY_TYPE) -> PointRange | None:
+        if key not in self.data:
+            return None
+
+        return to_range(self.data[key])
+
+    async def set(self, key: KEY_TYPE, range: PointRange):
+        rect = to_rect(range)
+
+        if key in self.data:
+            if self.data[key] == rect:
+                return
+            self._remove(key)
+
+        self._insert(key, rect)
+
+    async def delete(self, key: KEY_TYPE):
+        if key not in self.data:
+            return
+
+        self._remove(key)
+
+    async def query(self, range: PointRange) -> list[KEY_TYPE]:
+        rect = to_rect(range)
+        left, top, right, bottom = self._cell_bound(rect)
+
+        cell_count = (right - left + 1) * (top - bottom + 1)
+        if cell_count <= len(self.cells):
+            cells = (
+                self.cells[cell]
+                for cell in self._cells_of(rect)
+                if cell in self.cells
+            )
+        else:
+            # range가 점유된 cell 수보다 넓으면 점유된 cell만 순회
+            cells = (
+                keys
+                for (cx, cy), keys in self.cells.items()
+                if left <= cx <= right and bottom <= cy <= top
+            )
+
+        result = []
+        seen = set()
+        for keys in cells:
+            for key in keys:
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                if is_rect_overlap(self.data[key], rect):
+                    result.append(key)
+
+        return result
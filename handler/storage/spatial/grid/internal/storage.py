@@ -0,0 +1,23 @@
+from .space import GridSpace
+from handler.storage.interface import (
+    DuplicateSpaceException, SpaceNotFoundException, Storage
+)
+
+
+class GridStorage(Storage):
+    @staticmethod
+    def create_space(key: str):
+        if key in GridStorage.spaces:
+            raise DuplicateSpaceException
+
+        space = GridSpace(name=key, data={})
+        GridStorage.spaces[key] = space
+
+        return space
+
+    @staticmethod
+    def get_space(key: str):
+        if key not in GridStorage.spaces:
+            raise SpaceNotFoundException
+
+        return GridStorage.spaces[key]
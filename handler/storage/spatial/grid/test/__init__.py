@@ -0,0 +1,2 @@
+from .space_test import GridSpace_TestCase
+from .storage_test import GridStorage_TestCase
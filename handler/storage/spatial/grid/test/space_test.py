@@ -0,0 +1,28 @@
+from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
+
+from data.board import Point, PointRange
+from handler.storage.spatial.grid import GridSpace
+
+from handler.storage.interface.test.spatial_test import SpatialInterface_TestCase
+
+
+class GridSpace_TestCase(SpatialInterface_TestCase, AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.storage = GridSpace(
+            name="example",
+            data=self.init_data,
+            cell_size=100
+        )
+
+    async def test_cells(self):
+        # B는 (-10, 10) ~ (10, -10) -> 4개의 cell에 걸쳐있음
+        self.assertCountEqual(
+            [cell for cell, keys in self.storage.cells.items() if "B" in keys],
+            [(-1, -1), (-1, 0), (0, -1), (0, 0)]
+        )
+
+        await self.storage.delete("B")
+        await self.storage.delete("A")
+
+        self.assertCountEqual(self.storage.cells.keys(), [(2, -3)])
@@ -0,0 +1,14 @@
+from unittest import TestCase
+
+from handler.storage.spatial.grid import GridStorage
+from handler.storage.interface.test.storage_test import Storage_TestCase
+
+
+class GridStorage_TestCase(Storage_TestCase, TestCase):
+    def setUp(self):
+        super().setUp()
+        GridStorage.spaces = self.init_data
+        self.storage = GridStorage
+
+    def tearDown(self):
+        GridStorage.spaces = {}
@@ -0,0 +1,2 @@
+from .internal.space import RTreeSpace
+from .internal.storage import RTreeStorage
\ No newline at end of file
@@ -0,0 +1,254 @@
+from __future__ import annotations
+from handler.storage.interface import SpatialInterface, Rect, to_rect, to_range, is_rect_overlap
+from typing import Generic, TypeVar, Iterable
+from data.board import PointRange
+
+KEY_TYPE = TypeVar(
+    "KEY_TYPE"
+)
+
+MAX_ENTRIES = 8
+MIN_ENTRIES = 3
+
+
+def union(a: Rect, b: Rect) -> Rect:
+    return (
+        min(a[0], b[0]), max(a[1], b[1]),
+        max(a[2], b[2]), min(a[3], b[3])
+    )
+
+
+def area(rect: Rect) -> int:
+    left, top, right, bottom = rect
+    return (right - left + 1) * (top - bottom + 1)
+
+
+def enlargement(rect: Rect, added: Rect) -> int:
+    return area(union(rect, added)) - area(rect)
+
+
+class _Node:
+    """
+    leaf면 children은 key, 아니면 children은 _Node.
+    rect는 children 전체를 감싸는 최소 영역(비어있으면 None).
+    """
+    __slots__ = ("leaf", "children", "parent", "rect")
+
+    def __init__(self, leaf: bool, parent: _Node | None = None):
+        self.leaf = leaf
+        self.children: list = []
+        self.parent = parent
+        self.rect: Rect | None = None
+
+
+class RTreeSpace(Generic[KEY_TYPE], SpatialInterface[KEY_TYPE]):
+    """
+    R-tree(Guttman, quadratic split) 공간 인덱스.
+    크기가 제각각인 영역(커서 시야 등)을 한 번씩만 저장하며,
+    query는 range와 겹치는 노드만 내려간다.
+    """
+
+    def __init__(self, name: str, data: dict[KEY_TYPE, PointRange]):
+        self.name = name
+
+        self.data: dict[KEY_TYPE, Rect] = {}
+        self.leaf_of: dict[KEY_TYPE, _Node] = {}
+        self.root = _Node(leaf=True)
+
+        for key, range in data.items():
+            self._insert(key, to_rect(range))
+
+    def _rect_of(self, node: _Node, child) -> Rect:
+        if node.leaf:
+            return self.data[child]
+        return child.rect
+
+    def _refresh(self, node: _Node):
+        rect = None
+        for child in node.children:
+            child_rect = self._rect_of(node, child)
+            rect = child_rect if rect is None else union(rect, child_rect)
+        node.rect = rect
+
+    def _choose_leaf(self, rect: Rect) -> _Node:
+        node = self.root
+        while not node.leaf:
+            node = min(
+                node.children,
+                key=lambda c: (enlargement(c.rect, rect), area(c.rect))
+            )
+        return node
+
+    def _split(self, node: _Node) -> _Node:
+        """
+        node의 children을 두 그룹으로 나누고 새 형제 노드를 반환
+        """
+        children = node.children
+        rects = [self._rect_of(node, c) for c in children]
+
+        # 함께 두면 가장 낭비가 큰 두 child를 seed로 선택
+        seed_a, seed_b, worst = 0, 1, None
+        for i in range(len(children)):
+            for j in range(i + 1, len(children)):
+                waste = area(union(rects[i], rects[j])) - area(rects[i]) - area(rects[j])
+                if worst is None or waste > worst:
+                    seed_a, seed_b, worst = i, j, waste
+
+        group_a, group_b = [seed_a], [seed_b]
+        rect_a, rect_b = rects[seed_a], rects[seed_b]
+        rest = [i for i in range(len(children)) if i not in (seed_a, seed_b)]
+
+        while rest:
+            # 최소 개수를 채워야 하는 그룹이 있으면 남은 것을 모두 넘김
+            if len(group_a) + len(rest) == MIN_ENTRIES:
+                group_a += rest
+                break
+            if len(group_b) + len(rest) == MIN_ENTRIES:
+                group_b += rest
+                break
+
+            # 두 그룹 간 선호 차이가 가장 큰 child부터 배정
+            idx = max(
+                rest,
+                key=lambda i: abs(enlargement(rect_a, rects[i]) - enlargement(rect_b, rects[i]))
+            )
+            rest.remove(idx)
+
+            d_a = enlargement(rect_a, rects[idx])
+            d_b = enlargement(rect_b, rects[idx])
+            if (d_a, area(rect_a), len(group_a)) <= (d_b, area(rect_b), len(group_b)):
+                group_a.append(idx)
+                rect_a = union(rect_a, rects[idx])
+            else:
+                group_b.append(idx)
+                rect_b = union(rect_b, rects[idx])
+
+        sibling = _Node(leaf=node.leaf, parent=node.parent)
+        node.children = [children[i] for i in group_a]
+        sibling.children = [children[i] for i in group_b]
+
+        for target in (node, sibling):
+            for child in target.children:
+                if target.leaf:
+                    self.leaf_of[child] = target
+                else:
+                    child.parent = target
+            self._refresh(target)
+
+        return sibling
+
+    def _adjust(self, node: _Node):
+        """
+        node부터 root까지 rect를 갱신하고 넘친 노드를 분할
+        """
+        while node is not None:
+            if len(node.children) > MAX_ENTRIES:
+                sibling = self._split(node)
+
+                if node.parent is None:
+                    root = _Node(leaf=False)
+                    root.children = [node, sibling]
+                    node.parent = sibling.parent = root
+                    self._refresh(root)
+                    self.root = root
+                    return
+
+                node.parent.children.append(sibling)
+            else:
+                self._refresh(node)
+
+            node = node.parent
+
+    def _insert(self, key: KEY_TYPE, rect: Rect):
+        self.data[key] = rect
+
+        leaf = self._choose_leaf(rect)
+        leaf.children.append(key)
+        self.leaf_of[key] = leaf
+
+        self._adjust(leaf)
+
+    def _collect_keys(self, node: _Node) -> list[KEY_TYPE]:
+        if node.leaf:
+            return list(node.children)
+
+        keys = []
+        for child in node.children:
+            keys += self._collect_keys(child)
+        return keys
+
+    def _remove(self, key: KEY_TYPE):
+        leaf = self.leaf_of.pop(key)
+        leaf.children.remove(key)
+
+        # 최소 개수 미만인 노드를 떼어내고, 그 key들을 재삽입
+        orphans: list[KEY_TYPE] = []
+        node = leaf
+        while node.parent is not None:
+            parent = node.parent
+            if len(node.children) < MIN_ENTRIES:
+                parent.children.remove(node)
+                orphans += self._collect_keys(node)
+            else:
+                self._refresh(node)
+            node = parent
+        self._refresh(self.root)
+
+        while not self.root.leaf and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+            self.root.parent = None
+
+        if not self.root.leaf and len(self.root.children) == 0:
+            self.root = _Node(leaf=True)
+
+        for orphan in orphans:
+            rect = self.data.pop(orphan)
+            del self.leaf_of[orphan]
+            self._insert(orphan, rect)
+
+        self.data.pop(key)
+
+    async def keys(self) -> Iterable[KEY_TYPE]:
+        return self.data.keys()
+
+    async def get(self, key: KEY_TYPE) -> PointRange | None:
+        if key not in self.data:
+            return None
+
+        return to_range(self.data[key])
+
+    async def set(self, key: KEY_TYPE, range: PointRange):
+        rect = to_rect(range)
+
+        if key in self.data:
+            if self.data[key] == rect:
+                return
+            self._remove(key)
+
+        self._insert(key, rect)
+
+    async def delete(self, key: KEY_TYPE):
+        if key not in self.data:
+            return
+
+        self._remove(key)
+
+    async def query(self, range: PointRange) -> list[KEY_TYPE]:
+        rect = to_rect(range)
+
+        result = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.rect is None or not is_rect_overlap(node.rect, rect):
+                continue
+
+            if node.leaf:
+                result += [
+                    key for key in node.children
+                    if is_rect_overlap(self.data[key], rect)
+                ]
+            else:
+                stack += node.children
+
+        return result
@@ -0,0 +1,23 @@
+from .space import RTreeSpace
+from handler.storage.interface import (
+    DuplicateSpaceException, SpaceNotFoundException, Storage
+)
+
+
+class RTreeStorage(Storage):
+    @staticmethod
+    def create_space(key: str):
+        if key in RTreeStorage.spaces:
+            raise DuplicateSpaceException
+
+        space = RTreeSpace(name=key, data={})
+        RTreeStorage.spaces[key] = space
+
+        return space
+
+    @staticmethod
+    def get_space(key: str):
+        if key not in RTreeStorage.spaces:
+            raise SpaceNotFoundException
+
+        return RTreeStorage.spaces[key]
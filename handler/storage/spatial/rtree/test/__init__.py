@@ -0,0 +1,2 @@
+from .space_test import RTreeSpace_TestCase
+from .storage_test import RTreeStorage_TestCase
@@ -0,0 +1,74 @@
+from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
+from random import Random
+
+from data.board import Point, PointRange
+from handler.storage.spatial.rtree import RTreeSpace
+from handler.storage.spatial.rtree.internal.space import MAX_ENTRIES, MIN_ENTRIES
+
+from handler.storage.interface.test.spatial_test import SpatialInterface_TestCase
+
+
+def random_range(rand: Random):
+    x, y = rand.randint(-500, 500), rand.randint(-500, 500)
+    w, h = rand.randint(0, 50), rand.randint(0, 50)
+    return PointRange(Point(x - w, y + h), Point(x + w, y - h))
+
+
+class RTreeSpace_TestCase(SpatialInterface_TestCase, AsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.storage = RTreeSpace(
+            name="example",
+            data=self.init_data
+        )
+
+    def assert_valid_node(self, node, is_root=True):
+        if not is_root:
+            self.assertGreaterEqual(len(node.children), MIN_ENTRIES)
+        self.assertLessEqual(len(node.children), MAX_ENTRIES)
+
+        if node.leaf:
+            for key in node.children:
+                self.assertIs(self.storage.leaf_of[key], node)
+            return
+
+        for child in node.children:
+            self.assertIs(child.parent, node)
+            self.assert_valid_node(child, is_root=False)
+
+    async def test_many_random(self):
+        """
+        삽입/갱신/삭제를 반복해도 전체 순회 결과와 같아야 함
+        """
+        rand = Random(0)
+        expected: dict[int, PointRange] = {}
+        self.storage = RTreeSpace(name="example", data={})
+
+        for step in range(600):
+            key = rand.randint(0, 150)
+            if key in expected and rand.random() < 0.3:
+                del expected[key]
+                await self.storage.delete(key)
+            else:
+                expected[key] = random_range(rand)
+                await self.storage.set(key, expected[key])
+
+            if step % 50 != 0:
+                continue
+
+            self.assert_valid_node(self.storage.root)
+
+            query = random_range(rand)
+            got = await self.storage.query(query)
+            self.assertCountEqual(got, [
+                key for key, range in expected.items()
+                if range.top_left.x <= query.bottom_right.x and query.top_left.x <= range.bottom_right.x
+                and range.bottom_right.y <= query.top_left.y and query.bottom_right.y <= range.top_left.y
+            ])
+
+        for key in list(expected):
+            await self.storage.delete(key)
+
+        self.assertEqual(len(self.storage.data), 0)
+        self.assertTrue(self.storage.root.leaf)
+        self.assertEqual(self.storage.root.children, [])
@@ -0,0 +1,14 @@
+from unittest import TestCase
+
+from handler.storage.spatial.rtree import RTreeStorage
+from handler.storage.interface.test.storage_test import Storage_TestCase
+
+
+class RTreeStorage_TestCase(Storage_TestCase, TestCase):
+    def setUp(self):
+        super().setUp()
+        RTreeStorage.spaces = self.init_data
+        self.storage = RTreeStorage
+
+    def tearDown(self):
+        RTreeStorage.spaces = {}
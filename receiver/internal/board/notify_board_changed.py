@@ -1,30 +1,97 @@
 from event.broker import EventBroker
-from handler.board import BoardEvent
+from handler.board import BoardEvent, BoardHandler
 from data.conn.event import ServerEvent
 from handler.cursor import CursorHandler
 from handler.conn import ConnectionHandler
 from event.message import Message
-from event.payload import IdDataPayload
-from data.board import PointRange, Tiles
+from event.payload import IdPayload
+from data.board import PointRange, merge_ranges
+
+import asyncio
+import logging
+
+# 변경 사항을 모아 보내는 주기
+TICK_SECONDS = 0.02
+# 합칠 때 추가로 보내도 되는 타일 비율
+MAX_WASTE = 0.25
+
+logger = logging.getLogger(__name__)
 
 
 class NotifyBoardChangedReceiver:
     @EventBroker.add_receiver(BoardEvent.UPDATE)
     @staticmethod
-    async def r(msg: Message[IdDataPayload[PointRange, Tiles]]):
+    async def r(msg: Message[IdPayload[PointRange]]):
         range = msg.payload.id
-        tiles = msg.payload.data
 
-        watching_cursor_list = await CursorHandler.get_by_watching_range(range)
-        watching_cursor_id_list = [cursor.id for cursor in watching_cursor_list]
+        BoardUpdateCoalescer.add(range)
+
+
+class BoardUpdateCoalescer:
+    """
+    한 tick 동안 바뀐 영역을 모아 합친 뒤,
+    보고 있는 커서마다 해당 영역들을 담은 TilesState를 한 번만 보낸다.
+    """
+    ranges: list[PointRange] = []
+
+    _flusher: asyncio.Task | None = None
+
+    @classmethod
+    def add(cls, range: PointRange):
+        cls.ranges.append(range)
+
+        flusher = cls._flusher
+        if flusher is not None and not flusher.done():
+            return
+
+        cls._flusher = asyncio.get_running_loop().create_task(cls._flush_next_tick())
+
+    @classmethod
+    async def _flush_next_tick(cls):
+        # flush 도중 add된 영역은 flusher가 살아 있어 새로 예약되지 않으므로 여기서 마저 보냄
+        while len(cls.ranges) > 0:
+            await asyncio.sleep(TICK_SECONDS)
+            try:
+                await cls.flush()
+            except Exception:
+                logger.exception("failed to flush board updates")
+
+    @classmethod
+    async def flush(cls):
+        ranges, cls.ranges = cls.ranges, []
+        if len(ranges) == 0:
+            return
+
+        ranges = merge_ranges(ranges, max_waste=MAX_WASTE)
+
+        # 커서 id -> 보고 있는 영역 index
+        watching: dict[str, list[int]] = {}
+        for idx, range in enumerate(ranges):
+            cursors = await CursorHandler.get_by_watching_range(range)
+            for cursor in cursors:
+                watching.setdefault(cursor.id, []).append(idx)
+
+        if len(watching) == 0:
+            return
+
+        # 보는 커서가 있는 영역만 fetch
+        elems: dict[int, ServerEvent.TilesState.Elem] = {}
+        for idx in sorted({idx for idxs in watching.values() for idx in idxs}):
+            tiles = await BoardHandler.fetch(ranges[idx])
+            tiles.hide_info()
+
+            elems[idx] = ServerEvent.TilesState.Elem(
+                range=ranges[idx],
+                data=tiles.to_str()
+            )
 
-        external_event = ServerEvent.TilesState(
-            tiles=[
-                ServerEvent.TilesState.Elem(
-                    range=range,
-                    data=tiles.to_str()
-                )
-            ]
-        )
+        # 같은 영역 묶음을 보는 커서들은 한 번에 multicast
+        groups: dict[tuple[int, ...], list[str]] = {}
+        for id, idxs in watching.items():
+            groups.setdefault(tuple(idxs), []).append(id)
 
-        await ConnectionHandler.multicast(watching_cursor_id_list, external_event)
+        for idxs, ids in groups.items():
+            event = ServerEvent.TilesState(
+                tiles=[elems[idx] for idx in idxs]
+            )
+            await ConnectionHandler.multicast(ids, event)
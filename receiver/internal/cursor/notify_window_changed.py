@@ -3,7 +3,7 @@ from event.message import Message
 from event.payload import IdDataPayload
 
 from data.cursor import Cursor
-from data.board import Tiles, PointRange
+from data.board import Tiles, PointRange, subtract_range
 from data.conn.event import ServerEvent
 
 from handler.cursor import CursorEvent, CursorHandler, CursorException
@@ -27,10 +27,16 @@ class NotifyWindowChangedReceiver():
         if is_omittable(old_cur, new_cur):
             return
 
-        view_range = new_cur.view_range
-        tiles = await fetch_delta_tiles(view_range)
+        if old_cur.width == 0 or old_cur.height == 0:
+            # 처음 창 크기를 정한 경우. 이전 시야는 보낸 적이 없으므로 전부 보냄
+            ranges = [new_cur.view_range]
+        else:
+            # 이전 시야에 없던 부분만 보냄
+            ranges = subtract_range(new_cur.view_range, old_cur.view_range)
+        if len(ranges) > 0:
+            tiles_list = await fetch_delta_tiles(ranges)
 
-        await multicast_tiles_state_event(target_conns=[new_cur], range=view_range, tiles_list=[tiles])
+            await multicast_tiles_state_event(target_conns=[new_cur], ranges=ranges, tiles_list=tiles_list)
 
         new_targets = await get_new_targets(old_cur, new_cur)
 
@@ -82,20 +88,23 @@ def filter_new_targets(old_targets: Cursor.Targets, new_targets: list[Cursor]) -
     return list(filter(func, new_targets))
 
 
-# TODO: 바뀐 부분만 fetch 할 수 있도록 인터페이스 변경.
-async def fetch_delta_tiles(range: PointRange) -> Tiles:
-    tiles = await BoardHandler.fetch(range)
+async def fetch_delta_tiles(ranges: list[PointRange]) -> list[Tiles]:
+    tiles_list = []
+    for range in ranges:
+        tiles = await BoardHandler.fetch(range)
+        tiles.hide_info()
 
-    return tiles
+        tiles_list.append(tiles)
 
+    return tiles_list
 
-# TODO: tiles가 position 정보를 가져야 함.
-async def multicast_tiles_state_event(target_conns: list[Cursor], range: PointRange, tiles_list: list[Tiles]):
+
+async def multicast_tiles_state_event(target_conns: list[Cursor], ranges: list[PointRange], tiles_list: list[Tiles]):
     elems = [
         ServerEvent.TilesState.Elem(
             range=range,
             data=tiles.to_str()
-        ) for tiles in tiles_list
+        ) for range, tiles in zip(ranges, tiles_list)
     ]
 
     event = ServerEvent.TilesState(tiles=elems)
@@ -5,11 +5,11 @@ from event.payload import IdDataPayload
 from data.conn.event import ServerEvent, ClientEvent
 
 from handler.cursor import CursorHandler
-from handler.conn import ConnectionEvent, ConnectionHandler
+from handler.conn import ConnectionHandler
 
 
 class ChatExternalReceiver():
-    @EventBroker.add_receiver(ConnectionEvent.CHAT)
+    @EventBroker.add_receiver(ClientEvent.Chat.event_name)
     @staticmethod
     async def chat(msg: Message[IdDataPayload[str, ClientEvent.Chat]]):
         cur_id = msg.payload.id
@@ -5,14 +5,13 @@ from event.payload import IdDataPayload
 from data.conn.event import ClientEvent
 
 from handler.cursor import CursorHandler
-from handler.conn import ConnectionEvent
 from handler.score import ScoreHandler
 
 from utils.config import Config
 
 
 class MoveExternalReceiver():
-    @EventBroker.add_receiver(ConnectionEvent.MOVE)
+    @EventBroker.add_receiver(ClientEvent.Move.event_name)
     @staticmethod
     async def move(msg: Message[IdDataPayload[str, ClientEvent.Move]]):
         cur_id = msg.payload.id
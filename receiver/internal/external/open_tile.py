@@ -9,14 +9,14 @@ from data.conn.event import ServerEvent, ClientEvent
 
 from handler.cursor import CursorHandler
 from handler.board import BoardEvent, BoardHandler
-from handler.conn import ConnectionEvent, ConnectionHandler
+from handler.conn import ConnectionHandler
 from handler.score import ScoreHandler
 
 from utils.config import Config
 
 
 class OpenTileExternalReceiver():
-    @EventBroker.add_receiver(ConnectionEvent.OPEN_TILE)
+    @EventBroker.add_receiver(ClientEvent.OpenTile.event_name)
     @staticmethod
     async def open_tile(msg: Message[IdDataPayload[str, ClientEvent.OpenTile]]):
         cur_id = msg.payload.id
@@ -7,7 +7,6 @@ from data.conn.event import ClientEvent
 
 from handler.cursor import CursorHandler, CursorEvent
 from handler.board import BoardHandler
-from handler.conn import ConnectionEvent
 
 
 def get_interaction_range(point: Point):
@@ -28,7 +27,7 @@ def is_interactable_board(tiles: Tiles):
 
 
 class PointingExternalReceiver():
-    @EventBroker.add_receiver(ConnectionEvent.POINTING)
+    @EventBroker.add_receiver(ClientEvent.Pointing.event_name)
     @staticmethod
     async def pointing(msg: Message[IdDataPayload[str, ClientEvent.Pointing]]):
         cur_id = msg.payload.id
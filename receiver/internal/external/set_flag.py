@@ -9,14 +9,14 @@ from data.conn.event import ServerEvent, ClientEvent
 
 from handler.cursor import CursorHandler
 from handler.board import BoardHandler
-from handler.conn import ConnectionEvent, ConnectionHandler
+from handler.conn import ConnectionHandler
 from handler.score import ScoreHandler
 
 from utils.config import Config
 
 
 class SetFlagExternalReceiver():
-    @EventBroker.add_receiver(ConnectionEvent.SET_FLAG)
+    @EventBroker.add_receiver(ClientEvent.SetFlag.event_name)
     @staticmethod
     async def set_flag(msg: Message[IdDataPayload[str, ClientEvent.SetFlag]]):
         cur_id = msg.payload.id
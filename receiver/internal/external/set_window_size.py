@@ -9,14 +9,14 @@ from data.conn.event import ServerEvent, ClientEvent
 
 from handler.cursor import CursorHandler
 from handler.board import BoardEvent, BoardHandler
-from handler.conn import ConnectionEvent, ConnectionHandler
+from handler.conn import ConnectionHandler
 from handler.score import ScoreHandler
 
 from utils.config import Config
 
 
 class SetWindowSizeExternalReceiver():
-    @EventBroker.add_receiver(ConnectionEvent.SET_WINDOW_SIZE)
+    @EventBroker.add_receiver(ClientEvent.SetWindowSize.event_name)
     @staticmethod
     async def set_window_size(msg: Message[IdDataPayload[str, ClientEvent.SetWindowSize]]):
         cur_id = msg.payload.id
@@ -9,3 +9,4 @@ from .cursor.notify_my_cursor_test import *
 from .cursor.death_test import *
 from .cursor.notify_window_changed_test import *
 from .cursor.cursor_delete_test import *
+from .board.notify_board_changed_test import *
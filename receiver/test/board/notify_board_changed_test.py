@@ -0,0 +1,148 @@
+from data.board import Point, PointRange, Tiles
+from data.conn.event import ServerEvent
+from data.cursor import Cursor
+
+from unittest import IsolatedAsyncioTestCase as AsyncTestCase
+from unittest.mock import AsyncMock
+from tests.utils import PathPatch
+
+from receiver.internal.board.notify_board_changed import BoardUpdateCoalescer
+
+import asyncio
+
+MOCK_PATH = "receiver.internal.board.notify_board_changed"
+patch = PathPatch(MOCK_PATH)
+
+CUR_A = Cursor.create("A")
+CUR_B = Cursor.create("B")
+
+NEAR = [PointRange(Point(x, 0), Point(x, 0)) for x in range(3)]
+FAR = PointRange(Point(20, 0), Point(20, 0))
+
+
+async def get_by_watching_range_stub(range: PointRange) -> list[Cursor]:
+    # A는 가까운 영역만, B는 모든 영역을 봄
+    if range.top_left.x < 10:
+        return [CUR_A, CUR_B]
+    return [CUR_B]
+
+
+async def fetch_stub(range: PointRange) -> Tiles:
+    return Tiles(bytearray(range.width * range.height), range.width, range.height)
+
+
+def get_elem(range: PointRange):
+    return ServerEvent.TilesState.Elem(
+        range=range,
+        data="00" * (range.width * range.height)
+    )
+
+
+class BoardUpdateCoalescer_TestCase(AsyncTestCase):
+    def setUp(self):
+        BoardUpdateCoalescer.ranges = []
+
+    @patch("ConnectionHandler.multicast")
+    @patch("BoardHandler.fetch", side_effect=fetch_stub)
+    @patch("CursorHandler.get_by_watching_range", side_effect=get_by_watching_range_stub)
+    async def test_flush_merge(self, get_by_watching_range: AsyncMock, fetch: AsyncMock, multicast: AsyncMock):
+        for range in NEAR:
+            BoardUpdateCoalescer.add(range)
+        BoardUpdateCoalescer.add(FAR)
+
+        await BoardUpdateCoalescer.flush()
+
+        merged = PointRange(Point(0, 0), Point(2, 0))
+
+        # 합쳐진 영역, 떨어진 영역 한 번씩만 조회
+        self.assertEqual(get_by_watching_range.await_count, 2)
+        self.assertEqual(fetch.await_count, 2)
+
+        # 커서마다 메시지 하나
+        self.assertEqual(multicast.await_count, 2)
+        multicast.assert_any_await(
+            ["A"], ServerEvent.TilesState(tiles=[get_elem(merged)])
+        )
+        multicast.assert_any_await(
+            ["B"], ServerEvent.TilesState(tiles=[get_elem(merged), get_elem(FAR)])
+        )
+
+    @patch("ConnectionHandler.multicast")
+    @patch("BoardHandler.fetch", side_effect=fetch_stub)
+    @patch("CursorHandler.get_by_watching_range", return_value=[])
+    async def test_flush_no_watcher(self, get_by_watching_range: AsyncMock, fetch: AsyncMock, multicast: AsyncMock):
+        BoardUpdateCoalescer.add(FAR)
+
+        await BoardUpdateCoalescer.flush()
+
+        fetch.assert_not_awaited()
+        multicast.assert_not_awaited()
+
+    @patch("TICK_SECONDS", 0)
+    @patch("ConnectionHandler.multicast")
+    @patch("BoardHandler.fetch", side_effect=fetch_stub)
+    @patch("CursorHandler.get_by_watching_range", side_effect=get_by_watching_range_stub)
+    async def test_add_flush_next_tick(self, get_by_watching_range: AsyncMock, fetch: AsyncMock, multicast: AsyncMock):
+        for range in NEAR:
+            BoardUpdateCoalescer.add(range)
+
+        multicast.assert_not_awaited()
+
+        await asyncio.sleep(0.01)
+
+        multicast.assert_awaited_once_with(
+            ["A", "B"], ServerEvent.TilesState(tiles=[get_elem(PointRange(Point(0, 0), Point(2, 0)))])
+        )
+        self.assertEqual(BoardUpdateCoalescer.ranges, [])
+
+    @patch("TICK_SECONDS", 0)
+    @patch("ConnectionHandler.multicast")
+    @patch("BoardHandler.fetch", side_effect=fetch_stub)
+    @patch("CursorHandler.get_by_watching_range", side_effect=get_by_watching_range_stub)
+    async def test_add_while_flushing(self, get_by_watching_range: AsyncMock, fetch: AsyncMock, multicast: AsyncMock):
+        release = asyncio.Event()
+
+        async def slow_fetch(range: PointRange) -> Tiles:
+            await release.wait()
+            return await fetch_stub(range)
+
+        fetch.side_effect = slow_fetch
+
+        BoardUpdateCoalescer.add(NEAR[0])
+        await asyncio.sleep(0.01)
+
+        # flush가 fetch에서 기다리는 중에 추가
+        BoardUpdateCoalescer.add(FAR)
+        release.set()
+
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(multicast.await_count, 2)
+        multicast.assert_any_await(["B"], ServerEvent.TilesState(tiles=[get_elem(FAR)]))
+        self.assertEqual(BoardUpdateCoalescer.ranges, [])
+
+    @patch("TICK_SECONDS", 0)
+    @patch("ConnectionHandler.multicast")
+    @patch("BoardHandler.fetch", side_effect=fetch_stub)
+    @patch("CursorHandler.get_by_watching_range", side_effect=get_by_watching_range_stub)
+    async def test_flush_failed(self, get_by_watching_range: AsyncMock, fetch: AsyncMock, multicast: AsyncMock):
+        async def failing_fetch(range: PointRange) -> Tiles:
+            fetch.side_effect = fetch_stub
+            raise Exception("fetch failed")
+
+        fetch.side_effect = failing_fetch
+
+        with self.assertLogs(MOCK_PATH, "ERROR"):
+            BoardUpdateCoalescer.add(NEAR[0])
+            await asyncio.sleep(0.01)
+
+        # 실패한 뒤에도 다음 변경은 보냄
+        BoardUpdateCoalescer.add(FAR)
+        await asyncio.sleep(0.01)
+
+        multicast.assert_awaited_once_with(["B"], ServerEvent.TilesState(tiles=[get_elem(FAR)]))
+
+
+if __name__ == "__main__":
+    from unittest import main
+    main()
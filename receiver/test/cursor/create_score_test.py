@@ -1,8 +1,8 @@
-from data.payload import DataPayload
+from event.payload import IdPayload
 
 from event.message import Message
 
-from receiver import CreateScoreReceiver
+from receiver.internal.cursor.create_score import CreateScoreReceiver
 
 from handler.cursor import CursorEvent
 
@@ -23,9 +23,9 @@ class CreateScoreReceiver_TestCase(AsyncTestCase):
 
         message = Message(
             event=CursorEvent.CREATED,
-            payload=DataPayload(id=cursor.id, data=cursor)
+            payload=IdPayload(id=cursor.id)
         )
 
-        await CreateScoreReceiver.rcreate_score(message)
+        await CreateScoreReceiver.create_score(message)
 
         create.assert_called_once_with(id=cursor.id)
@@ -1,8 +1,8 @@
-from data.payload import DataPayload
+from event.payload import IdDataPayload
 
 from event.message import Message
 
-from receiver import DeleteCursorReceiver
+from receiver.internal.cursor.cursor_delete import DeleteCursorReceiver
 
 from handler.cursor import CursorEvent
 
@@ -23,7 +23,7 @@ class DeleteCursorReceiver_TestCase(AsyncTestCase):
 
         message = Message(
             event=CursorEvent.DELETE,
-            payload=DataPayload(id=cursor.id, data=cursor)
+            payload=IdDataPayload(id=cursor.id, data=cursor)
         )
 
         await DeleteCursorReceiver.cursor_delete(message)
@@ -1,10 +1,10 @@
-from data.payload import DataPayload
+from event.payload import IdDataPayload
 from data.score import Score
 from datetime import datetime, timedelta
 
 from event.message import Message
 
-from receiver import CursorDeathReceiver
+from receiver.internal.cursor.death import CursorDeathReceiver
 
 from handler.cursor import CursorEvent
 
@@ -32,7 +32,7 @@ class CursorReceiver_TestCase(AsyncTestCase):
 
         message = Message(
             event=CursorEvent.DEATH,
-            payload=DataPayload(id=cursor.id, data=cursor)
+            payload=IdDataPayload(id=cursor.id, data=cursor)
         )
 
         await CursorDeathReceiver.cursor_death(message)
@@ -1,8 +1,8 @@
-from data.payload import DataPayload
+from event.payload import IdPayload
 
 from event.message import Message
 
-from receiver import NotifyMyCursorReceiver
+from receiver.internal.cursor.notify_my_cursor import NotifyMyCursorReceiver
 
 from handler.cursor import CursorEvent
 
@@ -17,17 +17,19 @@ patch = PathPatch(MOCK_PATH)
 
 
 class NotifyMyCursorReceiver_TestCase(AsyncTestCase):
+    @patch("CursorHandler.get")
     @patch("CursorHandler.get_watchers")
     @patch("multicast_cursors_state")
     @patch("multicast_my_cursor")
-    async def test_notify_my_cursor(self, my_cursor: AsyncMock, cursors_state: AsyncMock, get_watchers: AsyncMock):
+    async def test_notify_my_cursor(self, my_cursor: AsyncMock, cursors_state: AsyncMock, get_watchers: AsyncMock, get: AsyncMock):
         (cursor, *watchers) = get_cur_set(3)
 
+        get.return_value = cursor
         get_watchers.return_value = watchers
 
         message = Message(
             event=CursorEvent.CREATED,
-            payload=DataPayload(id=cursor.id, data=cursor)
+            payload=IdPayload(id=cursor.id)
         )
 
         await NotifyMyCursorReceiver.notify_my_cursor(message)
@@ -1,13 +1,13 @@
 from data.board import Point, PointRange, Tile, Tiles
 from data.cursor import Cursor, Color
 from data.conn.event import ServerEvent
-from data.payload import DataPayload
+from event.payload import IdDataPayload
 from data.score import Score
 from data.base.utils import Relation
 
 from event.message import Message
 
-from receiver import NotifyWindowChangedReceiver
+from receiver.internal.cursor.notify_window_changed import NotifyWindowChangedReceiver
 from receiver.internal.cursor.notify_window_changed import (
     is_omittable, multicast_cursor_state_event, multicast_tiles_state_event,
     get_new_targets, fetch_delta_tiles,
@@ -107,35 +107,44 @@ EXAMPLE_TILES = Tiles(bytearray([
     NEW_TILE, OLD_TILE, OLD_TILE, OLD_TILE, NEW_TILE,
     NEW_TILE, OLD_TILE, OLD_TILE, OLD_TILE, NEW_TILE,
     NEW_TILE, NEW_TILE, NEW_TILE, NEW_TILE, NEW_TILE
-]))
+]), 5, 5)
 
 
 class FetchDeltaTiles_TestCase(AsyncTestCase):
-    @patch("BoardHandler.fetch", return_value=EXAMPLE_TILES.copy())
+    @patch("BoardHandler.fetch")
     async def test_normal(self, fetch: AsyncMock):
-        range = PointRange(Point(0, 0), Point(0, 0))
+        fetch.side_effect = lambda range: EXAMPLE_TILES.copy()
+        ranges = [
+            PointRange(Point(0, 4), Point(4, 0)),
+            PointRange(Point(5, 4), Point(9, 0))
+        ]
 
-        tiles = await fetch_delta_tiles(range)
+        tiles_list = await fetch_delta_tiles(ranges)
 
-        self.assertEqual(tiles, EXAMPLE_TILES.copy())
-        fetch.assert_called_once_with(range.top_left, range.bottom_right)
+        expected = EXAMPLE_TILES.copy()
+        expected.hide_info()
+        self.assertEqual(tiles_list, [expected, expected])
+        fetch.assert_has_calls([call(ranges[0]), call(ranges[1])])
 
 
 class MulticastTilesStateEvent_TestCase(AsyncTestCase):
     @patch("multicast")
     async def test_normal(self, multicast: AsyncMock):
         target_conns = get_cur_set(2)
-        range = PointRange(Point(0, 0), Point(0, 0))
+        ranges = [
+            PointRange(Point(0, 4), Point(4, 0)),
+            PointRange(Point(5, 4), Point(9, 0))
+        ]
         tiles = EXAMPLE_TILES.copy()
 
-        await multicast_tiles_state_event(target_conns=target_conns, range=range, tiles_list=[tiles])
+        await multicast_tiles_state_event(target_conns=target_conns, ranges=ranges, tiles_list=[tiles, tiles])
 
         expected_event = ServerEvent.TilesState(
             tiles=[
                 ServerEvent.TilesState.Elem(
                     range=range,
                     data=tiles.to_str()
-                )
+                ) for range in ranges
             ]
         )
 
@@ -145,11 +154,16 @@ class MulticastTilesStateEvent_TestCase(AsyncTestCase):
         )
 
 
+GROWN_CURSOR = CURSOR.copy()
+GROWN_CURSOR.width = 3
+GROWN_CURSOR.height = 2
+
+
 class NotifyWindowChangedReceiver_MockSet(MockSet):
     __path__ = MOCK_PATH
 
     cursor_get: Wp[AsyncMock] = override("CursorHandler.get", return_value=CURSOR.copy())
-    fetch_delta_tiles: Wp[AsyncMock] = override("fetch_delta_tiles", return_value=Tiles(data=bytearray()))
+    fetch_delta_tiles: Wp[AsyncMock] = override("fetch_delta_tiles", return_value=[EXAMPLE_TILES.copy()])
     multicast_tiles_state_event: Wp[AsyncMock] = override("multicast_tiles_state_event")
     multicast_cursor_state_event: Wp[AsyncMock] = override("multicast_cursor_state_event")
     get_new_targets: Wp[AsyncMock] = override("get_new_targets", return_value=[CURSOR2.copy()])
@@ -159,21 +173,93 @@ class NotifyWindowChangedReceiver_TestCase(AsyncTestCase):
     @NotifyWindowChangedReceiver_MockSet.patch()
     async def test_normal(self, mock: NotifyWindowChangedReceiver_MockSet):
         old_cur = CURSOR.copy()
-        old_cur.position = Point(1, 1)
+        old_cur.position = Point(old_cur.position.x - 1, old_cur.position.y)
 
         message = Message(
-            event=CursorEvent.WINDOW_SIZE_SET,
-            payload=DataPayload(id=old_cur.id, data=old_cur)
+            event=CursorEvent.MOVED,
+            payload=IdDataPayload(id=old_cur.id, data=old_cur)
         )
 
         await NotifyWindowChangedReceiver.notify_window_changed(message)
 
+        # 오른쪽으로 한 칸 -> 새 시야의 오른쪽 한 열만
+        view_range = CURSOR.copy().view_range
+        delta = PointRange(
+            Point(view_range.bottom_right.x, view_range.top_left.y),
+            view_range.bottom_right
+        )
+
+        mock.fetch_delta_tiles.assert_called_once_with([delta])
         mock.multicast_tiles_state_event.assert_called_once_with(
             target_conns=[CURSOR.copy()],
-            range=CURSOR.copy().view_range,
-            tiles_list=[Tiles(data=bytearray())]
+            ranges=[delta],
+            tiles_list=[EXAMPLE_TILES.copy()]
         )
         mock.multicast_cursor_state_event.assert_called_once_with(
             target_conns=[CURSOR.copy()],
             cursors=[CURSOR2.copy()]
         )
+
+    @NotifyWindowChangedReceiver_MockSet.patch(
+        override("cursor_get", return_value=GROWN_CURSOR.copy())
+    )
+    async def test_window_grow(self, mock: NotifyWindowChangedReceiver_MockSet):
+        old_cur = CURSOR.copy()
+        old_cur.width = GROWN_CURSOR.width - 1
+        old_cur.height = GROWN_CURSOR.height - 1
+
+        message = Message(
+            event=CursorEvent.WINDOW_SIZE_SET,
+            payload=IdDataPayload(id=old_cur.id, data=old_cur)
+        )
+
+        await NotifyWindowChangedReceiver.notify_window_changed(message)
+
+        # 시야 테두리 4줄
+        ranges = mock.fetch_delta_tiles.call_args.args[0]
+        self.assertEqual(len(ranges), 4)
+        self.assertEqual(
+            sum(r.width * r.height for r in ranges),
+            GROWN_CURSOR.view_range.width * GROWN_CURSOR.view_range.height
+            - old_cur.view_range.width * old_cur.view_range.height
+        )
+
+    @NotifyWindowChangedReceiver_MockSet.patch(
+        override("cursor_get", return_value=GROWN_CURSOR.copy())
+    )
+    async def test_first_window_size(self, mock: NotifyWindowChangedReceiver_MockSet):
+        # Cursor.create 직후의 0x0 창
+        old_cur = CURSOR.copy()
+        old_cur.width = 0
+        old_cur.height = 0
+
+        message = Message(
+            event=CursorEvent.WINDOW_SIZE_SET,
+            payload=IdDataPayload(id=old_cur.id, data=old_cur)
+        )
+
+        await NotifyWindowChangedReceiver.notify_window_changed(message)
+
+        # 새 시야 전체
+        view_range = GROWN_CURSOR.copy().view_range
+        mock.fetch_delta_tiles.assert_called_once_with([view_range])
+        mock.multicast_tiles_state_event.assert_called_once_with(
+            target_conns=[GROWN_CURSOR.copy()],
+            ranges=[view_range],
+            tiles_list=[EXAMPLE_TILES.copy()]
+        )
+
+    @NotifyWindowChangedReceiver_MockSet.patch()
+    async def test_omittable(self, mock: NotifyWindowChangedReceiver_MockSet):
+        old_cur = CURSOR.copy()
+        old_cur.width += 1
+
+        message = Message(
+            event=CursorEvent.WINDOW_SIZE_SET,
+            payload=IdDataPayload(id=old_cur.id, data=old_cur)
+        )
+
+        await NotifyWindowChangedReceiver.notify_window_changed(message)
+
+        mock.fetch_delta_tiles.assert_not_called()
+        mock.multicast_tiles_state_event.assert_not_called()
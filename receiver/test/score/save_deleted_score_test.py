@@ -7,7 +7,7 @@ from data.conn.event import ServerEvent
 from data.cursor import Cursor
 from data.score import Score
 
-from data.payload import DataPayload
+from event.payload import IdDataPayload
 
 from handler.score import ScoreEvent
 
@@ -15,7 +15,9 @@ from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
 from unittest.mock import AsyncMock, MagicMock, call
 from ..test_tools import get_cur_set, assertMulticast
 from tests.utils import PathPatch, cases, override, MockSet, Wrapper as Wp
-from utils.config import SCOREBOARD_SIZE
+from utils.config import Config
+
+SCOREBOARD_SIZE = Config.SCOREBOARD_SIZE
 
 from receiver.internal.score.save_deleted_score import (
     SaveDeletedScoreReceiver
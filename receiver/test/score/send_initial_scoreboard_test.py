@@ -7,7 +7,7 @@ from data.conn.event import ServerEvent
 from data.cursor import Cursor
 from data.score import Score
 
-from data.payload import DataPayload
+from event.payload import IdDataPayload
 
 from handler.score import ScoreEvent
 
@@ -15,7 +15,9 @@ from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
 from unittest.mock import AsyncMock, MagicMock, call
 from ..test_tools import get_cur_set, assertMulticast
 from tests.utils import PathPatch, cases, override, MockSet, Wrapper as Wp
-from utils.config import SCOREBOARD_SIZE
+from utils.config import Config
+
+SCOREBOARD_SIZE = Config.SCOREBOARD_SIZE
 
 from receiver.internal.score.send_initial_scoreboard import (
     SendInitialScoreboardReceiver,
@@ -91,7 +93,7 @@ class SendInitialScoreBoard_TestCase(AsyncTestCase):
     async def test_created(self, mock: SendInitialScoreBoard_MockSet):
         input_message = Message(
             event=ScoreEvent.CREATED,
-            payload=DataPayload(id=None),
+            payload=IdDataPayload(id=None, data=None),
         )
 
         await SendInitialScoreboardReceiver.send_initial_scoreboard(input_message)
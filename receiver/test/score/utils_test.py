@@ -10,7 +10,9 @@ from unittest import TestCase, IsolatedAsyncioTestCase as AsyncTestCase
 from unittest.mock import AsyncMock, MagicMock, call
 from ..test_tools import get_cur_set, assertMulticast
 from tests.utils import PathPatch, cases, override, MockSet, Wrapper as Wp
-from utils.config import SCOREBOARD_SIZE
+from utils.config import Config
+
+SCOREBOARD_SIZE = Config.SCOREBOARD_SIZE
 
 from receiver.internal.score.utils import (
     multicast_scoreboard_state,
@@ -1,8 +1,4 @@
-from event.message import Message
-from data.cursor import Cursor
-from data.board import Point, Tiles
-from data.score import Score
-from data.payload import DataPayload
+from data.conn.event import ServerEvent
 
 from receiver.internal.utils import (
     multicast, broadcast
@@ -15,42 +11,28 @@ from tests.utils import PathPatch
 
 patch = PathPatch("receiver.internal.utils")
 
+EVENT = ServerEvent.Error(msg="example")
+
 
 class Multicast_TestCase(AsyncTestCase):
-    async def test_normal(self):
-        # TODO: 다시짜기
-        pass
-        # target_conns = ["a", "b", "c"]
-        # message = Message(
-        #     event="example_event",
-        #     payload="example_payload"
-        # )
-
-        # await multicast(target_conns=target_conns, message=message)
-
-        # publish_mock.assert_called_once()
-        # got: Message = publish_mock.mock_calls[0].kwargs["message"]
-        # self.assertEqual(
-        #     got,
-        #     Message(
-        #         event="multicast",
-        #         header={
-        #             "target_conns": target_conns,
-        #             "origin_event": message.event
-        #         },
-        #         payload=message.payload
-        #     )
-        # )
-
-    async def test_no_target_conns(self):
-        # TODO: 다시짜기
-        pass
-        # target_conns = []
-        # message = Message(
-        #     event="example_event",
-        #     payload="example_payload"
-        # )
-
-        # await multicast(target_conns=target_conns, message=message)
-
-        # publish_mock.assert_not_called()
+    @patch("ConnectionHandler.multicast")
+    async def test_normal(self, multicast_mock: AsyncMock):
+        target_conns = ["a", "b", "c"]
+
+        await multicast(target_conns=target_conns, event=EVENT)
+
+        multicast_mock.assert_awaited_once_with(target_conns, EVENT)
+
+    @patch("ConnectionHandler.multicast")
+    async def test_no_target_conns(self, multicast_mock: AsyncMock):
+        await multicast(target_conns=[], event=EVENT)
+
+        multicast_mock.assert_not_awaited()
+
+
+class Broadcast_TestCase(AsyncTestCase):
+    @patch("ConnectionHandler.broadcast")
+    async def test_normal(self, broadcast_mock: AsyncMock):
+        await broadcast(event=EVENT)
+
+        broadcast_mock.assert_awaited_once_with(EVENT)
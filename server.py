@@ -1,8 +1,32 @@
 from fastapi import FastAPI, WebSocket, Response, WebSocketDisconnect
 from websockets.exceptions import ConnectionClosed
+from contextlib import asynccontextmanager
 from handler.conn import ConnectionHandler, Conn
-
-app = FastAPI()
+from db import DBPool
+from event.broker import EventRecorder
+from handler.board import Config as BoardConfig
+from handler.board.storage import SectionCache, MmapSectionStorage
+from utils.config import Config
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await DBPool.open()
+    if Config.BOARD_FILE_PATH is not None:
+        SectionCache.storage = MmapSectionStorage(Config.BOARD_FILE_PATH)
+    BoardConfig.SEED = Config.WORLD_SEED
+    yield
+    await EventRecorder.stop()
+    await SectionCache.stop()
+    if isinstance(SectionCache.storage, MmapSectionStorage):
+        # 남은 page를 msync 하고 파일을 닫음
+        await SectionCache.storage.stop()
+        SectionCache.clear()
+        SectionCache.storage.close()
+    await DBPool.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.websocket("/session")
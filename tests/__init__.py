@@ -2,11 +2,13 @@ if __name__ == "__main__":
     import unittest
 
     from .utils_test import *
+    from .db_test import *
 
     # message
     from event.payload.test import *
 
     # event
+    from core.event.broker.test import *
     from event.broker.test import *
     from event.message.test import *
     from event.payload.test import *
@@ -19,14 +21,17 @@ if __name__ == "__main__":
     from data.cursor.test import *
 
     # handler
-    # from handler.board.test import *
-    # from handler.board.storage.test import *
+    from handler.board.test import *
+    from handler.board.storage.test import *
     from handler.cursor.test import *
-    # from handler.conn.test import *
+    from handler.conn.test import *
     from handler.score.test import *
 
     from handler.storage.dict.test import *
     from handler.storage.list.array.test import *
+    from handler.storage.spatial.grid.test import *
+    from handler.storage.spatial.rtree.test import *
+    from handler.storage.sorted.skiplist.test import *
 
     # receiver
     from receiver.test import *
@@ -0,0 +1,116 @@
+from unittest import IsolatedAsyncioTestCase as AsyncTestCase
+from unittest.mock import patch, AsyncMock, MagicMock
+import asyncio
+
+from db import DBPool, use_db
+from .test_utils import create_test_temp_file, cleanup_test_temp_file
+
+
+async def slow_get_db():
+    await asyncio.sleep(0.01)
+    return MagicMock()
+
+
+class DBPool_TestCase(AsyncTestCase):
+    async def asyncSetUp(self):
+        self.path = create_test_temp_file()
+        self.patcher = patch("db.Config")
+        config = self.patcher.start()
+        config.DATABASE_PATH = self.path
+
+        await DBPool.close()
+        self.size = DBPool.size
+        DBPool.size = 2
+
+    async def asyncTearDown(self):
+        await DBPool.close()
+        DBPool.size = self.size
+
+        self.patcher.stop()
+        cleanup_test_temp_file(self.path)
+        cleanup_test_temp_file(self.path + "-wal")
+        cleanup_test_temp_file(self.path + "-shm")
+
+    async def test_use_db_reuse(self):
+        @use_db
+        async def func(db):
+            return db
+
+        first = await func()
+        second = await func()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(DBPool.opened), 1)
+
+    async def test_wal(self):
+        @use_db
+        async def func(db):
+            cur = await db.execute("PRAGMA journal_mode")
+            return await cur.fetchone()
+
+        row = await func()
+        self.assertEqual(row[0], "wal")
+
+    async def test_acquire_wait(self):
+        a = await DBPool.acquire()
+        b = await DBPool.acquire()
+        self.assertIsNot(a, b)
+
+        waiting = asyncio.create_task(DBPool.acquire())
+        await asyncio.sleep(0)
+        self.assertFalse(waiting.done())
+
+        DBPool.release(a)
+        self.assertIs(await waiting, a)
+
+        DBPool.release(a)
+        DBPool.release(b)
+        self.assertEqual(len(DBPool.idle), 2)
+
+    async def test_acquire_concurrent_open(self):
+        get_db = AsyncMock(side_effect=slow_get_db)
+
+        with patch("db.get_db", get_db):
+            tasks = [asyncio.create_task(DBPool.acquire()) for _ in range(3)]
+            await asyncio.sleep(0.02)
+
+            # 여는 중인 connection도 size에 포함
+            self.assertEqual(get_db.await_count, 2)
+            self.assertEqual(len(DBPool.opened), 2)
+            self.assertEqual(sum(task.done() for task in tasks), 2)
+
+            DBPool.release(await tasks[0])
+            self.assertIs(await tasks[2], await tasks[0])
+
+        # mock connection은 close 할 수 없으므로 pool에서 뺌
+        DBPool.opened, DBPool.idle = [], []
+
+    async def test_acquire_cancel_after_release(self):
+        a = await DBPool.acquire()
+        b = await DBPool.acquire()
+
+        waiting = asyncio.create_task(DBPool.acquire())
+        await asyncio.sleep(0)
+
+        # connection을 넘겨받은 뒤 깨어나기 전에 취소됨
+        DBPool.release(a)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+
+        self.assertEqual(DBPool.idle, [a])
+
+        DBPool.release(b)
+        self.assertEqual(len(DBPool.idle), 2)
+
+    async def test_close(self):
+        await DBPool.open()
+        opened = list(DBPool.opened)
+        self.assertEqual(len(opened), 2)
+
+        await DBPool.close()
+
+        self.assertEqual(DBPool.opened, [])
+        self.assertEqual(DBPool.idle, [])
+        for db in opened:
+            self.assertFalse(db._running)
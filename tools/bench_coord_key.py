@@ -0,0 +1,38 @@
+"""
+section map 조회: Point key와 정수 key(encode_key) 비교.
+(x, y) 좌표만 있을 때 Point를 만들어 찾는 경우와 정수 key를 만들어 찾는 경우의 시간을 잰다.
+
+PYTHONPATH=. python tools/bench_coord_key.py
+"""
+from data.board import Point, encode_key, decode_key
+
+from timeit import timeit
+
+SIZE = 32
+NUMBER = 200_000
+
+
+def measure_time():
+    by_point = {Point(x, y): None for x in range(-SIZE, SIZE) for y in range(-SIZE, SIZE)}
+    by_tuple = {(x, y): None for x in range(-SIZE, SIZE) for y in range(-SIZE, SIZE)}
+    by_key = {encode_key(x, y): None for x in range(-SIZE, SIZE) for y in range(-SIZE, SIZE)}
+
+    x, y = 5, -7
+    key = encode_key(x, y)
+
+    cases = {
+        "dict[Point]": lambda: Point(x, y) in by_point,
+        "dict[tuple]": lambda: (x, y) in by_tuple,
+        "dict[key]": lambda: encode_key(x, y) in by_key,
+        "dict[key] (hit)": lambda: key in by_key,
+        "encode_key()": lambda: encode_key(x, y),
+        "decode_key()": lambda: decode_key(key),
+    }
+
+    for case, func in cases.items():
+        nsec = timeit(func, number=NUMBER) / NUMBER * 1_000_000_000
+        print(f"{case:>16}: {nsec:>7.0f} ns")
+
+
+if __name__ == "__main__":
+    measure_time()
@@ -0,0 +1,62 @@
+"""
+Point, PointRange, Tile, Cursor 메모리와 생성 시간.
+커서 10k개(position, pointer 포함)를 만들 때의 메모리와
+객체별 생성, Point dict 조회 시간을 잰다.
+
+PYTHONPATH=. python tools/bench_data_layout.py
+"""
+from data.board import Point, PointRange, Tile
+from data.cursor import Cursor, Color
+
+from timeit import timeit
+import tracemalloc
+
+CURSORS = 10_000
+NUMBER = 200_000
+
+
+def make_cursors() -> list[Cursor]:
+    cursors = []
+    for i in range(CURSORS):
+        cursor = Cursor.create(str(i))
+        cursor.position = Point(i, -i)
+        cursor.pointer = Point(i + 1, -i)
+        cursors.append(cursor)
+    return cursors
+
+
+def measure_memory():
+    # 생성 함수 컴파일 등 첫 호출 비용 제외
+    make_cursors()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    cursors = make_cursors()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"{len(cursors)} cursors: {size / 1024:.1f} KiB ({size / len(cursors):.0f} B/cursor)")
+
+
+def measure_time():
+    p = Point(1, 2)
+    points = {Point(x, y): None for x in range(10) for y in range(10)}
+
+    cases = {
+        "Point()": lambda: Point(1, 2),
+        "PointRange()": lambda: PointRange(p, p),
+        "Tile()": lambda: Tile(True, False, False, None, 1),
+        "Cursor.create()": lambda: Cursor.create("A"),
+        "Point.copy()": lambda: p.copy(),
+        "dict[Point]": lambda: Point(5, 5) in points,
+    }
+
+    for case, func in cases.items():
+        nsec = timeit(func, number=NUMBER) / NUMBER * 1_000_000_000
+        print(f"{case:>16}: {nsec:>7.0f} ns")
+
+
+if __name__ == "__main__":
+    measure_memory()
+    measure_time()
@@ -0,0 +1,69 @@
+"""
+DataObj copy, to_dict 비교.
+__dataclass_fields__를 순회하던 기존 방식과 클래스별로 생성된 함수의 호출 시간을 잰다.
+
+PYTHONPATH=. python tools/bench_data_obj.py
+"""
+from data.base import DataObj
+from data.board import Point, PointRange, Tiles
+from data.cursor import Cursor
+
+from timeit import timeit
+
+NUMBER = 100_000
+
+
+def reflective_copy(obj):
+    return obj.__class__(
+        **{
+            key: reflective_copy_item(obj.__dict__[key])
+            for key in obj.__dataclass_fields__
+        }
+    )
+
+
+def reflective_copy_item(item):
+    if hasattr(item, "copy"):
+        if isinstance(item, DataObj):
+            return reflective_copy(item)
+        return item.copy()
+    return item
+
+
+def reflective_to_dict(obj):
+    def __item_parsing(item):
+        if issubclass(type(item), DataObj):
+            return reflective_to_dict(item)
+        return item
+
+    return {
+        key: __item_parsing(obj.__dict__[key])
+        for key in obj.__dataclass_fields__
+    }
+
+
+def bench(name: str, obj: DataObj):
+    assert reflective_copy(obj) == obj.copy()
+    assert reflective_to_dict(obj) == obj.to_dict()
+
+    cases = {
+        "copy(reflective)": lambda: reflective_copy(obj),
+        "copy(generated)": obj.copy,
+        "to_dict(reflective)": lambda: reflective_to_dict(obj),
+        "to_dict(generated)": obj.to_dict,
+    }
+
+    print(name)
+    for case, func in cases.items():
+        usec = timeit(func, number=NUMBER) / NUMBER * 1_000_000
+        print(f"  {case:>20}: {usec:>6.2f} us")
+
+
+if __name__ == "__main__":
+    cursor = Cursor.create("A")
+    cursor.pointer = Point(1, 1)
+
+    bench("Point", Point(1, 2))
+    bench("PointRange", PointRange(Point(0, 1), Point(1, 0)))
+    bench("Tiles(100x100)", Tiles(bytearray(10000), 100, 100))
+    bench("Cursor", cursor)
@@ -0,0 +1,62 @@
+"""
+DictSpace 조회 시 할당 비교.
+복사 모드와 공유(shared) 모드에서 커서 N개, 점수 N개를 조회해 들고 있을 때
+새로 할당된 메모리 블록 수와 크기를 tracemalloc으로 잰다.
+
+PYTHONPATH=. python tools/bench_storage_alloc.py
+"""
+from data.board import Point
+from data.cursor import Cursor
+from data.score import Score
+from handler.storage.dict import DictSpace
+
+import asyncio
+import tracemalloc
+
+N = 1000
+
+
+def make_space(shared: bool, values: dict) -> DictSpace:
+    return DictSpace(name="bench", data=values, shared=shared)
+
+
+async def read_all(space: DictSpace) -> list:
+    return [await space.get(key) for key in await space.keys()]
+
+
+async def measure(name: str, values: dict):
+    for shared in (False, True):
+        space = make_space(shared, values)
+        # 생성된 copy 함수 컴파일 등 첫 호출 비용 제외
+        await read_all(space)
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        result = await read_all(space)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        stats = after.compare_to(before, "filename")
+        blocks = sum(stat.count_diff for stat in stats)
+        size = sum(stat.size_diff for stat in stats)
+
+        mode = "shared" if shared else "copy"
+        print(f"{name:>8} {mode:>6}: {blocks:>7} blocks {size / 1024:>9.1f} KiB ({len(result)} values)")
+
+
+async def main():
+    cursors = {}
+    scores = {}
+    for i in range(N):
+        cursor = Cursor.create(str(i))
+        cursor.position = Point(i, -i)
+        cursor.pointer = Point(i, i)
+        cursors[cursor.id] = cursor
+        scores[cursor.id] = Score(cursor.id, i)
+
+    await measure("Cursor", cursors)
+    await measure("Score", scores)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""
+TilesState 타일 인코딩 비교.
+section 크기의 보드를 열린 비율별로 만들어 hide_info 후
+hex(JSON), raw(binary), RLE, RLE + zlib의 크기와 인코딩 시간을 잰다.
+
+PYTHONPATH=. python tools/bench_tile_encoding.py
+"""
+from data.board import Tiles, rle_encode, rle_decode
+
+from timeit import timeit
+import random
+import zlib
+
+LENGTH = 100
+MINE_RATIO = 0.3
+REPEAT = 200
+
+OPEN_BIT = 0b10000000
+MINE_BIT = 0b01000000
+FLAG_BIT = 0b00100000
+
+
+def make_tiles(rng: random.Random, open_ratio: float) -> Tiles:
+    """
+    지뢰를 뿌린 뒤, 지뢰가 아닌 타일 중 열린 비율이 open_ratio가 될 때까지 사각형 영역들을 연다.
+    열린 영역 주변의 일부 지뢰에는 깃발을 꽂는다.
+    """
+    mines = bytearray(MINE_BIT if rng.random() < MINE_RATIO else 0 for _ in range(LENGTH * LENGTH))
+    tiles = Tiles(mines, LENGTH, LENGTH)
+    numbers = tiles.neighbor_mines()
+
+    data = bytearray(m | min(n, 7) for m, n in zip(mines, numbers))
+
+    target = int(mines.count(0) * open_ratio)
+    opened = 0
+    while opened < target:
+        w, h = rng.randint(5, 30), rng.randint(5, 30)
+        x, y = rng.randrange(LENGTH - w), rng.randrange(LENGTH - h)
+        for row in range(y, y + h):
+            for idx in range(row * LENGTH + x, row * LENGTH + x + w):
+                b = data[idx]
+                if b & (OPEN_BIT | FLAG_BIT):
+                    continue
+                if b & MINE_BIT:
+                    if rng.random() < 0.5:
+                        data[idx] = b | FLAG_BIT
+                    continue
+                data[idx] = b | OPEN_BIT
+                opened += 1
+
+    tiles = Tiles(data, LENGTH, LENGTH)
+    tiles.hide_info()
+    return tiles
+
+
+def bench(name: str, open_ratio: float):
+    data = bytes(make_tiles(random.Random(0), open_ratio).data)
+    rle = rle_encode(data)
+    assert rle_decode(rle) == data
+
+    encoders = {
+        "hex": lambda: data.hex(),
+        "raw": lambda: bytes(data),
+        "rle": lambda: rle_encode(data),
+        "rle+zlib": lambda: zlib.compress(rle_encode(data)),
+    }
+
+    print(f"{name} (open {open_ratio:.0%} of safe tiles)")
+    for encoding, encode in encoders.items():
+        size = len(encode())
+        usec = timeit(encode, number=REPEAT) / REPEAT * 1_000_000
+        print(f"  {encoding:>9}: {size:>6} bytes {usec:>9.1f} us")
+
+
+if __name__ == "__main__":
+    bench("new section", 0.0)
+    bench("early game", 0.1)
+    bench("mid game", 0.4)
+    bench("late game", 0.9)
@@ -4,11 +4,16 @@ from typing import Callable, TypeVar, Generic
 T = TypeVar("T")
 
 class Env(Generic[T]):
-    def __init__(self, func: Callable[[str], T] | None = None) -> None:
+    def __init__(self, func: Callable[[str], T] | None = None, optional: bool = False) -> None:
         self.func = func
+        # optional이면 비어있을 때 None
+        self.optional = optional
 
     def __set_name__(self, owner, name):
         res = os.environ.get(name)
+        if not res and self.optional:
+            self.value = None
+            return
         assert res
 
         if self.func:
@@ -9,6 +9,10 @@ class Config:
     MINE_KILL_DURATION_SECONDS = Env[timedelta](lambda s: timedelta(seconds=int(s)))
 
     DATABASE_PATH = Env[str]()
+    # 설정하면 sections table 대신 이 mmap board file에 section을 저장
+    BOARD_FILE_PATH = Env[str | None](optional=True)
+    # 설정하면 저장되지 않은 section을 이 seed로 생성 (handler.board Config.SEED)
+    WORLD_SEED = Env[int | None](int, optional=True)
     WINDOW_SIZE_LIMIT = Env[int](int)
 
     MESSAGE_RATE_LIMIT = Env[str]()